@@ -1,3 +1,5 @@
+import importlib
+
 from app_funcs.init_app import __init__ as init_app
 from app_funcs.setup_page import setup_page
 from app_funcs.setup_ui import setup_ui
@@ -9,6 +11,7 @@ from app_funcs.build_settings_view import build_settings_view
 from app_funcs.refresh_profiles import refresh_profiles
 from app_funcs.refresh_proxies import refresh_proxies
 from app_funcs.refresh_current_view import refresh_current_view
+from app_funcs.on_backend_change import on_backend_change
 from app_funcs.open_dialog import open_dialog
 from app_funcs.parse_open_tabs import parse_open_tabs
 from app_funcs.validate_open_tabs import validate_open_tabs
@@ -17,22 +20,55 @@ from app_funcs.close_dialog import close_dialog
 from app_funcs.run_ui import run_ui
 from app_funcs.toggle_proxy_selection import toggle_proxy_selection
 from app_funcs.toggle_select_all_proxies import toggle_select_all_proxies
-from app_funcs.check_selected_proxies import check_selected_proxies
-from app_funcs.show_create_profile_dialog import show_create_profile_dialog
-from app_funcs.show_edit_profile_dialog import show_edit_profile_dialog
-from app_funcs.show_create_proxy_dialog import show_create_proxy_dialog
-from app_funcs.show_edit_proxy_dialog import show_edit_proxy_dialog
 from app_funcs.toggle_profile import toggle_profile
 from app_funcs.delete_profile import delete_profile
 from app_funcs.delete_proxy import delete_proxy
-from app_funcs.check_proxy import check_proxy
-from app_funcs.check_proxy_with_playwright import check_proxy_with_playwright
-from app_funcs.check_all_proxies import check_all_proxies
+from app_funcs.apply_proxy_status import apply_proxy_status
+from app_funcs.drain_proxy_status_queue import drain_proxy_status_queue
+from app_funcs.update_proxy_check_progress import update_proxy_check_progress
+from app_funcs.build_profile_row import build_profile_row
+from app_funcs.stream_profiles import stream_profiles
 from app_funcs.parse_proxy_line import parse_proxy_line
-from app_funcs.import_proxies_from_file import import_proxies_from_file
-from app_funcs.show_import_proxy_dialog import show_import_proxy_dialog
 from app_funcs.show_success_dialog import show_success_dialog
 from app_funcs.show_error_dialog import show_error_dialog
+from app_funcs.apply_launch_limits import apply_launch_limits
+from app_funcs.save_launch_limits import save_launch_limits
+from app_funcs.save_idle_timeout import save_idle_timeout
+from app_funcs.launch_preset_options import launch_preset_options
+from app_funcs.save_launch_preset import save_launch_preset
+from app_funcs.storage_mode_options import storage_mode_options
+from app_funcs.restore_session import restore_session
+from app_funcs.toggle_restore_session import toggle_restore_session
+from app_funcs.traffic_cell import traffic_cell
+from app_funcs.toggle_traffic_accounting import toggle_traffic_accounting
+
+
+class LazyMethod:
+    """Метод, модуль якого імпортується лише під час першого виклику.
+
+    Дозволяє передавати метод як обробник подій ще до імпорту модуля.
+    """
+
+    def __init__(self, module_name: str):
+        self.module_name = module_name
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    def resolve(self):
+        func = getattr(importlib.import_module(self.module_name), self.name)
+        setattr(self.owner, self.name, func)
+        return func
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        def method(*args, **kwargs):
+            return self.resolve()(instance, *args, **kwargs)
+
+        return method
 
 
 class AntyDetectBrowser:
@@ -46,7 +82,10 @@ class AntyDetectBrowser:
     build_settings_view = build_settings_view
     refresh_profiles = refresh_profiles
     refresh_proxies = refresh_proxies
+    build_profile_row = build_profile_row
+    stream_profiles = stream_profiles
     refresh_current_view = refresh_current_view
+    on_backend_change = on_backend_change
     open_dialog = open_dialog
     parse_open_tabs = parse_open_tabs
     validate_open_tabs = validate_open_tabs
@@ -55,19 +94,42 @@ class AntyDetectBrowser:
     run_ui = run_ui
     toggle_proxy_selection = toggle_proxy_selection
     toggle_select_all_proxies = toggle_select_all_proxies
-    check_selected_proxies = check_selected_proxies
-    show_create_profile_dialog = show_create_profile_dialog
-    show_edit_profile_dialog = show_edit_profile_dialog
-    show_create_proxy_dialog = show_create_proxy_dialog
-    show_edit_proxy_dialog = show_edit_proxy_dialog
+    check_selected_proxies = LazyMethod("app_funcs.check_selected_proxies")
+    show_create_profile_dialog = LazyMethod("app_funcs.show_create_profile_dialog")
+    show_edit_profile_dialog = LazyMethod("app_funcs.show_edit_profile_dialog")
+    show_create_proxy_dialog = LazyMethod("app_funcs.show_create_proxy_dialog")
+    show_edit_proxy_dialog = LazyMethod("app_funcs.show_edit_proxy_dialog")
+    parse_resource_limits = LazyMethod("app_funcs.parse_resource_limits")
     toggle_profile = toggle_profile
+    apply_launch_limits = apply_launch_limits
+    save_launch_limits = save_launch_limits
+    save_idle_timeout = save_idle_timeout
+    launch_preset_options = launch_preset_options
+    save_launch_preset = save_launch_preset
+    storage_mode_options = storage_mode_options
+    restore_session = restore_session
+    toggle_restore_session = toggle_restore_session
+    traffic_cell = traffic_cell
+    toggle_traffic_accounting = toggle_traffic_accounting
+    start_profile = LazyMethod("app_funcs.start_profile")
     delete_profile = delete_profile
     delete_proxy = delete_proxy
-    check_proxy = check_proxy
-    check_proxy_with_playwright = check_proxy_with_playwright
-    check_all_proxies = check_all_proxies
+    check_proxy = LazyMethod("app_funcs.check_proxy")
+    check_proxy_with_playwright = LazyMethod("app_funcs.check_proxy_with_playwright")
+    check_all_proxies = LazyMethod("app_funcs.check_all_proxies")
+    apply_proxy_status = apply_proxy_status
+    drain_proxy_status_queue = drain_proxy_status_queue
+    update_proxy_check_progress = update_proxy_check_progress
     parse_proxy_line = parse_proxy_line
-    import_proxies_from_file = import_proxies_from_file
-    show_import_proxy_dialog = show_import_proxy_dialog
+    import_proxies_from_file = LazyMethod("app_funcs.import_proxies_from_file")
+    show_import_proxy_dialog = LazyMethod("app_funcs.show_import_proxy_dialog")
+    import_profiles_from_file = LazyMethod("app_funcs.import_profiles_from_file")
+    show_import_profiles_dialog = LazyMethod("app_funcs.show_import_profiles_dialog")
+    export_profiles_bundle = LazyMethod("app_funcs.export_profiles_bundle")
+    import_profiles_bundle = LazyMethod("app_funcs.import_profiles_bundle")
+    show_profiles_bundle_dialog = LazyMethod("app_funcs.show_profiles_bundle_dialog")
     show_success_dialog = show_success_dialog
     show_error_dialog = show_error_dialog
+    start_control_api = LazyMethod("app_funcs.start_control_api")
+    stop_control_api = LazyMethod("app_funcs.stop_control_api")
+    toggle_control_api = LazyMethod("app_funcs.toggle_control_api")
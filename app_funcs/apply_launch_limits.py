@@ -0,0 +1,13 @@
+def apply_launch_limits(self):
+    """Застосовує збережені ліміти запуску до планувальника."""
+    try:
+        max_running = int(self.db.get_setting("max_running_profiles", "0"))
+    except ValueError:
+        max_running = 0
+    try:
+        min_free_mb = int(self.db.get_setting("min_free_memory_mb", "512"))
+    except ValueError:
+        min_free_mb = 512
+
+    self.launch_scheduler.max_running = max(0, max_running)
+    self.launch_scheduler.min_free_bytes = max(0, min_free_mb) * 1024 * 1024
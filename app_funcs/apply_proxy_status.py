@@ -0,0 +1,38 @@
+import flet as ft
+
+
+def apply_proxy_status(self, proxy_id: int):
+    """Оновлює комірку статусу проксі без перебудови таблиці."""
+    cell = self.proxy_status_cells.get(proxy_id)
+    if not cell:
+        return None
+
+    status_text, status_button = cell
+    status_info = self.proxy_statuses.get(proxy_id) or {}
+    status_value = status_info.get('status')
+
+    # Статус (буде оновлюватися при перевірці)
+    status_text.value = "Не перевірено"
+    status_text.color = ft.Colors.GREY
+    status_text.tooltip = None
+    if status_value == 'working':
+        status_text.value = "Працює"
+        status_text.color = ft.Colors.GREEN
+    elif status_value == 'failed':
+        status_text.value = "Не працює"
+        status_text.color = ft.Colors.RED
+        status_text.tooltip = status_info.get('error') or None
+    elif status_value == 'checking':
+        status_text.value = "Перевіряється..."
+        status_text.color = ft.Colors.ORANGE
+
+    status_button.icon = ft.Icons.CHECK_CIRCLE_OUTLINE
+    status_button.icon_color = None
+    if status_value == 'working':
+        status_button.icon = ft.Icons.CHECK_CIRCLE
+        status_button.icon_color = ft.Colors.GREEN
+    elif status_value == 'failed':
+        status_button.icon = ft.Icons.CANCEL
+        status_button.icon_color = ft.Colors.RED
+
+    return cell
@@ -1,30 +1,39 @@
 import json
 from typing import Dict
+from database.models import Profile
+from modules.launch_presets import DEFAULT_PRESET
+from modules.resource_filter import compile_rules
+from modules.resource_limits import ResourceLimits
 
 
-def build_profile_launch_settings(self, profile: Dict) -> Dict:
-    """Готує налаштування запуску профілю для Playwright."""
+def build_profile_launch_settings(self, profile: Profile, default_preset: str = DEFAULT_PRESET) -> Dict:
+    """Готує налаштування запуску профілю для Playwright.
+
+    Args:
+        profile: Профіль з бази даних.
+        default_preset: Глобальний пресет запуску для профілів без власного.
+    """
     timezone_id = None
-    if profile.get("timezone_mode") == "custom":
-        timezone_id = profile.get("timezone_value")
+    if profile.timezone_mode == "custom":
+        timezone_id = profile.timezone_value
 
     geolocation = None
     permissions = None
-    if profile.get("geolocation_mode") == "manual":
-        if profile.get("geolocation_lat") is not None and profile.get("geolocation_lon") is not None:
+    if profile.geolocation_mode == "manual":
+        if profile.geolocation_lat is not None and profile.geolocation_lon is not None:
             geolocation = {
-                "latitude": float(profile.get("geolocation_lat")),
-                "longitude": float(profile.get("geolocation_lon")),
+                "latitude": float(profile.geolocation_lat),
+                "longitude": float(profile.geolocation_lon),
             }
             permissions = ["geolocation"]
-    elif profile.get("geolocation_mode") == "block":
+    elif profile.geolocation_mode == "block":
         permissions = []
 
     locale = None
     extra_http_headers = None
-    if profile.get("language_mode") == "custom" and profile.get("languages"):
+    if profile.language_mode == "custom" and profile.languages:
         try:
-            languages = json.loads(profile.get("languages"))
+            languages = json.loads(profile.languages)
         except Exception:
             languages = []
         if languages:
@@ -32,10 +41,14 @@ def build_profile_launch_settings(self, profile: Dict) -> Dict:
             extra_http_headers = {"Accept-Language": ",".join(languages)}
 
     return {
-        "user_agent": profile.get("user_agent") or None,
+        "user_agent": profile.user_agent or None,
         "locale": locale,
         "timezone_id": timezone_id,
         "geolocation": geolocation,
         "permissions": permissions,
         "extra_http_headers": extra_http_headers,
+        "resource_limits": ResourceLimits.from_json(profile.resource_limits),
+        "launch_preset": profile.launch_preset or default_preset,
+        "resource_filter": compile_rules(profile.routing_rules),
+        "storage_mode": profile.storage_mode,
     }
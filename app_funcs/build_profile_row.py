@@ -0,0 +1,91 @@
+import flet as ft
+
+LAUNCH_BLOCK_REASONS = {
+    "max_running": "Очікує: досягнуто ліміту запущених профілів",
+    "memory": "Очікує: замало вільної пам'яті",
+}
+
+
+def build_profile_row(self, profile, traffic=None, lease=None) -> ft.DataRow:
+    """Створює рядок таблиці профілів.
+
+    traffic — сумарний трафік профілю (надіслано, отримано) у байтах;
+    lease — оренда профілю іншим екземпляром застосунку, якщо є.
+    """
+    profile_id = profile.profile_id
+    is_running = self.browser_manager.is_profile_running(profile_id)
+    queue_position = self.launch_scheduler.queue_position(profile_id)
+    # Запуск, що вже виконується, теж можна скасувати
+    is_launching = not is_running and self.launch_scheduler.is_launching(profile_id)
+    if is_launching:
+        status = ft.Text("Starting", color=ft.Colors.ORANGE, tooltip="Запускається")
+    elif queue_position is not None:
+        status = ft.Text(
+            f"Queued ({queue_position})",
+            color=ft.Colors.ORANGE,
+            tooltip=LAUNCH_BLOCK_REASONS.get(self.launch_scheduler.blocked_by, "Очікує запуску"),
+        )
+    elif lease and not is_running:
+        status = ft.Text(
+            "Running elsewhere",
+            color=ft.Colors.BLUE_GREY,
+            tooltip=f"Запущено в іншому екземплярі: {lease['hostname']}, PID {lease['pid']}",
+        )
+    else:
+        status = ft.Text(
+            "Running" if is_running else "Ready",
+            color=ft.Colors.GREEN if is_running else ft.Colors.GREY,
+        )
+
+    proxy_text = profile.proxy_name or 'Немає'
+
+    # Останній замір ресурсів дерева процесів браузера
+    stats = self.resource_monitor.get(profile_id) if is_running else None
+    if stats:
+        resources = ft.Text(
+            f"{stats.rss_bytes / 1024 / 1024:.0f} МБ · {stats.cpu_percent:.0f}% · {stats.children}",
+            tooltip=f"PID {stats.pid}: пам'ять (RSS) · CPU · дочірні процеси",
+        )
+    else:
+        resources = ft.Text("—", color=ft.Colors.GREY)
+
+    actions = ft.Row(
+        [
+            ft.IconButton(
+                ft.Icons.PLAY_ARROW if not is_running and not is_launching and queue_position is None
+                else ft.Icons.STOP,
+                tooltip=(
+                    "Скасувати запуск" if is_launching or queue_position is not None
+                    else "Зупинити" if is_running else "Запустити"
+                ),
+                data=profile_id,
+                disabled=bool(lease) and not is_running,
+                on_click=self.toggle_profile,
+            ),
+            ft.IconButton(
+                ft.Icons.EDIT,
+                tooltip="Редагувати",
+                on_click=lambda e, pid=profile_id: self.show_edit_profile_dialog(pid),
+            ),
+            ft.IconButton(
+                ft.Icons.DELETE,
+                tooltip="Видалити",
+                icon_color=ft.Colors.RED,
+                on_click=lambda e, pid=profile_id: self.delete_profile(pid),
+            ),
+        ],
+        tight=True,
+    )
+
+    return ft.DataRow(
+        cells=[
+            ft.DataCell(ft.Text(profile.name)),
+            ft.DataCell(status),
+            ft.DataCell(resources),
+            ft.DataCell(self.traffic_cell(traffic)),
+            ft.DataCell(ft.Text(profile.notes or '')),
+            ft.DataCell(ft.Text(proxy_text)),
+            ft.DataCell(ft.Text(profile.tags or '')),
+            ft.DataCell(actions),
+        ]
+    )
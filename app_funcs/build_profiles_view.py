@@ -7,20 +7,51 @@ def build_profiles_view(self):
     header = ft.Row(
         [
             ft.Text("Профілі", size=20, weight=ft.FontWeight.BOLD),
-            ft.Button(
-                "Створити профіль",
-                icon=ft.Icons.PERSON_ADD,
-                on_click=self.show_create_profile_dialog,
+            ft.Row(
+                [
+                    ft.Button(
+                        "Відновити сесію",
+                        icon=ft.Icons.RESTORE,
+                        tooltip="Запустити профілі, що працювали перед закриттям застосунку",
+                        on_click=lambda e: self.page.run_task(self.restore_session),
+                    ),
+                    ft.Button(
+                        "Експорт архіву",
+                        icon=ft.Icons.ARCHIVE_OUTLINED,
+                        on_click=lambda e: self.show_profiles_bundle_dialog(e, export=True),
+                    ),
+                    ft.Button(
+                        "Імпорт архіву",
+                        icon=ft.Icons.UNARCHIVE_OUTLINED,
+                        on_click=lambda e: self.show_profiles_bundle_dialog(e, export=False),
+                    ),
+                    ft.Button(
+                        "Імпорт з CSV/JSONL",
+                        icon=ft.Icons.UPLOAD_FILE,
+                        on_click=self.show_import_profiles_dialog,
+                    ),
+                    ft.Button(
+                        "Створити профіль",
+                        icon=ft.Icons.PERSON_ADD,
+                        on_click=self.show_create_profile_dialog,
+                    ),
+                ],
+                spacing=10,
             ),
         ],
         alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
     )
 
+    # Індикатор завантаження профілів при старті
+    self.profiles_loading = ft.ProgressBar(visible=self.initial_profiles_pending)
+
     # Таблиця профілів
     self.profiles_table = ft.DataTable(
         columns=[
             ft.DataColumn(ft.Text("Назва")),
             ft.DataColumn(ft.Text("Статус")),
+            ft.DataColumn(ft.Text("Ресурси")),
+            ft.DataColumn(ft.Text("Трафік")),
             ft.DataColumn(ft.Text("Нотатки")),
             ft.DataColumn(ft.Text("Проксі")),
             ft.DataColumn(ft.Text("Теги")),
@@ -32,6 +63,7 @@ def build_profiles_view(self):
     return ft.Column(
         [
             header,
+            self.profiles_loading,
             ft.Container(
                 content=ft.Column(
                     [self.profiles_table],
@@ -30,6 +30,10 @@ def build_proxies_view(self):
         alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
     )
 
+    # Загальний прогрес перевірки
+    self.proxy_check_progress = ft.ProgressBar(value=0, visible=False)
+    self.proxy_check_summary = ft.Text("", size=12, visible=False)
+
     self.proxies_table = ft.DataTable(
         columns=[
             ft.DataColumn(
@@ -42,6 +46,7 @@ def build_proxies_view(self):
             ft.DataColumn(ft.Text("Тип")),
             ft.DataColumn(ft.Text("IP:Port")),
             ft.DataColumn(ft.Text("Статус")),
+            ft.DataColumn(ft.Text("Трафік")),
             ft.DataColumn(ft.Text("Дії")),
         ],
         rows=[],
@@ -50,6 +55,8 @@ def build_proxies_view(self):
     return ft.Column(
         [
             header,
+            self.proxy_check_progress,
+            self.proxy_check_summary,
             ft.Container(
                 content=ft.Column(
                     [self.proxies_table],
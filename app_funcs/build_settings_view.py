@@ -3,6 +3,28 @@ import flet as ft
 
 def build_settings_view(self):
     """Створює вид налаштувань."""
+    self.max_running_field = ft.TextField(
+        label="Максимум запущених профілів (0 — без обмежень)",
+        value=self.db.get_setting("max_running_profiles", "0"),
+        width=360,
+        on_blur=self.save_launch_limits,
+        on_submit=self.save_launch_limits,
+    )
+    self.min_free_memory_field = ft.TextField(
+        label="Мінімум вільної пам'яті для запуску, МБ",
+        value=self.db.get_setting("min_free_memory_mb", "512"),
+        width=360,
+        on_blur=self.save_launch_limits,
+        on_submit=self.save_launch_limits,
+    )
+    self.idle_timeout_field = ft.TextField(
+        label="Автозупинка неактивних профілів, хв (0 — вимкнено)",
+        value=self.db.get_setting("idle_timeout_minutes", "0"),
+        width=360,
+        on_blur=self.save_idle_timeout,
+        on_submit=self.save_idle_timeout,
+    )
+
     return ft.Column(
         [
             ft.Text("Налаштування", size=20, weight=ft.FontWeight.BOLD),
@@ -17,6 +39,92 @@ def build_settings_view(self):
             ft.Divider(),
             ft.Text("Шлях до профілів:", size=16),
             ft.Text("profiles/", size=14, color=ft.Colors.SECONDARY),
+            ft.Divider(),
+            ft.Text("Черга запуску:", size=16),
+            ft.Text(
+                "Профілі понад ліміти чекають у черзі й запускаються по черзі",
+                size=14,
+                color=ft.Colors.SECONDARY,
+            ),
+            self.max_running_field,
+            self.min_free_memory_field,
+            ft.Divider(),
+            ft.Text("Автозупинка:", size=16),
+            ft.Text(
+                "Відкриті вкладки зупиненого профілю відновляться при наступному запуску",
+                size=14,
+                color=ft.Colors.SECONDARY,
+            ),
+            self.idle_timeout_field,
+            ft.Divider(),
+            ft.Row(
+                [
+                    ft.Text("Відновлювати сесію при запуску:", size=16),
+                    ft.Switch(
+                        value=self.db.get_setting("restore_session_on_start", "0") == "1",
+                        on_change=self.toggle_restore_session,
+                    ),
+                ],
+                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+            ),
+            ft.Text(
+                "Профілі, запущені перед закриттям чи збоєм, стартують знову з відкритими вкладками",
+                size=14,
+                color=ft.Colors.SECONDARY,
+            ),
+            ft.Divider(),
+            ft.Text("Пресет запуску за замовчуванням:", size=16),
+            ft.Text(
+                "Економія пам'яті вимикає GPU (змінює WebGL-відбиток) і обмежує кількість процесів",
+                size=14,
+                color=ft.Colors.SECONDARY,
+            ),
+            ft.Dropdown(
+                options=self.launch_preset_options(),
+                value=self.db.get_setting("launch_preset", "default"),
+                width=360,
+                on_change=self.save_launch_preset,
+            ),
+            ft.Divider(),
+            ft.Row(
+                [
+                    ft.Text("Облік трафіку профілів:", size=16),
+                    ft.Switch(
+                        value=self.db.get_setting("traffic_accounting", "0") == "1",
+                        on_change=self.toggle_traffic_accounting,
+                    ),
+                ],
+                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+            ),
+            ft.Text(
+                "Рахує байти кожної вкладки через CDP; діє для профілів, запущених після ввімкнення",
+                size=14,
+                color=ft.Colors.SECONDARY,
+            ),
+            ft.Divider(),
+            ft.Row(
+                [
+                    ft.Text("Локальний API керування:", size=16),
+                    ft.Switch(
+                        value=self.db.get_setting("api_enabled", "0") == "1",
+                        on_change=self.toggle_control_api,
+                    ),
+                ],
+                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+            ),
+            ft.Text(
+                f"http://127.0.0.1:{self.db.get_setting('api_port', '8765')}/profiles",
+                size=14,
+                color=ft.Colors.SECONDARY,
+            ),
+            ft.Text(
+                f"Заголовок запитів: Authorization: Bearer {self.db.get_setting('api_token')}"
+                if self.db.get_setting("api_token")
+                else "Токен доступу буде створено під час першого ввімкнення API",
+                size=14,
+                color=ft.Colors.SECONDARY,
+                selectable=True,
+            ),
         ],
         spacing=10,
     )
@@ -9,9 +9,13 @@ def check_all_proxies(self, e):
         self.show_error_dialog("Немає проксі для перевірки")
         return
 
+    # Прогрес і підсумок рахуються лише за проксі цього запуску
+    run_ids = {proxy.id for proxy in proxies}
+    self.proxy_check_run = set(run_ids)
+
     # Встановлюємо статус "перевіряється" для всіх
     for proxy in proxies:
-        self.proxy_statuses[proxy['id']] = {'status': 'checking'}
+        self.proxy_statuses[proxy.id] = {'status': 'checking'}
 
     self.refresh_proxies()
 
@@ -21,7 +25,7 @@ def check_all_proxies(self, e):
 
         for proxy in proxies:
             # Запускаємо перевірку кожного проксі
-            self.check_proxy(proxy['id'])
+            self.check_proxy(proxy.id)
             checked += 1
 
             # Невелика затримка між перевірками
@@ -30,8 +34,9 @@ def check_all_proxies(self, e):
         # Показуємо результат після завершення
         time.sleep(2)  # Даємо час на завершення всіх перевірок
 
-        working = sum(1 for pid, status in self.proxy_statuses.items() if status.get('status') == 'working')
-        failed = sum(1 for pid, status in self.proxy_statuses.items() if status.get('status') == 'failed')
+        statuses = [(self.proxy_statuses.get(pid) or {}).get('status') for pid in run_ids]
+        working = statuses.count('working')
+        failed = statuses.count('failed')
 
         self.run_ui(
             lambda: self.show_success_dialog(
@@ -1,4 +1,5 @@
 import threading
+from modules.proxy_checker import check_proxy_http
 
 
 def check_proxy(self, proxy_id: int):
@@ -7,52 +8,25 @@ def check_proxy(self, proxy_id: int):
     if not proxy:
         return
 
+    # Перевірка долучається до поточного запуску або починає новий
+    run_active = any(
+        (self.proxy_statuses.get(pid) or {}).get('status') == 'checking' for pid in list(self.proxy_check_run)
+    )
+    if not run_active:
+        self.proxy_check_run = set()
+    self.proxy_check_run.add(proxy_id)
+
     # Встановлюємо статус "перевіряється"
     self.proxy_statuses[proxy_id] = {'status': 'checking'}
-    self.refresh_proxies()
+    self.proxy_status_queue.put(proxy_id)
 
     def check_in_thread():
         try:
-            import requests
-            from requests.adapters import HTTPAdapter
-            from urllib3.util.retry import Retry
-
-            # Формуємо проксі для requests
-            proxy_url = f"{proxy['type']}://"
-            if proxy.get('username') and proxy.get('password'):
-                proxy_url += f"{proxy['username']}:{proxy['password']}@"
-            proxy_url += f"{proxy['host']}:{proxy['port']}"
-
-            proxies_dict = {
-                'http': proxy_url,
-                'https': proxy_url
-            }
-
-            # Налаштування сесії з таймаутом
-            session = requests.Session()
-            retry = Retry(total=1, backoff_factor=0.1)
-            adapter = HTTPAdapter(max_retries=retry)
-            session.mount('http://', adapter)
-            session.mount('https://', adapter)
-
             # Перевіряємо через ipify з таймаутом 15 секунд
-            response = session.get(
-                'https://api.ipify.org?format=json',
-                proxies=proxies_dict,
-                timeout=15,
-                allow_redirects=True
-            )
-
-            if response.status_code == 200:
-                self.proxy_statuses[proxy_id] = {'status': 'working'}
-            else:
-                self.proxy_statuses[proxy_id] = {
-                    'status': 'failed',
-                    'error': f"HTTP {response.status_code}"
-                }
+            self.proxy_statuses[proxy_id] = check_proxy_http(proxy, timeout=15)
         except Exception as e:
             # Спробуємо альтернативний метод через Playwright для SOCKS
-            if proxy['type'] in ['socks4', 'socks5']:
+            if proxy.type in ['socks4', 'socks5']:
                 try:
                     self.check_proxy_with_playwright(proxy, proxy_id)
                 except Exception:
@@ -60,8 +34,8 @@ def check_proxy(self, proxy_id: int):
             else:
                 self.proxy_statuses[proxy_id] = {'status': 'failed', 'error': str(e)}
         finally:
-            # Оновлюємо UI
-            self.run_ui(self.refresh_proxies)
+            # UI застосує зміну під час найближчого кадру
+            self.proxy_status_queue.put(proxy_id)
 
     thread = threading.Thread(target=check_in_thread, daemon=True)
     thread.start()
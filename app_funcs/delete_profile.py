@@ -1,3 +1,6 @@
+import asyncio
+import shutil
+
 import flet as ft
 
 
@@ -10,20 +13,20 @@ def delete_profile(self, profile_id: str):
                 await self.browser_manager.stop_profile(profile_id)
 
             # Видаляємо з бази даних
-            self.db.delete_profile(profile_id)
+            await self.adb.delete_profile(profile_id)
 
-            # Видаляємо папку профілю (опціонально)
-            import shutil
+            # Видаляємо папку профілю (опціонально) у фоновому потоці,
+            # щоб великі профілі не блокували цикл подій UI
             profile_path = self.browser_manager.get_profile_path(profile_id)
             if profile_path.exists():
                 try:
-                    shutil.rmtree(profile_path)
+                    await asyncio.to_thread(shutil.rmtree, profile_path)
                 except Exception as e:
                     print(f"Помилка видалення папки профілю: {e}")
 
             dialog.open = False
             self.page.update()
-            self.refresh_profiles()
+            self.backend.notify_profiles()
 
         self.page.run_task(_do_delete)
 
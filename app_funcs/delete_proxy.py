@@ -7,7 +7,7 @@ def delete_proxy(self, proxy_id: int):
         self.db.delete_proxy(proxy_id)
         dialog.open = False
         self.page.update()
-        self.refresh_proxies()
+        self.backend.notify_proxies()
 
     dialog = ft.AlertDialog(
         modal=True,
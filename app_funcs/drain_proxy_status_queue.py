@@ -0,0 +1,27 @@
+import queue
+
+
+def drain_proxy_status_queue(self, max_items: int = 1000):
+    """Застосовує накопичені зміни статусів проксі одним кадром."""
+    changed_ids = set()
+    while len(changed_ids) < max_items:
+        try:
+            changed_ids.add(self.proxy_status_queue.get_nowait())
+        except queue.Empty:
+            break
+
+    if not changed_ids:
+        return
+
+    for proxy_id in changed_ids:
+        cell = self.apply_proxy_status(proxy_id)
+        if not cell:
+            continue
+        for control in cell:
+            try:
+                if control.page:
+                    control.update()
+            except RuntimeError:
+                pass
+
+    self.update_proxy_check_progress()
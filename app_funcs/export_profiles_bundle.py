@@ -0,0 +1,29 @@
+import threading
+from modules.profile_bundle import export_profiles
+
+
+def export_profiles_bundle(self, file_path: str, profile_ids=None):
+    """Експортує профілі (рядки БД та папки) в один архів у фоновому потоці."""
+    if profile_ids is None:
+        profile_ids = [p.profile_id for p in self.db.get_all_profiles()]
+
+    if not profile_ids:
+        self.show_error_dialog("Немає профілів для експорту")
+        return
+
+    running = [pid for pid in profile_ids if self.browser_manager.is_profile_running(pid)]
+
+    def export_in_thread():
+        try:
+            with open(file_path, 'wb') as f:
+                exported = export_profiles(self.db, self.browser_manager, profile_ids, f)
+            message = f"Експортовано профілів: {exported}"
+            if running:
+                message += f"\n\nЗапущені профілі ({len(running)}) експортовано без зупинки"
+            self.run_ui(lambda: self.show_success_dialog(message))
+        except Exception as ex:
+            error = f"Помилка експорту профілів: {ex}"
+            self.run_ui(lambda: self.show_error_dialog(error))
+
+    thread = threading.Thread(target=export_in_thread, daemon=True)
+    thread.start()
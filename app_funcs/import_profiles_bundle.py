@@ -0,0 +1,25 @@
+import os
+import threading
+from modules.profile_bundle import import_profiles
+
+
+def import_profiles_bundle(self, file_path: str):
+    """Імпортує профілі з архіву у фоновому потоці."""
+    if not file_path or not os.path.exists(file_path):
+        self.show_error_dialog("Файл не знайдено")
+        return
+
+    def import_in_thread():
+        try:
+            with open(file_path, 'rb') as f:
+                imported = import_profiles(self.db, self.browser_manager, f)
+            self.run_ui(lambda: (
+                self.show_success_dialog(f"Імпортовано профілів: {imported}"),
+                self.backend.notify_profiles(),
+            ))
+        except Exception as ex:
+            error = f"Помилка імпорту архіву: {ex}"
+            self.run_ui(lambda: self.show_error_dialog(error))
+
+    thread = threading.Thread(target=import_in_thread, daemon=True)
+    thread.start()
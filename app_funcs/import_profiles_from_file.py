@@ -0,0 +1,26 @@
+import os
+from modules.profile_import import import_profile_templates, read_profile_templates
+
+
+def import_profiles_from_file(self, file_path: str):
+    """Створює профілі з шаблону CSV/JSONL."""
+    if not file_path or not os.path.exists(file_path):
+        self.show_error_dialog("Файл не знайдено")
+        return
+
+    try:
+        created_count = import_profile_templates(
+            self.db,
+            self.browser_manager,
+            read_profile_templates(file_path),
+        )
+    except Exception as ex:
+        self.show_error_dialog(f"Помилка імпорту профілів: {ex}")
+        self.refresh_profiles()
+        return
+
+    if created_count > 0:
+        self.show_success_dialog(f"Успішно створено {created_count} профілів")
+        self.backend.notify_profiles()
+    else:
+        self.show_error_dialog("Файл не містить жодного профілю")
@@ -8,34 +8,22 @@ def import_proxies_from_file(self, file_path: str):
         return
 
     try:
-        imported_count = 0
-        failed_count = 0
-
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                proxy_data = self.parse_proxy_line(line)
-                if proxy_data:
-                    try:
+        def parsed_proxies():
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    proxy_data = self.parse_proxy_line(line)
+                    if proxy_data:
                         # Генеруємо назву якщо не вказана
-                        name = f"Проксі {proxy_data['host']}:{proxy_data['port']}"
+                        proxy_data['name'] = f"Проксі {proxy_data['host']}:{proxy_data['port']}"
+                        yield proxy_data
 
-                        self.db.create_proxy(
-                            name=name,
-                            type=proxy_data['type'],
-                            host=proxy_data['host'],
-                            port=proxy_data['port'],
-                            username=proxy_data.get('username'),
-                            password=proxy_data.get('password')
-                        )
-                        imported_count += 1
-                    except Exception as ex:
-                        failed_count += 1
-                        print(f"Помилка імпорту рядка {line_num}: {ex}")
+        # Додаємо всі рядки пакетами в кількох транзакціях
+        imported_count = self.db.bulk_create_proxies(parsed_proxies())
 
         # Показуємо результат
         if imported_count > 0:
             self.show_success_dialog(f"Успішно додано {imported_count} проксі")
-            self.refresh_proxies()
+            self.backend.notify_proxies()
         else:
             self.show_error_dialog("Не вдалося імпортувати жодного проксі")
 
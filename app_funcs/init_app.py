@@ -1,15 +1,23 @@
 import flet as ft
-import atexit
+import queue
 import asyncio
-from database.db_handler import Database
-from browser_logic import BrowserManager
+from backend import get_backend
 
 
 def __init__(self, page: ft.Page):
     self.page = page
-    self.db = Database()
-    self.browser_manager = BrowserManager()
+    # БД, браузери, перевірка проксі та фонові сервіси спільні для всіх сесій
+    self.backend = get_backend()
+    self.db = self.backend.db
+    self.adb = self.backend.adb
+    self.browser_manager = self.backend.browser_manager
+    self.proxy_checker = self.backend.proxy_checker
+    self.resource_monitor = self.backend.resource_monitor
+    self.launch_scheduler = self.backend.launch_scheduler
+    self.apply_launch_limits()
+    self.traffic_meter = self.backend.traffic_meter
     self.current_page = "profiles"
+    self.initial_profiles_pending = True
 
     # Завантажуємо збережену тему (за замовчуванням світла)
     saved_theme = self.db.get_setting("theme", "light")
@@ -20,6 +28,11 @@ def __init__(self, page: ft.Page):
 
     # Словник для зберігання статусів проксі
     self.proxy_statuses = {}
+    # ID проксі поточної перевірки, за якими рахується її прогрес
+    self.proxy_check_run = set()
+    # Черга змін статусів проксі, яку UI обробляє кадрами
+    self.proxy_status_queue = queue.Queue()
+    self.proxy_status_cells = {}
     self.selected_proxy_ids = set()
     self.select_all_proxies = False
     self._updating_select_all = False
@@ -28,7 +41,25 @@ def __init__(self, page: ft.Page):
     self.setup_page()
     self.setup_ui()
 
+    # Локальний API керування профілями (опціонально)
+    if self.db.get_setting("api_enabled", "0") == "1":
+        self.start_control_api()
+
+    self.backend.attach()
+    unsubscribe = self.backend.events.subscribe(self.on_backend_change)
+
     def _on_disconnect(e):
+        nonlocal unsubscribe
+        # on_disconnect і on_close можуть спрацювати обидва
+        if unsubscribe is None:
+            return
+        unsubscribe()
+        unsubscribe = None
+        # У веб-режимі профілі працюють і без відкритих вкладок оператора;
+        # у десктопному браузери закриваються разом з останнім вікном
+        if self.backend.detach() or self.page.web:
+            return
+
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
@@ -42,4 +73,3 @@ def __init__(self, page: ft.Page):
 
     self.page.on_disconnect = _on_disconnect
     self.page.on_close = _on_disconnect
-    atexit.register(self.browser_manager.cleanup_sync)
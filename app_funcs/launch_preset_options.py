@@ -0,0 +1,19 @@
+from typing import List
+
+import flet as ft
+
+LAUNCH_PRESET_LABELS = {
+    "default": "Стандартний",
+    "low_memory": "Економія пам'яті (менше процесів, малий кеш)",
+}
+
+# Значення випадаючого списку для профілю, що використовує глобальний пресет
+GLOBAL_PRESET_KEY = "global"
+
+
+def launch_preset_options(self, include_global: bool = False) -> List[ft.dropdown.Option]:
+    """Повертає варіанти пресетів запуску для випадаючого списку."""
+    options = [ft.dropdown.Option(key, label) for key, label in LAUNCH_PRESET_LABELS.items()]
+    if include_global:
+        options.insert(0, ft.dropdown.Option(GLOBAL_PRESET_KEY, "Як у налаштуваннях"))
+    return options
@@ -1,11 +1,12 @@
 import threading
 import flet as ft
 from app_core import AntyDetectBrowser
-from app_funcs.update_statuses import update_statuses
+from app_funcs.pump_proxy_statuses import pump_proxy_statuses
 
 
 def main(page: ft.Page):
     app = AntyDetectBrowser(page)
 
-    status_thread = threading.Thread(target=update_statuses, args=(page, app), daemon=True)
-    status_thread.start()
+    # Статуси профілів оновлює спільний потік бекенду подією "tick"
+    proxy_status_thread = threading.Thread(target=pump_proxy_statuses, args=(page, app), daemon=True)
+    proxy_status_thread.start()
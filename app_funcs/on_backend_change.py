@@ -0,0 +1,17 @@
+from backend import TICK
+
+
+def on_backend_change(self, topic: str):
+    """Оновлює UI сесії після події спільного бекенду.
+
+    Викликається з потоку бекенду або з циклу подій, тому оновлення
+    передається в UI через run_ui.
+    """
+    if not self.page.window_alive:
+        return
+    if topic == TICK:
+        # Статуси профілів оновлюються лише на видимій таблиці
+        if self.current_page == "profiles":
+            self.run_ui(self.refresh_profiles)
+    else:
+        self.run_ui(self.refresh_current_view)
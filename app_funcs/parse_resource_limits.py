@@ -0,0 +1,27 @@
+from modules.resource_limits import ResourceLimits
+
+
+def parse_resource_limits(self, memory_max_mb: str, cpu_weight: str, pids_max: str) -> ResourceLimits:
+    """Перетворює значення полів діалогу профілю на ResourceLimits.
+
+    Порожнє поле означає відсутність обмеження.
+
+    Raises:
+        ValueError: Якщо значення не є додатним цілим числом.
+    """
+    values = {}
+    for name, raw, label in (
+        ("memory_max_mb", memory_max_mb, "Пам'ять"),
+        ("cpu_weight", cpu_weight, "Вага CPU"),
+        ("pids_max", pids_max, "Процеси"),
+    ):
+        raw = (raw or "").strip()
+        if not raw:
+            continue
+        if not raw.isdigit() or int(raw) <= 0:
+            raise ValueError(f"{label}: введіть додатне ціле число")
+        values[name] = int(raw)
+
+    if values.get("cpu_weight", 1) > 10000:
+        raise ValueError("Вага CPU має бути від 1 до 10000")
+    return ResourceLimits(**values)
@@ -0,0 +1,14 @@
+import time
+
+# Бюджет кадру для застосування змін статусів проксі (секунди)
+PROXY_STATUS_FRAME_INTERVAL = 0.25
+
+
+def pump_proxy_statuses(page, app):
+    while True:
+        time.sleep(PROXY_STATUS_FRAME_INTERVAL)
+        try:
+            if page.window_alive and not app.proxy_status_queue.empty():
+                app.run_ui(app.drain_proxy_status_queue)
+        except Exception:
+            break
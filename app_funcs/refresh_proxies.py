@@ -4,51 +4,31 @@ import flet as ft
 def refresh_proxies(self):
     """Оновлює список проксі."""
     proxies = self.db.get_all_proxies()
+    traffic = self.traffic_meter.totals(self.db.get_traffic_by_proxy(), by="proxy")
     rows = []
+    self.proxy_status_cells = {}
 
     for proxy in proxies:
-        address = f"{proxy['host']}:{proxy['port']}"
-        is_selected = proxy['id'] in self.selected_proxy_ids
+        address = f"{proxy.host}:{proxy.port}"
+        is_selected = proxy.id in self.selected_proxy_ids
 
         select_checkbox = ft.Checkbox(
             value=is_selected,
-            on_change=lambda e, pid=proxy['id']: self.toggle_proxy_selection(pid, e.control.value),
+            on_change=lambda e, pid=proxy.id: self.toggle_proxy_selection(pid, e.control.value),
         )
 
-        # Статус (буде оновлюватися при перевірці)
-        status_text = ft.Text("Не перевірено", color=ft.Colors.GREY)
-        if proxy['id'] in self.proxy_statuses:
-            status_info = self.proxy_statuses[proxy['id']]
-            if status_info['status'] == 'working':
-                status_text = ft.Text("Працює", color=ft.Colors.GREEN)
-            elif status_info['status'] == 'failed':
-                error_msg = status_info.get('error')
-                status_text = ft.Text("Не працює", color=ft.Colors.RED, tooltip=error_msg or None)
-            elif status_info['status'] == 'checking':
-                status_text = ft.Text("Перевіряється...", color=ft.Colors.ORANGE)
-
-        icon_color = None
-        icon_name = ft.Icons.CHECK_CIRCLE_OUTLINE
-        if proxy['id'] in self.proxy_statuses:
-            status_value = self.proxy_statuses[proxy['id']].get('status')
-            if status_value == 'working':
-                icon_color = ft.Colors.GREEN
-                icon_name = ft.Icons.CHECK_CIRCLE
-            elif status_value == 'failed':
-                icon_color = ft.Colors.RED
-                icon_name = ft.Icons.CANCEL
+        status_text = ft.Text()
+        status_button = ft.IconButton(
+            ft.Icons.CHECK_CIRCLE_OUTLINE,
+            tooltip="Перевірити проксі",
+            icon_size=20,
+            on_click=lambda e, pid=proxy.id: self.check_proxy(pid),
+        )
+        self.proxy_status_cells[proxy.id] = (status_text, status_button)
+        self.apply_proxy_status(proxy.id)
 
         status_cell = ft.Row(
-            [
-                status_text,
-                ft.IconButton(
-                    icon_name,
-                    tooltip="Перевірити проксі",
-                    icon_size=20,
-                    icon_color=icon_color,
-                    on_click=lambda e, pid=proxy['id']: self.check_proxy(pid),
-                ),
-            ],
+            [status_text, status_button],
             tight=True,
             spacing=5,
         )
@@ -58,13 +38,13 @@ def refresh_proxies(self):
                 ft.IconButton(
                     ft.Icons.EDIT,
                     tooltip="Редагувати",
-                    on_click=lambda e, pid=proxy['id']: self.show_edit_proxy_dialog(pid),
+                    on_click=lambda e, pid=proxy.id: self.show_edit_proxy_dialog(pid),
                 ),
                 ft.IconButton(
                     ft.Icons.DELETE,
                     tooltip="Видалити",
                     icon_color=ft.Colors.RED,
-                    on_click=lambda e, pid=proxy['id']: self.delete_proxy(pid),
+                    on_click=lambda e, pid=proxy.id: self.delete_proxy(pid),
                 ),
             ],
             tight=True,
@@ -74,10 +54,11 @@ def refresh_proxies(self):
             ft.DataRow(
                 cells=[
                     ft.DataCell(select_checkbox),
-                    ft.DataCell(ft.Text(proxy['name'])),
-                    ft.DataCell(ft.Text(proxy['type'].upper())),
+                    ft.DataCell(ft.Text(proxy.name)),
+                    ft.DataCell(ft.Text(proxy.type.upper())),
                     ft.DataCell(ft.Text(address)),
                     ft.DataCell(status_cell),
+                    ft.DataCell(self.traffic_cell(traffic.get(proxy.id))),
                     ft.DataCell(actions),
                 ]
             )
@@ -86,10 +67,11 @@ def refresh_proxies(self):
     self.proxies_table.rows = rows
     if self.proxies_table and self.proxies_table.page:
         self.proxies_table.update()
+    self.update_proxy_check_progress()
 
     # Оновлюємо стан "обрати всі"
     self.select_all_proxies = len(proxies) > 0 and all(
-        p['id'] in self.selected_proxy_ids for p in proxies
+        p.id in self.selected_proxy_ids for p in proxies
     )
     if self.proxies_table.columns:
         header_checkbox = self.proxies_table.columns[0].label
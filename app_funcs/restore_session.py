@@ -0,0 +1,54 @@
+import asyncio
+import json
+
+
+async def restore_session(self, notify: bool = True):
+    """Запускає профілі збереженої сесії з їхніми вкладками.
+
+    Усі профілі подаються через start_profile у LaunchScheduler одночасно
+    з пріоритетом за порядком у сесії. Планувальник запускає їх паралельно
+    в межах лімітів запуску, як і при звичайному запуску.
+
+    Returns:
+        Кількість запущених профілів.
+    """
+    try:
+        entries = json.loads(await self.adb.get_setting("session", "[]"))
+    except ValueError:
+        entries = []
+
+    existing = {profile.profile_id for profile in await self.adb.get_all_profiles()}
+    entries = [
+        entry for entry in entries
+        if entry.get("profile_id") in existing
+        and not self.browser_manager.is_profile_running(entry["profile_id"])
+    ]
+    if not entries:
+        if notify:
+            self.show_error_dialog("Немає збереженої сесії для відновлення")
+        return 0
+
+    async def launch(priority, entry):
+        await self.start_profile(entry["profile_id"], priority=priority, tabs=entry.get("tabs") or None)
+        self.backend.notify_profiles()
+
+    launches = [asyncio.ensure_future(launch(priority, entry)) for priority, entry in enumerate(entries)]
+    # Даємо запускам стати в чергу й одразу показуємо їхній статус
+    await asyncio.sleep(0)
+    self.backend.notify_profiles()
+    results = await asyncio.gather(*launches, return_exceptions=True)
+    failed = [
+        (entry["profile_id"], result) for entry, result in zip(entries, results)
+        if isinstance(result, BaseException)
+    ]
+    for profile_id, error in failed:
+        print(f"Помилка відновлення профілю {profile_id}: {error}")
+
+    self.backend.notify_profiles()
+    restored = len(entries) - len(failed)
+    if notify:
+        message = f"Відновлено профілів: {restored}"
+        if failed:
+            message += f", не вдалося: {len(failed)}"
+        self.show_success_dialog(message)
+    return restored
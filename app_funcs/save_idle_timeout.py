@@ -0,0 +1,7 @@
+def save_idle_timeout(self, e):
+    """Зберігає тайм-аут автозупинки неактивних профілів."""
+    value = (self.idle_timeout_field.value or "").strip()
+    if not value.isdigit():
+        self.show_error_dialog("Тайм-аут має бути невід'ємним цілим числом хвилин")
+        return
+    self.db.set_setting("idle_timeout_minutes", value)
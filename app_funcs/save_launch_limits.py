@@ -0,0 +1,14 @@
+def save_launch_limits(self, e):
+    """Зберігає ліміти запуску з полів налаштувань."""
+    values = {
+        "max_running_profiles": self.max_running_field.value,
+        "min_free_memory_mb": self.min_free_memory_field.value,
+    }
+    for key, value in values.items():
+        value = (value or "").strip()
+        if not value.isdigit():
+            self.show_error_dialog("Ліміти запуску мають бути невід'ємними цілими числами")
+            return
+        self.db.set_setting(key, value)
+
+    self.apply_launch_limits()
@@ -0,0 +1,3 @@
+def save_launch_preset(self, e):
+    """Зберігає глобальний пресет запуску профілів."""
+    self.db.set_setting("launch_preset", e.control.value or "default")
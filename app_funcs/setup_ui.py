@@ -77,5 +77,12 @@ def setup_ui(self):
         )
     )
 
-    # Оновлюємо список профілів
-    self.refresh_profiles()
+    # Профілі завантажуються після першого кадру
+    self.page.run_task(self.stream_profiles)
+    # Фонові задачі належать спільному бекенду; перша сесія лише передає
+    # йому цикл подій, тож закриття її вкладки їх не зупиняє
+    if self.backend.start_once("watchers"):
+        startup = []
+        if self.db.get_setting("restore_session_on_start", "0") == "1":
+            startup.append(self.restore_session(False))
+        self.page.run_task(self.backend.start_watchers, *startup)
@@ -1,8 +1,12 @@
 import json
-from typing import List, Dict
+from typing import List
 import flet as ft
+from app_funcs.launch_preset_options import GLOBAL_PRESET_KEY
+from modules.storage_modes import PERSISTENT, is_ephemeral
+from database.models import Proxy
 from database.db_handler import save_profile
 from modules.fingerprint import generate_user_agent
+from modules.resource_filter import RuleSyntaxError, parse_rules_text
 
 
 def show_create_profile_dialog(self, e):
@@ -36,6 +40,30 @@ def show_create_profile_dialog(self, e):
     notes_field = ft.TextField(label="Нотатки", multiline=True, max_lines=3)
     tags_field = ft.TextField(label="Теги (через кому)")
 
+    memory_limit_field = ft.TextField(label="Пам'ять, МБ", keyboard_type=ft.KeyboardType.NUMBER)
+    cpu_weight_field = ft.TextField(label="Вага CPU (1–10000, типово 100)", keyboard_type=ft.KeyboardType.NUMBER)
+    pids_limit_field = ft.TextField(label="Макс. процесів і потоків", keyboard_type=ft.KeyboardType.NUMBER)
+    resource_limits_error = ft.Text(value="", color=ft.Colors.RED, size=12, visible=False)
+    routing_rules_field = ft.TextField(
+        label="Фільтрація запитів",
+        multiline=True,
+        min_lines=2,
+        max_lines=6,
+        hint_text="block image,media,font\nallow image *://cdn.example.com/*\nblock * *://*.ads.example/*",
+        helper_text="Перше правило, що збіглося, вирішує; решта запитів дозволені",
+    )
+    routing_rules_error = ft.Text(value="", color=ft.Colors.RED, size=12, visible=False)
+    storage_mode_dropdown = ft.Dropdown(
+        label="Тип профілю",
+        options=self.storage_mode_options(),
+        value=PERSISTENT,
+    )
+    launch_preset_dropdown = ft.Dropdown(
+        label="Пресет запуску",
+        options=self.launch_preset_options(include_global=True),
+        value=GLOBAL_PRESET_KEY,
+    )
+
     timezone_options = [
         "UTC",
         "Europe/Kyiv",
@@ -147,10 +175,10 @@ def show_create_profile_dialog(self, e):
         visible=False,
     )
 
-    def format_proxy_label(proxy: Dict) -> str:
-        name = proxy.get("name") or ""
-        host = proxy.get("host") or ""
-        port = proxy.get("port")
+    def format_proxy_label(proxy: Proxy) -> str:
+        name = proxy.name or ""
+        host = proxy.host or ""
+        port = proxy.port
         host_port = f"{host}:{port}" if host and port else ""
         if host_port and host_port not in name:
             return f"{name} ({host_port})" if name else host_port
@@ -188,10 +216,10 @@ def show_create_profile_dialog(self, e):
             padding=5,
         )
 
-        def proxy_subtitle(proxy: Dict) -> str:
-            name = proxy.get("name") or ""
-            host = proxy.get("host") or ""
-            port = proxy.get("port")
+        def proxy_subtitle(proxy: Proxy) -> str:
+            name = proxy.name or ""
+            host = proxy.host or ""
+            port = proxy.port
             host_port = f"{host}:{port}" if host and port else ""
             if host_port and host_port not in name:
                 return host_port
@@ -201,9 +229,9 @@ def show_create_profile_dialog(self, e):
             q = (query or "").strip().lower()
             filtered = []
             for proxy in proxies:
-                name = (proxy.get("name") or "").lower()
-                host = (proxy.get("host") or "").lower()
-                port = str(proxy.get("port") or "")
+                name = (proxy.name or "").lower()
+                host = (proxy.host or "").lower()
+                port = str(proxy.port or "")
                 if not q or q in name or q in host or q in port:
                     filtered.append(proxy)
 
@@ -212,14 +240,14 @@ def show_create_profile_dialog(self, e):
                 tiles.append(
                     ft.ListTile(
                         leading=ft.Container(
-                            content=ft.Text(str(p.get("id", "")), size=11, color=ft.Colors.ON_SURFACE_VARIANT),
+                            content=ft.Text(str(p.id), size=11, color=ft.Colors.ON_SURFACE_VARIANT),
                             bgcolor=ft.Colors.SURFACE_CONTAINER_HIGHEST,
                             padding=ft.Padding(6, 2, 6, 2),
                             border_radius=6,
                         ),
                         title=ft.Text(format_proxy_label(p)),
                         subtitle=ft.Text(proxy_subtitle(p)) if proxy_subtitle(p) else None,
-                        on_click=lambda e, pid=p["id"], label=format_proxy_label(p): select_proxy(pid, label),
+                        on_click=lambda e, pid=p.id, label=format_proxy_label(p): select_proxy(pid, label),
                     )
                 )
                 tiles.append(ft.Divider(height=1))
@@ -343,6 +371,24 @@ def show_create_profile_dialog(self, e):
         if language_mode.value == "custom" and not get_selected_languages():
             is_valid = False
 
+        # Правила фільтрації запитів
+        try:
+            parse_rules_text(routing_rules_field.value or "")
+            routing_rules_error.visible = False
+        except RuleSyntaxError as ex:
+            routing_rules_error.value = f"Некоректне правило в рядку {ex.line}"
+            routing_rules_error.visible = True
+            is_valid = False
+
+        # Обмеження ресурсів
+        try:
+            self.parse_resource_limits(memory_limit_field.value, cpu_weight_field.value, pids_limit_field.value)
+            resource_limits_error.visible = False
+        except ValueError as ex:
+            resource_limits_error.value = str(ex)
+            resource_limits_error.visible = True
+            is_valid = False
+
         # Проксі
         if proxy_mode.value == "manual":
             proxy_host_field.error_text = None
@@ -425,7 +471,9 @@ def show_create_profile_dialog(self, e):
             return
 
         profile_id = self.browser_manager.generate_profile_id()
-        self.browser_manager.create_profile_folder(profile_id)
+        # Тимчасовому профілю папка потрібна лише для файлу storage_state
+        if not is_ephemeral(storage_mode_dropdown.value):
+            self.browser_manager.create_profile_folder(profile_id)
 
         profile_name = name_field.value.strip() if name_field.value else ""
         if not profile_name:
@@ -448,6 +496,10 @@ def show_create_profile_dialog(self, e):
 
         open_tabs = self.parse_open_tabs(open_tabs_field.value or "")
         languages = get_selected_languages()
+        resource_limits = self.parse_resource_limits(
+            memory_limit_field.value, cpu_weight_field.value, pids_limit_field.value
+        )
+        routing_rules = parse_rules_text(routing_rules_field.value or "")
 
         save_profile(
             self.db,
@@ -466,11 +518,15 @@ def show_create_profile_dialog(self, e):
             geolocation_lon=float(geo_lon_field.value) if geolocation_mode.value == "manual" else None,
             language_mode=language_mode.value,
             languages=json.dumps(languages, ensure_ascii=False) if language_mode.value == "custom" else None,
+            resource_limits=resource_limits.to_json(),
+            launch_preset=None if launch_preset_dropdown.value == GLOBAL_PRESET_KEY else launch_preset_dropdown.value,
+            routing_rules=json.dumps(routing_rules) if routing_rules else None,
+            storage_mode=None if storage_mode_dropdown.value == PERSISTENT else storage_mode_dropdown.value,
         )
 
         dialog.open = False
         self.page.update()
-        self.refresh_profiles()
+        self.backend.notify_profiles()
 
     def on_field_change(e):
         validate_form()
@@ -494,6 +550,10 @@ def show_create_profile_dialog(self, e):
     language_mode.on_change = lambda e: (update_visibility(), validate_form())
     for cb in language_checkboxes:
         cb.on_change = on_field_change
+    memory_limit_field.on_change = on_field_change
+    cpu_weight_field.on_change = on_field_change
+    pids_limit_field.on_change = on_field_change
+    routing_rules_field.on_change = on_field_change
 
     ua_field.expand = True
 
@@ -548,6 +608,17 @@ def show_create_profile_dialog(self, e):
             language_mode,
             languages_container,
             ft.Divider(),
+            ft.Text("Запуск і ресурси", weight=ft.FontWeight.BOLD),
+            storage_mode_dropdown,
+            launch_preset_dropdown,
+            routing_rules_field,
+            routing_rules_error,
+            ft.Text("Обмеження ресурсів (Linux)", size=12, color=ft.Colors.ON_SURFACE_VARIANT),
+            memory_limit_field,
+            cpu_weight_field,
+            pids_limit_field,
+            resource_limits_error,
+            ft.Divider(),
             notes_field,
             tags_field,
         ],
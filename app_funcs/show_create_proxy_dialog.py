@@ -88,7 +88,7 @@ def show_create_proxy_dialog(self, e):
 
             dialog.open = False
             self.page.update()
-            self.refresh_proxies()
+            self.backend.notify_proxies()
             self.show_success_dialog(f"Проксі '{proxy_name}' успішно додано")
         except Exception as ex:
             error_text.value = f"Помилка: {str(ex)}"
@@ -1,7 +1,12 @@
 import json
-from typing import List, Dict
+from typing import List
 import flet as ft
+from app_funcs.launch_preset_options import GLOBAL_PRESET_KEY
+from modules.storage_modes import PERSISTENT
+from database.models import Proxy
+from modules.resource_limits import ResourceLimits
 from modules.fingerprint import generate_user_agent
+from modules.resource_filter import RuleSyntaxError, format_rules_text, parse_rules_text
 
 
 def show_edit_profile_dialog(self, profile_id: str):
@@ -10,7 +15,7 @@ def show_edit_profile_dialog(self, profile_id: str):
     if not profile:
         return
 
-    name_field = ft.TextField(label="Назва профілю", value=profile['name'], autofocus=True)
+    name_field = ft.TextField(label="Назва профілю", value=profile.name, autofocus=True)
     os_dropdown = ft.Dropdown(
         label="Operating System",
         options=[
@@ -20,15 +25,15 @@ def show_edit_profile_dialog(self, profile_id: str):
             ft.dropdown.Option("Android"),
             ft.dropdown.Option("iOS"),
         ],
-        value=profile.get("os") or "Windows",
+        value=profile.os or "Windows",
     )
-    ua_field = ft.TextField(label="User-Agent", value=profile.get("user_agent") or "")
+    ua_field = ft.TextField(label="User-Agent", value=profile.user_agent or "")
     ua_button = ft.IconButton(icon=ft.Icons.REFRESH, tooltip="Згенерувати User-Agent")
 
     open_tabs_value = ""
-    if profile.get("open_tabs"):
+    if profile.open_tabs:
         try:
-            open_tabs_value = "\n".join(json.loads(profile.get("open_tabs")))
+            open_tabs_value = "\n".join(json.loads(profile.open_tabs))
         except Exception:
             open_tabs_value = ""
     open_tabs_field = ft.TextField(
@@ -40,8 +45,46 @@ def show_edit_profile_dialog(self, profile_id: str):
     )
     open_tabs_error = ft.Text(value="", color=ft.Colors.RED, size=12, visible=False)
 
-    notes_field = ft.TextField(label="Нотатки", value=profile.get('notes', '') or '', multiline=True, max_lines=3)
-    tags_field = ft.TextField(label="Теги (через кому)", value=profile.get('tags', '') or '')
+    notes_field = ft.TextField(label="Нотатки", value=profile.notes or '', multiline=True, max_lines=3)
+    tags_field = ft.TextField(label="Теги (через кому)", value=profile.tags or '')
+
+    limits = ResourceLimits.from_json(profile.resource_limits)
+    memory_limit_field = ft.TextField(
+        label="Пам'ять, МБ",
+        value=str(limits.memory_max_mb or ""),
+        keyboard_type=ft.KeyboardType.NUMBER,
+    )
+    cpu_weight_field = ft.TextField(
+        label="Вага CPU (1–10000, типово 100)",
+        value=str(limits.cpu_weight or ""),
+        keyboard_type=ft.KeyboardType.NUMBER,
+    )
+    pids_limit_field = ft.TextField(
+        label="Макс. процесів і потоків",
+        value=str(limits.pids_max or ""),
+        keyboard_type=ft.KeyboardType.NUMBER,
+    )
+    resource_limits_error = ft.Text(value="", color=ft.Colors.RED, size=12, visible=False)
+    routing_rules_field = ft.TextField(
+        label="Фільтрація запитів",
+        multiline=True,
+        min_lines=2,
+        max_lines=6,
+        hint_text="block image,media,font\nallow image *://cdn.example.com/*\nblock * *://*.ads.example/*",
+        helper_text="Перше правило, що збіглося, вирішує; решта запитів дозволені",
+        value=format_rules_text(profile.routing_rules),
+    )
+    routing_rules_error = ft.Text(value="", color=ft.Colors.RED, size=12, visible=False)
+    storage_mode_dropdown = ft.Dropdown(
+        label="Тип профілю",
+        options=self.storage_mode_options(),
+        value=profile.storage_mode or PERSISTENT,
+    )
+    launch_preset_dropdown = ft.Dropdown(
+        label="Пресет запуску",
+        options=self.launch_preset_options(include_global=True),
+        value=profile.launch_preset or GLOBAL_PRESET_KEY,
+    )
 
     timezone_options = [
         "UTC",
@@ -59,7 +102,7 @@ def show_edit_profile_dialog(self, profile_id: str):
     ]
 
     timezone_mode = ft.RadioGroup(
-        value=profile.get("timezone_mode") or "ip",
+        value=profile.timezone_mode or "ip",
         content=ft.Column(
             [
                 ft.Radio(value="ip", label="На основі IP"),
@@ -72,12 +115,12 @@ def show_edit_profile_dialog(self, profile_id: str):
     timezone_dropdown = ft.Dropdown(
         label="Часовий пояс",
         options=[ft.dropdown.Option(tz) for tz in timezone_options],
-        value=profile.get("timezone_value"),
-        visible=(profile.get("timezone_mode") == "custom"),
+        value=profile.timezone_value,
+        visible=(profile.timezone_mode == "custom"),
     )
 
     geolocation_mode = ft.RadioGroup(
-        value=profile.get("geolocation_mode") or "ip",
+        value=profile.geolocation_mode or "ip",
         content=ft.Column(
             [
                 ft.Radio(value="ip", label="На основі IP"),
@@ -90,18 +133,18 @@ def show_edit_profile_dialog(self, profile_id: str):
     geo_lat_field = ft.TextField(
         label="Latitude",
         keyboard_type=ft.KeyboardType.NUMBER,
-        value=str(profile.get("geolocation_lat")) if profile.get("geolocation_lat") is not None else "",
-        visible=(profile.get("geolocation_mode") == "manual"),
+        value=str(profile.geolocation_lat) if profile.geolocation_lat is not None else "",
+        visible=(profile.geolocation_mode == "manual"),
     )
     geo_lon_field = ft.TextField(
         label="Longitude",
         keyboard_type=ft.KeyboardType.NUMBER,
-        value=str(profile.get("geolocation_lon")) if profile.get("geolocation_lon") is not None else "",
-        visible=(profile.get("geolocation_mode") == "manual"),
+        value=str(profile.geolocation_lon) if profile.geolocation_lon is not None else "",
+        visible=(profile.geolocation_mode == "manual"),
     )
 
     language_mode = ft.RadioGroup(
-        value=profile.get("language_mode") or "ip",
+        value=profile.language_mode or "ip",
         content=ft.Column(
             [
                 ft.Radio(value="ip", label="На основі IP"),
@@ -116,9 +159,9 @@ def show_edit_profile_dialog(self, profile_id: str):
     ]
 
     selected_languages = []
-    if profile.get("languages"):
+    if profile.languages:
         try:
-            selected_languages = json.loads(profile.get("languages"))
+            selected_languages = json.loads(profile.languages)
         except Exception:
             selected_languages = []
 
@@ -126,11 +169,11 @@ def show_edit_profile_dialog(self, profile_id: str):
         ft.Checkbox(label=lang, value=lang in selected_languages)
         for lang in language_options
     ]
-    languages_container = ft.Column(language_checkboxes, visible=(profile.get("language_mode") == "custom"), spacing=5)
+    languages_container = ft.Column(language_checkboxes, visible=(profile.language_mode == "custom"), spacing=5)
 
     # Проксі
     proxies = self.db.get_all_proxies()
-    proxy_mode_value = "saved" if profile.get("proxy_id") else "none"
+    proxy_mode_value = "saved" if profile.proxy_id else "none"
     proxy_mode = ft.RadioGroup(
         value=proxy_mode_value,
         content=ft.Column(
@@ -176,20 +219,20 @@ def show_edit_profile_dialog(self, profile_id: str):
         visible=False,
     )
 
-    def format_proxy_label(proxy: Dict) -> str:
-        name = proxy.get("name") or ""
-        host = proxy.get("host") or ""
-        port = proxy.get("port")
+    def format_proxy_label(proxy: Proxy) -> str:
+        name = proxy.name or ""
+        host = proxy.host or ""
+        port = proxy.port
         host_port = f"{host}:{port}" if host and port else ""
         if host_port and host_port not in name:
             return f"{name} ({host_port})" if name else host_port
         return name or host_port
 
-    selected_saved_proxy_id = {"value": str(profile.get("proxy_id")) if profile.get("proxy_id") else (str(proxies[0]["id"]) if proxies else None)}
+    selected_saved_proxy_id = {"value": str(profile.proxy_id) if profile.proxy_id else (str(proxies[0].id) if proxies else None)}
     selected_saved_proxy_label = ""
     if selected_saved_proxy_id["value"]:
         for p in proxies:
-            if str(p["id"]) == selected_saved_proxy_id["value"]:
+            if str(p.id) == selected_saved_proxy_id["value"]:
                 selected_saved_proxy_label = format_proxy_label(p)
                 break
 
@@ -222,10 +265,10 @@ def show_edit_profile_dialog(self, profile_id: str):
             padding=5,
         )
 
-        def proxy_subtitle(proxy: Dict) -> str:
-            name = proxy.get("name") or ""
-            host = proxy.get("host") or ""
-            port = proxy.get("port")
+        def proxy_subtitle(proxy: Proxy) -> str:
+            name = proxy.name or ""
+            host = proxy.host or ""
+            port = proxy.port
             host_port = f"{host}:{port}" if host and port else ""
             if host_port and host_port not in name:
                 return host_port
@@ -235,9 +278,9 @@ def show_edit_profile_dialog(self, profile_id: str):
             q = (query or "").strip().lower()
             filtered = []
             for proxy in proxies:
-                name = (proxy.get("name") or "").lower()
-                host = (proxy.get("host") or "").lower()
-                port = str(proxy.get("port") or "")
+                name = (proxy.name or "").lower()
+                host = (proxy.host or "").lower()
+                port = str(proxy.port or "")
                 if not q or q in name or q in host or q in port:
                     filtered.append(proxy)
 
@@ -246,14 +289,14 @@ def show_edit_profile_dialog(self, profile_id: str):
                 tiles.append(
                     ft.ListTile(
                         leading=ft.Container(
-                            content=ft.Text(str(p.get("id", "")), size=11, color=ft.Colors.ON_SURFACE_VARIANT),
+                            content=ft.Text(str(p.id), size=11, color=ft.Colors.ON_SURFACE_VARIANT),
                             bgcolor=ft.Colors.SURFACE_CONTAINER_HIGHEST,
                             padding=ft.Padding(6, 2, 6, 2),
                             border_radius=6,
                         ),
                         title=ft.Text(format_proxy_label(p)),
                         subtitle=ft.Text(proxy_subtitle(p)) if proxy_subtitle(p) else None,
-                        on_click=lambda e, pid=p["id"], label=format_proxy_label(p): select_proxy(pid, label),
+                        on_click=lambda e, pid=p.id, label=format_proxy_label(p): select_proxy(pid, label),
                     )
                 )
                 tiles.append(ft.Divider(height=1))
@@ -409,6 +452,24 @@ def show_edit_profile_dialog(self, profile_id: str):
         if language_mode.value == "custom" and not get_selected_languages():
             is_valid = False
 
+        # Правила фільтрації запитів
+        try:
+            parse_rules_text(routing_rules_field.value or "")
+            routing_rules_error.visible = False
+        except RuleSyntaxError as ex:
+            routing_rules_error.value = f"Некоректне правило в рядку {ex.line}"
+            routing_rules_error.visible = True
+            is_valid = False
+
+        # Обмеження ресурсів
+        try:
+            self.parse_resource_limits(memory_limit_field.value, cpu_weight_field.value, pids_limit_field.value)
+            resource_limits_error.visible = False
+        except ValueError as ex:
+            resource_limits_error.value = str(ex)
+            resource_limits_error.visible = True
+            is_valid = False
+
         # Проксі
         if proxy_mode.value == "manual":
             proxy_host_field.error_text = None
@@ -471,10 +532,14 @@ def show_edit_profile_dialog(self, profile_id: str):
 
         open_tabs = self.parse_open_tabs(open_tabs_field.value or "")
         languages = get_selected_languages()
+        resource_limits = self.parse_resource_limits(
+            memory_limit_field.value, cpu_weight_field.value, pids_limit_field.value
+        )
+        routing_rules = parse_rules_text(routing_rules_field.value or "")
 
         self.db.update_profile(
             profile_id=profile_id,
-            name=name_field.value.strip() or profile["name"],
+            name=name_field.value.strip() or profile.name,
             notes=notes_field.value or "",
             proxy_id=proxy_id,
             tags=tags_field.value or "",
@@ -488,11 +553,15 @@ def show_edit_profile_dialog(self, profile_id: str):
             geolocation_lon=float(geo_lon_field.value) if geolocation_mode.value == "manual" else None,
             language_mode=language_mode.value,
             languages=json.dumps(languages, ensure_ascii=False) if language_mode.value == "custom" else None,
+            resource_limits=resource_limits.to_json() or "",
+            launch_preset="" if launch_preset_dropdown.value == GLOBAL_PRESET_KEY else launch_preset_dropdown.value,
+            routing_rules=json.dumps(routing_rules) if routing_rules else "",
+            storage_mode="" if storage_mode_dropdown.value == PERSISTENT else storage_mode_dropdown.value,
         )
 
         dialog.open = False
         self.page.update()
-        self.refresh_profiles()
+        self.backend.notify_profiles()
 
     def on_field_change(e):
         validate_form()
@@ -516,6 +585,10 @@ def show_edit_profile_dialog(self, profile_id: str):
     language_mode.on_change = lambda e: (update_visibility(), validate_form())
     for cb in language_checkboxes:
         cb.on_change = on_field_change
+    memory_limit_field.on_change = on_field_change
+    cpu_weight_field.on_change = on_field_change
+    pids_limit_field.on_change = on_field_change
+    routing_rules_field.on_change = on_field_change
 
     ua_field.expand = True
 
@@ -570,6 +643,17 @@ def show_edit_profile_dialog(self, profile_id: str):
             language_mode,
             languages_container,
             ft.Divider(),
+            ft.Text("Запуск і ресурси", weight=ft.FontWeight.BOLD),
+            storage_mode_dropdown,
+            launch_preset_dropdown,
+            routing_rules_field,
+            routing_rules_error,
+            ft.Text("Обмеження ресурсів (Linux)", size=12, color=ft.Colors.ON_SURFACE_VARIANT),
+            memory_limit_field,
+            cpu_weight_field,
+            pids_limit_field,
+            resource_limits_error,
+            ft.Divider(),
             notes_field,
             tags_field,
         ],
@@ -9,7 +9,7 @@ def show_edit_proxy_dialog(self, proxy_id: int):
 
     name_field = ft.TextField(
         label="Назва проксі",
-        value=proxy['name'],
+        value=proxy.name,
         autofocus=True
     )
     type_field = ft.Dropdown(
@@ -20,24 +20,24 @@ def show_edit_proxy_dialog(self, proxy_id: int):
             ft.dropdown.Option("socks4", "SOCKS4"),
             ft.dropdown.Option("socks5", "SOCKS5"),
         ],
-        value=proxy['type'],
+        value=proxy.type,
     )
     host_field = ft.TextField(
         label="IP адреса або хост",
-        value=proxy['host']
+        value=proxy.host
     )
     port_field = ft.TextField(
         label="Порт",
-        value=str(proxy['port']),
+        value=str(proxy.port),
         keyboard_type=ft.KeyboardType.NUMBER
     )
     username_field = ft.TextField(
         label="Логін (опціонально)",
-        value=proxy.get('username') or ''
+        value=proxy.username or ''
     )
     password_field = ft.TextField(
         label="Пароль (опціонально)",
-        value=proxy.get('password') or '',
+        value=proxy.password or '',
         password=True,
         can_reveal_password=True
     )
@@ -94,7 +94,7 @@ def show_edit_proxy_dialog(self, proxy_id: int):
 
             dialog.open = False
             self.page.update()
-            self.refresh_proxies()
+            self.backend.notify_proxies()
             self.show_success_dialog(f"Проксі '{proxy_name}' успішно оновлено")
         except Exception as ex:
             error_text.value = f"Помилка: {str(ex)}"
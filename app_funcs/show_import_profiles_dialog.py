@@ -0,0 +1,21 @@
+def show_import_profiles_dialog(self, e):
+    """Показує діалог імпорту профілів з CSV/JSONL."""
+    try:
+        import tkinter as tk
+        from tkinter import filedialog
+
+        root = tk.Tk()
+        root.withdraw()
+        root.attributes("-topmost", True)
+        file_path = filedialog.askopenfilename(
+            title="Виберіть файл з профілями",
+            filetypes=[("CSV / JSONL", "*.csv *.jsonl"), ("CSV", "*.csv"), ("JSONL", "*.jsonl")]
+        )
+        root.destroy()
+
+        if not file_path:
+            return
+
+        self.import_profiles_from_file(file_path)
+    except Exception as ex:
+        self.show_error_dialog(f"Помилка відкриття діалогу файлу: {ex}")
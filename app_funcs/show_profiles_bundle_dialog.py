@@ -0,0 +1,32 @@
+def show_profiles_bundle_dialog(self, e, export: bool = True):
+    """Показує діалог вибору файлу для експорту або імпорту архіву профілів."""
+    try:
+        import tkinter as tk
+        from tkinter import filedialog
+
+        root = tk.Tk()
+        root.withdraw()
+        root.attributes("-topmost", True)
+        filetypes = [("Архів профілів", "*.tar")]
+        if export:
+            file_path = filedialog.asksaveasfilename(
+                title="Зберегти архів профілів",
+                defaultextension=".tar",
+                filetypes=filetypes,
+            )
+        else:
+            file_path = filedialog.askopenfilename(
+                title="Виберіть архів профілів",
+                filetypes=filetypes,
+            )
+        root.destroy()
+
+        if not file_path:
+            return
+
+        if export:
+            self.export_profiles_bundle(file_path)
+        else:
+            self.import_profiles_bundle(file_path)
+    except Exception as ex:
+        self.show_error_dialog(f"Помилка відкриття діалогу файлу: {ex}")
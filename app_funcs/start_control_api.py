@@ -0,0 +1,46 @@
+from modules.control_api import ControlAPIServer, generate_token
+
+
+def start_control_api(self):
+    """Запускає локальний HTTP/JSON API керування профілями.
+
+    API один на процес і зберігається в бекенді, тож сесії, відкриті
+    пізніше, не намагаються зайняти той самий порт.
+    """
+    if self.backend.control_api is not None:
+        return
+
+    try:
+        port = int(self.db.get_setting("api_port", "8765"))
+    except ValueError:
+        port = 8765
+
+    # API без токена не працює; згенерований токен зберігається, щоб його
+    # могли прочитати CLI та налаштування
+    token = self.db.get_setting("api_token")
+    if not token:
+        token = generate_token()
+        self.db.set_setting("api_token", token)
+
+    # API повертає CDP-адреси, тому нові запуски відкривають порт налагодження
+    self.browser_manager.enable_cdp = True
+    control_api = self.backend.control_api = ControlAPIServer(
+        self.adb,
+        self.browser_manager,
+        self.start_profile,
+        port=port,
+        token=token,
+        on_change=self.backend.notify_profiles,
+        resource_monitor=self.resource_monitor,
+        launch_scheduler=self.launch_scheduler,
+    )
+
+    async def _start():
+        try:
+            await control_api.start()
+        except OSError as ex:
+            if self.backend.control_api is control_api:
+                self.backend.control_api = None
+            self.show_error_dialog(f"Не вдалося запустити API на порту {port}: {ex}")
+
+    self.page.run_task(_start)
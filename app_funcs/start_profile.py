@@ -0,0 +1,87 @@
+import json
+from typing import List, Optional
+
+
+async def start_profile(self, profile_id: str, headless: bool = False, priority: int = 0,
+                        tabs: Optional[List[str]] = None):
+    """Запускає профіль за ID та відкриває його стартові вкладки.
+
+    Запуск проходить через планувальник: якщо досягнуто ліміту запущених
+    профілів або бракує вільної пам'яті, профіль чекає в черзі.
+    Якщо передано tabs, вони відкриваються замість стартових вкладок.
+
+    Returns:
+        BrowserContext запущеного профілю.
+    """
+    profile = await self.adb.get_profile_by_id(profile_id)
+    proxy_data = None
+    if profile and profile.proxy_id:
+        proxy_data = await self.adb.get_proxy_by_id(profile.proxy_id)
+
+    profile_settings = {}
+    if profile:
+        default_preset = await self.adb.get_setting("launch_preset", "default")
+        profile_settings = self.build_profile_launch_settings(profile, default_preset)
+
+    context = await self.launch_scheduler.submit(
+        profile_id,
+        lambda: self.browser_manager.launch_profile(
+            profile_id,
+            proxy_data,
+            headless=headless,
+            profile_settings=profile_settings
+        ),
+        priority=priority,
+    )
+
+    # Вкладки, збережені під час автозупинки неактивного профілю,
+    # відкриваються замість стартових і лише один раз
+    idle_tabs_key = f"idle_tabs:{profile_id}"
+    saved_tabs = await self.adb.get_setting(idle_tabs_key)
+    if tabs:
+        if saved_tabs:
+            await self.adb.delete_setting(idle_tabs_key)
+    elif saved_tabs:
+        await self.adb.delete_setting(idle_tabs_key)
+        try:
+            tabs = json.loads(saved_tabs)
+        except Exception:
+            tabs = []
+    elif profile and profile.open_tabs:
+        try:
+            tabs = json.loads(profile.open_tabs)
+        except Exception:
+            tabs = []
+
+    # Відкриваємо стартові вкладки
+    if tabs:
+        try:
+            pages = context.pages
+            if pages:
+                page = pages[0]
+            else:
+                page = await context.new_page()
+
+            await page.goto(tabs[0])
+            try:
+                await page.evaluate(
+                    """() => { window.moveTo(0,0); window.resizeTo(screen.availWidth, screen.availHeight); }"""
+                )
+            except Exception:
+                pass
+
+            for url in tabs[1:]:
+                await page.evaluate("url => window.open(url, '_blank')", url)
+        except Exception as ex:
+            print(f"Помилка відкриття вкладок: {ex}")
+    else:
+        pages = context.pages
+        if pages:
+            try:
+                await pages[0].evaluate(
+                    """() => { window.moveTo(0,0); window.resizeTo(screen.availWidth, screen.availHeight); }"""
+                )
+            except Exception:
+                pass
+
+    return context
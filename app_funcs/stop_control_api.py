@@ -0,0 +1,13 @@
+def stop_control_api(self):
+    """Зупиняє локальний API керування профілями."""
+    control_api = self.backend.control_api
+    if not control_api:
+        return
+
+    self.backend.control_api = None
+    self.browser_manager.enable_cdp = False
+
+    async def _stop():
+        await control_api.stop()
+
+    self.page.run_task(_stop)
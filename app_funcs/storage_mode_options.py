@@ -0,0 +1,16 @@
+from typing import List
+
+import flet as ft
+
+from modules.storage_modes import EPHEMERAL, EPHEMERAL_STATE, PERSISTENT
+
+STORAGE_MODE_LABELS = {
+    PERSISTENT: "Постійний (окремий браузер і папка профілю)",
+    EPHEMERAL: "Тимчасовий (спільний браузер, стан лише в пам'яті)",
+    EPHEMERAL_STATE: "Тимчасовий зі збереженням cookies і localStorage",
+}
+
+
+def storage_mode_options(self) -> List[ft.dropdown.Option]:
+    """Повертає варіанти типу профілю для випадаючого списку."""
+    return [ft.dropdown.Option(key, label) for key, label in STORAGE_MODE_LABELS.items()]
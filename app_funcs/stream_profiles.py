@@ -0,0 +1,26 @@
+import asyncio
+
+
+async def stream_profiles(self, batch_size: int = 200):
+    """Поступово заповнює таблицю профілів після показу першого кадру."""
+    # Запит до БД виконуємо в потоці БД, поза циклом подій UI
+    profiles = await self.adb.get_all_profiles()
+    traffic = self.traffic_meter.totals(await self.adb.get_traffic_by_profile(), by="profile")
+    leases = await self.adb.get_profile_leases(exclude_owner=self.browser_manager.leases.owner)
+
+    rows = []
+    self.profiles_table.rows = rows
+    for start in range(0, len(profiles), batch_size):
+        rows.extend(
+            self.build_profile_row(profile, traffic.get(profile.profile_id), leases.get(profile.profile_id))
+            for profile in profiles[start:start + batch_size]
+        )
+        if self.profiles_table.page:
+            self.profiles_table.update()
+        # Даємо UI обробити події між пакетами
+        await asyncio.sleep(0)
+
+    self.initial_profiles_pending = False
+    self.profiles_loading.visible = False
+    if self.profiles_loading.page:
+        self.profiles_loading.update()
@@ -0,0 +1,12 @@
+def toggle_control_api(self, e):
+    """Вмикає або вимикає локальний API та зберігає вибір."""
+    enabled = bool(e.control.value)
+    self.db.set_setting("api_enabled", "1" if enabled else "0")
+
+    if enabled:
+        self.start_control_api()
+        # Показуємо токен, створений під час першого ввімкнення
+        self.main_content.content = self.build_settings_view()
+        self.main_content.update()
+    else:
+        self.stop_control_api()
@@ -0,0 +1,3 @@
+def toggle_restore_session(self, e):
+    """Вмикає або вимикає відновлення сесії при запуску застосунку."""
+    self.db.set_setting("restore_session_on_start", "1" if e.control.value else "0")
@@ -0,0 +1,6 @@
+def toggle_traffic_accounting(self, e):
+    """Вмикає або вимикає облік трафіку для наступних запусків профілів."""
+    enabled = bool(e.control.value)
+    self.db.set_setting("traffic_accounting", "1" if enabled else "0")
+    # Уже запущені профілі продовжують рахуватися до зупинки
+    self.browser_manager.traffic_meter = self.traffic_meter if enabled else None
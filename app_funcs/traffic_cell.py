@@ -0,0 +1,20 @@
+import flet as ft
+
+
+def _format_bytes(size: int) -> str:
+    for unit in ("Б", "КБ", "МБ"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.2f} ГБ"
+
+
+def traffic_cell(self, traffic) -> ft.Text:
+    """Створює комірку сумарного трафіку (надіслано, отримано)."""
+    if not traffic or not any(traffic):
+        return ft.Text("—", color=ft.Colors.GREY)
+    sent, received = traffic
+    return ft.Text(
+        _format_bytes(sent + received),
+        tooltip=f"↑ {_format_bytes(sent)} · ↓ {_format_bytes(received)}",
+    )
@@ -0,0 +1,26 @@
+def update_proxy_check_progress(self):
+    """Оновлює прогрес поточної перевірки проксі й ховає його після завершення."""
+    progress_bar = getattr(self, 'proxy_check_progress', None)
+    summary_text = getattr(self, 'proxy_check_summary', None)
+    if progress_bar is None or summary_text is None:
+        return
+
+    statuses = [
+        (self.proxy_statuses.get(proxy_id) or {}).get('status') for proxy_id in list(self.proxy_check_run)
+    ]
+    working = statuses.count('working')
+    failed = statuses.count('failed')
+    pending = statuses.count('checking')
+    total = working + failed + pending
+
+    progress_bar.visible = pending > 0
+    progress_bar.value = (working + failed) / total if total else 0
+    summary_text.visible = pending > 0
+    summary_text.value = f"✓ Працюють: {working}   ✗ Не працюють: {failed}   … Очікують: {pending}"
+
+    for control in (progress_bar, summary_text):
+        try:
+            if control.page:
+                control.update()
+        except RuntimeError:
+            pass
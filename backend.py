@@ -0,0 +1,299 @@
+"""
+Спільний для всіх сесій Flet шар сервісів: БД, браузери, перевірка проксі.
+
+У веб-режимі ft.run(main) створює AntyDetectBrowser для кожної вкладки
+оператора. Сервіси, що володіють процесами, потоками й з'єднаннями
+(драйвер Playwright, монітор ресурсів, черга запусків, оренди профілів,
+API керування), створюються один раз на процес у Backend, а сесії лише
+підписуються на його події змін і перемальовують свій UI.
+"""
+from __future__ import annotations
+
+import asyncio
+import atexit
+import json
+import threading
+import time
+from typing import Awaitable, Callable, List, Optional, Set
+
+from browser_logic import BrowserManager
+from database.async_db import AsyncDatabase
+from database.db_handler import Database
+from modules.launch_scheduler import LaunchScheduler
+from modules.process_monitor import ResourceMonitor
+from modules.profile_leases import LeaseManager
+from modules.proxy_checker import PlaywrightProxyChecker
+from modules.traffic_meter import TrafficMeter
+
+# Як часто сесії отримують подію "tick" для оновлення статусів, с
+STATUS_INTERVAL = 2.0
+# Періоди фонових задач: автозупинки, сторожа браузерів і збереження сесії, с
+IDLE_CHECK_INTERVAL = 60
+WATCHDOG_INTERVAL = 30
+SESSION_SAVE_INTERVAL = 15
+
+# Теми подій змін
+PROFILES = "profiles"
+PROXIES = "proxies"
+TICK = "tick"
+
+# Таблиці, зміни яких сесії мають показати, за темами подій
+TOPIC_TABLES = {
+    PROFILES: {"profiles", "traffic_stats", "profile_leases"},
+    PROXIES: {"proxies"},
+}
+
+
+class ChangeEvents:
+    """Розсилка подій змін підписаним сесіям."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: List[Callable[[str], None]] = []
+
+    def subscribe(self, callback: Callable[[str], None]) -> Callable[[], None]:
+        """Підписує callback(topic) на події; повертає функцію відписки."""
+        with self._lock:
+            self._subscribers = [*self._subscribers, callback]
+
+        def unsubscribe() -> None:
+            with self._lock:
+                self._subscribers = [cb for cb in self._subscribers if cb is not callback]
+
+        return unsubscribe
+
+    def publish(self, topic: str) -> None:
+        """Повідомляє всіх підписників; помилка однієї сесії не зачіпає інших."""
+        for callback in self._subscribers:
+            try:
+                callback(topic)
+            except Exception as e:
+                print(f"Помилка обробника події {topic}: {e}")
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+
+class Backend:
+    """Сервіси застосунку, спільні для всіх сесій процесу."""
+
+    def __init__(self, db_path: str = "browser_profiles.db", profiles_dir: str = "profiles"):
+        self.db = Database(db_path)
+        # Доступ до БД з корутин (run_task) через окремий потік БД
+        self.adb = AsyncDatabase(self.db)
+        self.events = ChangeEvents()
+
+        self.browser_manager = BrowserManager(profiles_dir)
+        # cgroup профілів готується до запуску драйвера Playwright і браузерів,
+        # поки в групі застосунку немає інших процесів, і лише якщо обмеження
+        # ресурсів задано хоч одному профілю
+        if self.db.has_resource_limits():
+            self.browser_manager.process_limiter.prepare()
+        # Браузери й блокування профілів, що лишилися після аварійного завершення
+        self.browser_manager.reap_orphans()
+        # Оренди профілів не дають іншому екземпляру запустити той самий профіль
+        self.browser_manager.leases = LeaseManager(self.db, self.browser_manager.profiles_dir)
+        self.browser_manager.leases.start()
+
+        self.proxy_checker = PlaywrightProxyChecker()
+        # Фонове зчитування RSS/CPU дерев процесів запущених профілів
+        self.resource_monitor = ResourceMonitor(self.browser_manager.get_browser_pids)
+        self.resource_monitor.start()
+        # Черга запусків з лімітами кількості профілів і вільної пам'яті
+        self.launch_scheduler = LaunchScheduler(self.browser_manager, on_change=self.notify_profiles)
+        # Лічильники трафіку в пам'яті, що пакетами записуються в traffic_stats
+        self.traffic_meter = TrafficMeter(self.db)
+        self.traffic_meter.start()
+        if self.db.get_setting("traffic_accounting", "0") == "1":
+            self.browser_manager.traffic_meter = self.traffic_meter
+
+        # Оренди інших екземплярів; перечитуються для всіх сесій лише після змін
+        self.remote_leases = self.browser_manager.leases.leased_elsewhere()
+        # Локальний API керування слухає один порт на процес
+        self.control_api = None
+        self.sessions = 0
+        self._started: set = set()
+        # Фонові задачі процесу; належать бекенду, а не сесії, що їх запустила
+        self._tasks: Set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._ticker = threading.Thread(target=self._tick, name="status-ticker", daemon=True)
+        self._ticker.start()
+
+        # atexit виконує обробники у зворотному порядку: оренди звільняються після зупинки браузерів
+        atexit.register(self.browser_manager.leases.stop)
+        atexit.register(self.browser_manager.cleanup_sync)
+        atexit.register(self.proxy_checker.close)
+        atexit.register(self.adb.close)
+        atexit.register(self.resource_monitor.stop)
+        atexit.register(self.traffic_meter.stop)
+        atexit.register(self._stop.set)
+
+    def notify_profiles(self) -> None:
+        """Повідомляє сесії про зміну профілів чи їхніх статусів."""
+        self.events.publish(PROFILES)
+
+    def notify_proxies(self) -> None:
+        """Повідомляє сесії про зміну проксі."""
+        self.events.publish(PROXIES)
+
+    def start_once(self, name: str) -> bool:
+        """Повертає True лише для першого виклику з цим name у процесі.
+
+        Так фонові задачі (автозупинка, сторож, збереження сесії) запускає
+        перша сесія, а решта їх не дублюють.
+        """
+        with self._lock:
+            if name in self._started:
+                return False
+            self._started.add(name)
+            return True
+
+    def attach(self) -> int:
+        """Реєструє нову сесію; повертає кількість активних сесій."""
+        with self._lock:
+            self.sessions += 1
+            return self.sessions
+
+    def detach(self) -> int:
+        """Знімає сесію з обліку; повертає кількість сесій, що лишилися."""
+        with self._lock:
+            self.sessions = max(0, self.sessions - 1)
+            return self.sessions
+
+    async def start_watchers(self, *startup: Awaitable) -> None:
+        """Запускає фонові задачі процесу в циклі подій, де працює Playwright.
+
+        Задачі належать бекенду й працюють зі спільними сервісами, тож
+        закриття вкладки сесії, що їх запустила, їх не зупиняє. Результати
+        доходять до всіх сесій через події змін. startup — одноразові
+        корутини (як-от відновлення сесії), що виконуються так само.
+        """
+        for coro in (self.watch_idle_profiles(), self.watch_hung_profiles(), self.watch_session(), *startup):
+            task = asyncio.create_task(coro)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _read_idle_timeout(self) -> int:
+        """Читає тайм-аут автозупинки в хвилинах і передає його менеджеру браузерів.
+
+        Введення на сторінках менеджер відстежує лише поки автозупинку увімкнено.
+        """
+        try:
+            minutes = max(int(await self.adb.get_setting("idle_timeout_minutes", "0")), 0)
+        except ValueError:
+            minutes = 0
+        await self.browser_manager.set_idle_timeout(minutes * 60)
+        return minutes
+
+    async def watch_idle_profiles(self) -> None:
+        """Періодично зупиняє неактивні профілі, зберігаючи їхні вкладки."""
+        await self._read_idle_timeout()
+        while True:
+            await asyncio.sleep(IDLE_CHECK_INTERVAL)
+            minutes = await self._read_idle_timeout()
+            if minutes <= 0:
+                continue
+
+            try:
+                stopped = await self.browser_manager.stop_idle_profiles(minutes * 60)
+            except Exception as ex:
+                print(f"Помилка автозупинки профілів: {ex}")
+                continue
+
+            for profile_id, tabs in stopped.items():
+                if tabs:
+                    # Вкладки відкриються при наступному запуску профілю
+                    await self.adb.set_setting(f"idle_tabs:{profile_id}", json.dumps(tabs, ensure_ascii=False))
+                print(f"Профіль {profile_id} зупинено після {minutes} хв неактивності")
+
+            if stopped:
+                self.notify_profiles()
+
+    async def watch_hung_profiles(self) -> None:
+        """Періодично перевіряє, чи відповідають браузери, і завершує завислі."""
+        while True:
+            await asyncio.sleep(WATCHDOG_INTERVAL)
+            try:
+                recovered = await self.browser_manager.recover_hung_profiles()
+            except Exception as ex:
+                print(f"Помилка перевірки браузерів: {ex}")
+                continue
+
+            if recovered:
+                self.notify_profiles()
+
+    async def watch_session(self) -> None:
+        """Періодично зберігає запущені профілі та їхні вкладки для відновлення сесії.
+
+        Сесія пишеться в налаштування "session" лише при змінах. Під час
+        завершення застосунку не оновлюється, тож після оновлення чи збою
+        лишається останній робочий набір профілів.
+        """
+        saved = await self.adb.get_setting("session", "[]")
+        while True:
+            await asyncio.sleep(SESSION_SAVE_INTERVAL)
+            if self.browser_manager.closing:
+                continue
+            session = json.dumps(self.browser_manager.session_snapshot(), ensure_ascii=False)
+            if session == saved:
+                continue
+            try:
+                await self.adb.set_setting("session", session)
+                saved = session
+            except Exception as ex:
+                print(f"Помилка збереження сесії: {ex}")
+
+    def tick(self) -> None:
+        """Один такт оновлення статусів.
+
+        Зміни в БД (зокрема з інших процесів) визначаються через
+        Database.poll_changes: у простої це один PRAGMA data_version без
+        жодного запиту до таблиць. Сесії отримують подію лише для змінених
+        таблиць або "tick", поки є запущені чи поставлені в чергу профілі,
+        чиї статуси й ресурси змінюються без запису в БД.
+        """
+        try:
+            changed = self.db.poll_changes()
+        except Exception as e:
+            print(f"Помилка перевірки змін БД: {e}")
+            changed = set()
+
+        now = time.time()
+        if "profile_leases" in changed:
+            try:
+                self.remote_leases = self.browser_manager.leases.leased_elsewhere()
+            except Exception as e:
+                print(f"Помилка читання оренд профілів: {e}")
+        elif any(lease["expires_at"] <= now for lease in self.remote_leases.values()):
+            # Оренда екземпляра, що аварійно завершився, спливає без запису в БД
+            self.remote_leases = {
+                profile_id: lease for profile_id, lease in self.remote_leases.items()
+                if lease["expires_at"] > now
+            }
+            changed.add("profile_leases")
+
+        topics = [topic for topic, tables in TOPIC_TABLES.items() if changed & tables]
+        for topic in topics:
+            self.events.publish(topic)
+        if not topics and (self.browser_manager.running_browsers or self.launch_scheduler.queued_ids()):
+            self.events.publish(TICK)
+
+    def _tick(self) -> None:
+        # Один потік на процес замість окремого опитувача для кожної сесії
+        while not self._stop.wait(STATUS_INTERVAL):
+            if len(self.events):
+                self.tick()
+
+
+_backend: Optional[Backend] = None
+_backend_lock = threading.Lock()
+
+
+def get_backend() -> Backend:
+    """Повертає спільний Backend процесу, створюючи його при першому виклику."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = Backend()
+        return _backend
@@ -0,0 +1,92 @@
+"""
+Бенчмарк пам'яті постійних і тимчасових профілів.
+
+Запускає N профілів кожного типу в тимчасовій папці, відкриває в кожному
+однакову вкладку й вимірює сумарний RSS усіх процесів браузерів (нащадків
+цього процесу) через /proc та час запуску одного профілю. Постійні профілі
+мають власний Chromium і папку, тимчасові — контекст у спільному браузері.
+Лише Linux, потрібні Playwright і Chromium.
+
+Запуск (з кореня репозиторію):
+    python benchmarks/ephemeral_profiles_benchmark.py --profiles 20 --url https://example.com
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from browser_logic import BrowserManager  # noqa: E402
+from modules.process_monitor import _read_stat, proc_available, process_tree  # noqa: E402
+from modules.storage_modes import EPHEMERAL, PERSISTENT  # noqa: E402
+
+
+def descendants_rss() -> int:
+    """Сумарний RSS нащадків цього процесу (драйвер Playwright і браузери)."""
+    total = 0
+    for pid in process_tree(os.getpid())[1:]:
+        stat = _read_stat(pid)
+        if stat is not None:
+            total += stat[2]
+    return total
+
+
+async def measure_mode(storage_mode, args):
+    with tempfile.TemporaryDirectory() as profiles_dir:
+        manager = BrowserManager(profiles_dir=profiles_dir)
+        launch_times = []
+        try:
+            for index in range(args.profiles):
+                started = time.perf_counter()
+                context = await manager.launch_profile(
+                    f"bench-{index}",
+                    headless=args.headless,
+                    profile_settings={"storage_mode": storage_mode},
+                )
+                launch_times.append(time.perf_counter() - started)
+                page = context.pages[0] if context.pages else await context.new_page()
+                await page.goto(args.url)
+
+            # Даємо фоновим процесам браузера завершити старт
+            await asyncio.sleep(args.settle)
+            rss = descendants_rss()
+            processes = len(process_tree(os.getpid())) - 1
+        finally:
+            await manager.cleanup()
+
+    return {
+        "mb_per_profile": rss / 1024 / 1024 / args.profiles,
+        "processes": processes,
+        "launch_ms": sum(launch_times) / len(launch_times) * 1000,
+    }
+
+
+async def run(args):
+    return {mode: await measure_mode(mode, args) for mode in (PERSISTENT, EPHEMERAL)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=20)
+    parser.add_argument("--url", default="https://example.com")
+    parser.add_argument("--settle", type=float, default=10.0, help="Пауза перед заміром, с")
+    parser.add_argument("--headless", action="store_true")
+    args = parser.parse_args()
+
+    if not proc_available():
+        sys.exit("Потрібен Linux з /proc")
+
+    results = asyncio.run(run(args))
+
+    print(f"{args.profiles} профілів, по одній вкладці")
+    print(f"{'':12}{'RSS/профіль':>14}{'процесів':>10}{'запуск':>12}")
+    for mode, r in results.items():
+        print(f"{mode:12}{r['mb_per_profile']:>11.0f} МБ{r['processes']:>10}{r['launch_ms']:>9.0f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Бенчмарк пам'яті профілю: стандартний пресет запуску проти low_memory.
+
+Для кожного пресету запускає N профілів у тимчасовій папці, відкриває в
+кожному однакові вкладки, чекає стабілізації й вимірює RSS дерева процесів
+браузера через /proc (лише Linux, потрібні Playwright і Chromium).
+
+Запуск (з кореня репозиторію):
+    python benchmarks/launch_preset_benchmark.py --profiles 5 --tabs 3 \
+        --url https://example.com --url https://wikipedia.org
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from browser_logic import BrowserManager  # noqa: E402
+from modules.launch_presets import LAUNCH_PRESETS  # noqa: E402
+from modules.process_monitor import ResourceMonitor, proc_available  # noqa: E402
+
+DEFAULT_URLS = ["https://example.com"]
+
+
+async def measure_preset(preset, args):
+    with tempfile.TemporaryDirectory() as profiles_dir:
+        manager = BrowserManager(profiles_dir=profiles_dir)
+        monitor = ResourceMonitor(manager.get_browser_pids)
+        urls = args.url or DEFAULT_URLS
+        try:
+            for index in range(args.profiles):
+                profile_id = f"bench-{index}"
+                context = await manager.launch_profile(
+                    profile_id,
+                    headless=args.headless,
+                    profile_settings={"launch_preset": preset},
+                )
+                page = context.pages[0] if context.pages else await context.new_page()
+                await page.goto(urls[0])
+                for tab in range(1, args.tabs):
+                    extra = await context.new_page()
+                    await extra.goto(urls[tab % len(urls)])
+
+            # Даємо фоновим процесам браузера завершити старт
+            await asyncio.sleep(args.settle)
+            samples = monitor.sample()
+        finally:
+            await manager.cleanup()
+
+    rss = [stats.rss_bytes / 1024 / 1024 for stats in samples.values()]
+    processes = [stats.children + 1 for stats in samples.values()]
+    return {
+        "profiles": len(rss),
+        "mean_mb": statistics.mean(rss) if rss else 0.0,
+        "max_mb": max(rss) if rss else 0.0,
+        "processes": statistics.mean(processes) if processes else 0.0,
+    }
+
+
+async def run(args):
+    results = {}
+    for preset in args.preset or list(LAUNCH_PRESETS):
+        results[preset] = await measure_preset(preset, args)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=5)
+    parser.add_argument("--tabs", type=int, default=3)
+    parser.add_argument("--url", action="append", help="Адреса вкладки (можна кілька разів)")
+    parser.add_argument("--preset", action="append", choices=list(LAUNCH_PRESETS))
+    parser.add_argument("--settle", type=float, default=10.0, help="Пауза перед заміром, с")
+    parser.add_argument("--headless", action="store_true")
+    args = parser.parse_args()
+
+    if not proc_available():
+        sys.exit("Потрібен Linux з /proc")
+
+    results = asyncio.run(run(args))
+
+    print(f"{args.profiles} профілів × {args.tabs} вкладок")
+    print(f"{'':14}{'RSS/профіль':>14}{'макс.':>10}{'процесів':>10}")
+    for preset, r in results.items():
+        print(f"{preset:14}{r['mean_mb']:>11.0f} МБ{r['max_mb']:>7.0f} МБ{r['processes']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Бенчмарк затримки циклу подій: синхронні виклики Database проти AsyncDatabase.
+
+Поки корутини виконують запити до БД, окрема задача-«тікер» спить по 10 мс
+і вимірює, наскільки пізніше вона прокидається. Синхронні виклики з корутин
+блокують цикл на весь час запиту, AsyncDatabase — ні.
+
+Запуск (з кореня репозиторію):
+    python benchmarks/loop_lag_benchmark.py --profiles 20000 --ops 30
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from database.async_db import AsyncDatabase  # noqa: E402
+from database.db_handler import Database  # noqa: E402
+
+TICK = 0.01
+
+
+async def ticker(lags, stop):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + TICK
+        await asyncio.sleep(TICK)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+def make_profile_dir(root):
+    path = os.path.join(root, str(uuid.uuid4()))
+    os.makedirs(path)
+    for i in range(200):
+        with open(os.path.join(path, f"f{i}"), "wb") as f:
+            f.write(b"x" * 4096)
+    return path
+
+
+async def workload(db, ops, workdir, use_async):
+    adb = AsyncDatabase(db) if use_async else None
+    for i in range(ops):
+        # Знімок профілів скидається, як після запису профілю, тож кожне
+        # читання йде на диск, а не в кеш запитів
+        db.cache.invalidate("profiles")
+        if use_async:
+            await adb.get_all_profiles()
+        else:
+            db.get_all_profiles()
+
+        path = make_profile_dir(workdir)
+        if use_async:
+            await asyncio.to_thread(shutil.rmtree, path)
+        else:
+            shutil.rmtree(path)
+        await asyncio.sleep(0)
+    if adb:
+        adb.close()
+
+
+async def measure(db, ops, workdir, use_async):
+    lags = []
+    stop = asyncio.Event()
+    tick_task = asyncio.create_task(ticker(lags, stop))
+    started = time.perf_counter()
+    await workload(db, ops, workdir, use_async)
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await tick_task
+    lags.sort()
+    return {
+        "elapsed_s": elapsed,
+        "max_ms": lags[-1] * 1000 if lags else 0.0,
+        "p95_ms": lags[int(len(lags) * 0.95)] * 1000 if lags else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=20000)
+    parser.add_argument("--ops", type=int, default=30)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db = Database(os.path.join(workdir, "bench.db"))
+        db.bulk_create_profiles(
+            {"name": f"ID_{i}", "profile_id": str(uuid.uuid4()), "os": "Windows", "open_tabs": "[]"}
+            for i in range(args.profiles)
+        )
+
+        results = {
+            "self.db (синхронно)": asyncio.run(measure(db, args.ops, workdir, use_async=False)),
+            "self.adb (потік БД)": asyncio.run(measure(db, args.ops, workdir, use_async=True)),
+        }
+
+    print(f"{args.profiles} профілів, {args.ops} операцій")
+    print(f"{'':22}{'час':>10}{'p95 затримки':>15}{'макс.':>10}")
+    for name, r in results.items():
+        print(f"{name:22}{r['elapsed_s']:>8.1f} с{r['p95_ms']:>12.1f} мс{r['max_ms']:>7.1f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Бенчмарк вартості перевірки одного запиту правилами фільтрації ресурсів.
+
+Порівнює скомпільований і кешований ResourceFilter з наївною перевіркою,
+що транслює glob-шаблони для кожного запиту, на синтетичному потоці запитів.
+Для порівняння: один перехоплений запит у Playwright коштує сотні мкс на
+обмін повідомленнями з браузером, тож перевірка має займати одиниці мкс.
+
+Запуск (з кореня репозиторію):
+    python benchmarks/resource_filter_benchmark.py --requests 200000 --rules 50
+"""
+import argparse
+import fnmatch
+import json
+import os
+import random
+import re
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from modules.resource_filter import compile_rules  # noqa: E402
+
+TYPES = ["document", "stylesheet", "image", "media", "font", "script", "xhr", "fetch", "other"]
+
+
+def make_rules(count):
+    rules = [{"action": "block", "types": ["media", "font"]}]
+    for i in range(count - 2):
+        rules.append({"action": "block", "types": [], "pattern": f"*://*.tracker{i}.example/*"})
+    rules.append({"action": "allow", "types": ["image"], "pattern": "*://cdn.example.com/*"})
+    return rules
+
+
+def make_requests(count, rule_count):
+    rng = random.Random(42)
+    hosts = ["cdn.example.com", "www.example.com", "api.example.net"]
+    hosts += [f"px.tracker{i}.example" for i in range(max(1, rule_count - 2))]
+    return [
+        (rng.choice(TYPES), f"https://{rng.choice(hosts)}/path/{i}.bin?q={i}")
+        for i in range(count)
+    ]
+
+
+def naive_should_block(rules, resource_type, url):
+    for rule in rules:
+        if rule["types"] and resource_type not in rule["types"]:
+            continue
+        if rule.get("pattern") and not re.match(fnmatch.translate(rule["pattern"]), url):
+            continue
+        return rule["action"] == "block"
+    return False
+
+
+def measure(fn, requests):
+    started = time.perf_counter()
+    blocked = 0
+    for resource_type, url in requests:
+        blocked += fn(resource_type, url)
+    elapsed = time.perf_counter() - started
+    return elapsed / len(requests) * 1e6, blocked
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200000)
+    parser.add_argument("--rules", type=int, default=50)
+    args = parser.parse_args()
+
+    rules = make_rules(max(2, args.rules))
+    requests = make_requests(args.requests, len(rules))
+    type_rules = [{"action": "block", "types": ["image", "media", "font"]}]
+
+    compiled = compile_rules(json.dumps(rules))
+    type_only = compile_rules(json.dumps(type_rules))
+    naive_requests = requests[: max(1, len(requests) // 20)]
+
+    results = {
+        "лише типи (кеш)": measure(type_only.should_block, requests),
+        f"{len(rules)} правил (кеш)": measure(compiled.should_block, requests),
+        f"{len(rules)} правил (наївно)": measure(
+            lambda t, u: naive_should_block(rules, t, u), naive_requests
+        ),
+    }
+
+    print(f"{args.requests} запитів")
+    print(f"{'':26}{'мкс/запит':>12}{'заблоковано':>14}")
+    for name, (per_request, blocked) in results.items():
+        print(f"{name:26}{per_request:>12.2f}{blocked:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Бенчмарк рядків профілів: dict(sqlite3.Row) проти типізованих Profile.
+
+Запуск (з кореня репозиторію):
+    python benchmarks/row_objects_benchmark.py --rows 100000
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from database.db_handler import Database  # noqa: E402
+from database.models import Profile  # noqa: E402
+
+PROFILES_QUERY = """
+    SELECT p.id, p.name, p.profile_id, p.notes, p.proxy_id, p.tags,
+           p.os, p.user_agent, p.open_tabs, p.timezone_mode, p.timezone_value,
+           p.geolocation_mode, p.geolocation_lat, p.geolocation_lon,
+           p.language_mode, p.languages, p.resource_limits, p.launch_preset,
+                   p.routing_rules, p.storage_mode,
+           pr.name as proxy_name, pr.type as proxy_type,
+           pr.host as proxy_host, pr.port as proxy_port
+    FROM profiles p
+    LEFT JOIN proxies pr ON p.proxy_id = pr.id
+    ORDER BY p.created_at DESC
+"""
+
+
+def load_dicts(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    rows = [dict(row) for row in conn.execute(PROFILES_QUERY)]
+    conn.close()
+    return rows
+
+
+def load_profiles(db_path):
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.row_factory = Profile.row_factory
+    rows = cursor.execute(PROFILES_QUERY).fetchall()
+    conn.close()
+    return rows
+
+
+def measure(loader, db_path, access):
+    tracemalloc.start()
+    started = time.perf_counter()
+    rows = loader(db_path)
+    loaded = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    access_started = time.perf_counter()
+    for row in rows:
+        access(row)
+    accessed = time.perf_counter()
+    return {
+        "load_s": loaded - started,
+        "access_s": accessed - access_started,
+        "retained_mb": retained / 1024 / 1024,
+        "peak_mb": peak / 1024 / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, "bench.db")
+        db = Database(db_path)
+        proxy_id = db.create_proxy("Proxy", "http", "127.0.0.1", 8080)
+        db.bulk_create_profiles(
+            {
+                "name": f"ID_{i}",
+                "profile_id": str(uuid.uuid4()),
+                "proxy_id": proxy_id,
+                "tags": "farm",
+                "os": "Windows",
+                "open_tabs": "[]",
+            }
+            for i in range(args.rows)
+        )
+
+        results = {
+            "dict(sqlite3.Row)": measure(
+                load_dicts, db_path,
+                lambda p: (p.get("name"), p.get("notes", "") or "", p.get("proxy_name"), p.get("tags", "") or ""),
+            ),
+            "Profile (__slots__)": measure(
+                load_profiles, db_path,
+                lambda p: (p.name, p.notes or "", p.proxy_name, p.tags or ""),
+            ),
+        }
+
+    print(f"{args.rows} рядків")
+    print(f"{'':22}{'завантаження':>14}{'доступ':>10}{'пам’ять':>12}{'пік':>10}")
+    for name, r in results.items():
+        print(f"{name:22}{r['load_s'] * 1000:>11.0f} мс{r['access_s'] * 1000:>7.0f} мс"
+              f"{r['retained_mb']:>9.1f} МБ{r['peak_mb']:>7.1f} МБ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Навантажувальний тест спільного бекенду: N одночасних сесій Flet.
+
+Створює N екземплярів AntyDetectBrowser із заглушками ft.Page, як це робить
+ft.run(main) для кожної вкладки оператора у веб-режимі, і для кожного N
+вимірює:
+  * кількість об'єктів бекенду (BrowserManager, перевірка проксі);
+  * кількість потоків процесу;
+  * кількість SQL-операторів за такт у простої та після запису трафіку
+    іншим процесом (окремий екземпляр Database);
+  * час такту разом з перемальовуванням таблиць у всіх сесіях.
+
+Вартість бекенду не повинна залежати від N: у простої такт — один
+PRAGMA data_version, після запису перечитується лише змінена таблиця.
+Росте тільки перемальовування UI, яке кожна сесія робить для себе.
+
+Запуск (з кореня репозиторію, потрібен встановлений Flet):
+    python benchmarks/sessions_benchmark.py --sessions 1 10 50 --profiles 500
+"""
+import argparse
+import asyncio
+import gc
+import inspect
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from types import SimpleNamespace
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+
+class StubPage:
+    """Заглушка ft.Page, що збирає задачі run_task замість їх виконання."""
+
+    def __init__(self):
+        self.window = SimpleNamespace(width=0, height=0, min_width=0, min_height=0)
+        self.overlay = []
+        self.window_alive = True
+        self.web = True
+        self.on_disconnect = None
+        self.on_close = None
+        self.tasks = []
+
+    def add(self, *controls):
+        pass
+
+    def update(self, *controls):
+        pass
+
+    def run_task(self, handler, *args):
+        self.tasks.append((handler, args))
+
+
+def count_instances(cls) -> int:
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, cls))
+
+
+async def run_tasks(pages):
+    """Виконує задачі, поставлені сесіями в чергу UI під час такту."""
+    for page in pages:
+        tasks, page.tasks = page.tasks, []
+        for handler, args in tasks:
+            result = handler(*args)
+            if inspect.isawaitable(result):
+                await result
+
+
+def measure(sessions: int, pages: list, apps: list, ticks: int) -> dict:
+    from app_core import AntyDetectBrowser
+    from backend import get_backend
+    from browser_logic import BrowserManager
+    from database.db_handler import Database
+    from modules.proxy_checker import PlaywrightProxyChecker
+
+    while len(apps) < sessions:
+        page = StubPage()
+        apps.append(AntyDetectBrowser(page))
+        pages.append(page)
+    # Початкове завантаження й фонові задачі сесій не входять у такт
+    for page in pages:
+        page.tasks.clear()
+
+    backend = get_backend()
+    # Такти виконуються вручну, фоновий потік не повинен забирати зміни
+    backend._stop.set()
+    other_process = Database()
+    statements = []
+    get_connection = backend.db.get_connection
+
+    def traced_connection():
+        conn = get_connection()
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    backend.db.get_connection = traced_connection
+    backend.db.changes._connection().set_trace_callback(statements.append)
+    try:
+        timings = {}
+        for scenario in ("idle", "write"):
+            statements.clear()
+            started = time.perf_counter()
+            for _ in range(ticks):
+                if scenario == "write":
+                    other_process.add_traffic_stats([(str(uuid.uuid4()), 0, "2000-01-01", 1, 1, 1)])
+                backend.tick()
+                asyncio.run(run_tasks(pages))
+            timings[scenario] = (len(statements) / ticks, (time.perf_counter() - started) / ticks * 1000)
+    finally:
+        del backend.db.get_connection
+        backend.db.changes._connection().set_trace_callback(None)
+
+    return {
+        "sessions": sessions,
+        "browser_managers": count_instances(BrowserManager),
+        "proxy_checkers": count_instances(PlaywrightProxyChecker),
+        "threads": threading.active_count(),
+        "idle_sql": timings["idle"][0],
+        "idle_ms": timings["idle"][1],
+        "write_sql": timings["write"][0],
+        "write_ms": timings["write"][1],
+    }
+
+
+def seed_profiles(count: int):
+    from database.db_handler import Database
+
+    Database().bulk_create_profiles(
+        {"name": f"ID_{i}", "profile_id": str(uuid.uuid4()), "os": "Windows"}
+        for i in range(count)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--profiles", type=int, default=500, help="Кількість профілів у тестовій БД")
+    parser.add_argument("--ticks", type=int, default=5, help="Кількість тактів на замір")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        seed_profiles(args.profiles)
+        pages, apps = [], []
+        for sessions in sorted(args.sessions):
+            results.append(measure(sessions, pages, apps, args.ticks))
+
+    print(f"{args.profiles} профілів, {args.ticks} тактів на замір")
+    print(f"{'':33}{'простій':>19}{'після запису':>19}")
+    print(
+        f"{'сесій':>6}{'менеджерів':>12}{'перевірок':>11}{'потоків':>9}"
+        f"{'SQL/такт':>10}{'такт':>9}{'SQL/такт':>10}{'такт':>9}"
+    )
+    for r in results:
+        print(
+            f"{r['sessions']:>6}{r['browser_managers']:>12}{r['proxy_checkers']:>11}{r['threads']:>9}"
+            f"{r['idle_sql']:>10.1f}{r['idle_ms']:>6.1f} мс{r['write_sql']:>10.1f}{r['write_ms']:>6.1f} мс"
+        )
+
+
+if __name__ == "__main__":
+    main()
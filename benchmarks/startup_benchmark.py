@@ -0,0 +1,125 @@
+"""
+Бенчмарк холодного старту: час імпорту та час до першого кадру.
+
+Запуск (з кореня репозиторію):
+    python benchmarks/startup_benchmark.py --profiles 1000
+
+Потрібен встановлений Flet. Сторінка Flet замінюється заглушкою, тому вікно
+не відкривається: «перший кадр» — це перший виклик page.add().
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from types import SimpleNamespace
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_PROBE = """
+import sys, time, json
+started = time.perf_counter()
+import app_core
+elapsed = time.perf_counter() - started
+print(json.dumps({
+    "import_s": elapsed,
+    "playwright_loaded": any(m.startswith("playwright") for m in sys.modules),
+    "requests_loaded": "requests" in sys.modules,
+    "app_funcs_loaded": sum(1 for m in sys.modules if m.startswith("app_funcs.")),
+}))
+"""
+
+
+class StubPage:
+    """Мінімальна заглушка ft.Page, що фіксує момент першого кадру."""
+
+    def __init__(self):
+        self.window = SimpleNamespace(width=0, height=0, min_width=0, min_height=0)
+        self.overlay = []
+        self.window_alive = True
+        self.first_frame_at = None
+        self.deferred_tasks = []
+
+    def add(self, *controls):
+        if self.first_frame_at is None:
+            self.first_frame_at = time.perf_counter()
+
+    def update(self, *controls):
+        pass
+
+    def run_task(self, handler, *args):
+        self.deferred_tasks.append(handler)
+
+
+def measure_import(runs: int) -> dict:
+    results = []
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", IMPORT_PROBE], cwd=REPO_ROOT)
+        results.append(json.loads(output))
+    best = min(results, key=lambda r: r["import_s"])
+    return best
+
+
+def seed_profiles(count: int):
+    from database.db_handler import Database
+
+    db = Database()
+    db.bulk_create_profiles(
+        {"name": f"ID_{i}", "profile_id": str(uuid.uuid4()), "os": "Windows"}
+        for i in range(count)
+    )
+
+
+def measure_first_frame() -> dict:
+    started = time.perf_counter()
+    from app_core import AntyDetectBrowser
+    imported = time.perf_counter()
+
+    page = StubPage()
+    app = AntyDetectBrowser(page)
+    constructed = time.perf_counter()
+
+    # Відкладене завантаження даних, що виконується після першого кадру
+    profiles = app.db.get_all_profiles()
+    for profile in profiles:
+        app.build_profile_row(profile)
+    loaded = time.perf_counter()
+
+    return {
+        "import_s": imported - started,
+        "time_to_first_frame_s": (page.first_frame_at or constructed) - started,
+        "constructor_s": constructed - imported,
+        "deferred_profile_load_s": loaded - constructed,
+        "profiles": len(profiles),
+        "deferred_tasks": len(page.deferred_tasks),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=1000, help="Кількість профілів у тестовій БД")
+    parser.add_argument("--runs", type=int, default=5, help="Кількість вимірювань імпорту")
+    args = parser.parse_args()
+
+    sys.path.insert(0, REPO_ROOT)
+    import_stats = measure_import(args.runs)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        seed_profiles(args.profiles)
+        frame_stats = measure_first_frame()
+
+    print(f"Імпорт app_core (найкращий з {args.runs}): {import_stats['import_s'] * 1000:.1f} мс")
+    print(f"  playwright завантажено: {import_stats['playwright_loaded']}")
+    print(f"  requests завантажено:   {import_stats['requests_loaded']}")
+    print(f"  модулів app_funcs:      {import_stats['app_funcs_loaded']}")
+    print(f"Час до першого кадру:     {frame_stats['time_to_first_frame_s'] * 1000:.1f} мс")
+    print(f"Відкладене завантаження {frame_stats['profiles']} профілів: "
+          f"{frame_stats['deferred_profile_load_s'] * 1000:.1f} мс")
+
+
+if __name__ == "__main__":
+    main()
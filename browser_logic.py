@@ -1,27 +1,123 @@
 """
 Модуль для роботи з Playwright та керування браузерними профілями.
 """
+from __future__ import annotations
+
 import os
+import json
 import uuid
+import socket
+import time
 import threading
 import asyncio
-from typing import Optional, Dict
-from playwright.async_api import async_playwright, BrowserContext, Playwright
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Iterable, List, Tuple, TYPE_CHECKING
 from pathlib import Path
 
+from modules.launch_presets import get_launch_preset
+from modules.orphan_reaper import clear_stale_locks, reap_orphans
+from modules.process_monitor import find_browser_pid, kill_process_tree
+from modules.resource_limits import ProcessLimiter
+from modules.storage_modes import EPHEMERAL_STATE, STORAGE_STATE_FILE, is_ephemeral
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, CDPSession, Playwright
+
+# Тайм-аут відповіді браузера на перевірку сторожа, с
+PING_TIMEOUT = 5.0
+# Скільки перевірок поспіль браузер має не відповісти, щоб вважатися завислим
+HUNG_MISSES = 2
+# Жорсткий тайм-аут закриття браузера, після якого процеси вбиваються за PID
+STOP_TIMEOUT = 10.0
+
+# Ізольований світ (як у скриптів розширень) і прив'язка в ньому, через які
+# сторінки повідомляють про введення; основний світ сторінки їх не бачить
+INPUT_WORLD = "input-activity"
+INPUT_BINDING = "reportInput"
+# Слухачі введення; виклики прив'язки не частіше ніж раз на 5 с
+INPUT_SCRIPT = """
+(() => {
+  let last = 0;
+  const touch = () => {
+    const now = Date.now();
+    if (now - last < 5000) return;
+    last = now;
+    %(name)s("");
+  };
+  for (const type of ["keydown", "pointerdown", "wheel"]) {
+    addEventListener(type, touch, {capture: true, passive: true});
+  }
+  document.addEventListener("visibilitychange", () => {
+    if (document.visibilityState === "visible") touch();
+  });
+})();
+""" % {"name": INPUT_BINDING}
+
 
 class BrowserManager:
-    def __init__(self, profiles_dir: str = "profiles"):
+    def __init__(self, profiles_dir: str = "profiles", enable_cdp: bool = False,
+                 process_limiter: Optional[ProcessLimiter] = None):
         self.profiles_dir = Path(profiles_dir)
         self.profiles_dir.mkdir(exist_ok=True)
         self.running_browsers: Dict[str, BrowserContext] = {}
         self.playwright: Optional[Playwright] = None
-        self._lock = threading.Lock()
+        # Запуски, що виконуються зараз; повторний запуск профілю чекає на наявний
+        self._launching: Dict[str, asyncio.Future] = {}
+        # Запуски різних профілів ідуть паралельно, а драйвер і спільні браузери
+        # мають стартувати лише раз
+        self._playwright_lock = asyncio.Lock()
+        self._shared_browser_lock = asyncio.Lock()
+        # Порти віддаленого налагодження (CDP) запущених профілів
+        self.enable_cdp = enable_cdp
+        self.debug_ports: Dict[str, int] = {}
+        # PID головного процесу браузера кожного запущеного профілю
+        self.browser_pids: Dict[str, int] = {}
+        # Час останньої активності (time.monotonic) кожного запущеного профілю
+        self.last_activity: Dict[str, float] = {}
+        # Тайм-аут автозупинки неактивних профілів, с; 0 — вимкнено, і тоді
+        # введення на сторінках не відстежується
+        self.idle_timeout = 0.0
+        # CDP-сесії, через які вкладки профілю повідомляють про введення
+        self._input_sessions: Dict[str, List[CDPSession]] = {}
+        # Обмеження ресурсів (cgroup v2 або nice/ionice) для дерев процесів профілів
+        self.process_limiter = process_limiter if process_limiter is not None else ProcessLimiter()
+        # Облік трафіку (TrafficMeter); None — облік вимкнено
+        self.traffic_meter = None
+        # CDP-сесії для перевірки відповіді браузерів і кількість пропущених перевірок
+        self._ping_sessions: Dict[str, CDPSession] = {}
+        self._ping_misses: Dict[str, int] = {}
+        # Після початку cleanup() зупинки профілів не змінюють збережену сесію
+        self.closing = False
+        # Спільні браузери тимчасових профілів за (headless, пресет запуску)
+        self.shared_browsers: Dict[Tuple[bool, str], Browser] = {}
+        # Файли storage_state тимчасових профілів, що зберігаються при зупинці
+        self.storage_state_paths: Dict[str, Path] = {}
+        # Міжпроцесні оренди профілів (LeaseManager); None — без перевірки
+        self.leases = None
+
+    def reap_orphans(self) -> List[str]:
+        """Завершує браузери, що лишилися після аварійного виходу, і знімає застарілі блокування.
+
+        Викликається при старті до запуску профілів. Браузери іншого
+        запущеного екземпляра застосунку не зачіпаються.
+
+        Returns:
+            Список profile_id, браузери яких було завершено.
+        """
+        reaped = reap_orphans(self.profiles_dir)
+        for profile_id in reaped:
+            print(f"Завершено браузер профілю {profile_id}, що лишився після попереднього запуску")
+        return reaped
 
     async def _get_playwright(self):
         """Отримує або створює екземпляр Playwright."""
         if self.playwright is None:
-            self.playwright = await async_playwright().start()
+            async with self._playwright_lock:
+                if self.playwright is None:
+                    # Playwright імпортується лише при першому запуску профілю
+                    from playwright.async_api import async_playwright
+                    self.playwright = await async_playwright().start()
         return self.playwright
 
     def generate_profile_id(self) -> str:
@@ -38,8 +134,14 @@ class BrowserManager:
         profile_path.mkdir(exist_ok=True)
         return profile_path
 
-    def get_proxy_config(self, proxy_data: Optional[Dict]) -> Optional[Dict]:
-        """Формує конфігурацію проксі для Playwright."""
+    def create_profile_folders(self, profile_ids: Iterable[str], max_workers: int = 8) -> List[Path]:
+        """Створює папки для багатьох профілів паралельно."""
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.create_profile_folder, profile_ids))
+
+    @staticmethod
+    def get_proxy_config(proxy_data: Optional[Dict]) -> Optional[Dict]:
+        """Формує конфігурацію проксі для Playwright; екземпляр менеджера не потрібен."""
         if not proxy_data:
             return None
 
@@ -53,6 +155,179 @@ class BrowserManager:
 
         return proxy_config
 
+    @staticmethod
+    def _find_free_port() -> int:
+        """Повертає вільний локальний TCP-порт."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
+
+    def get_cdp_url(self, profile_id: str) -> Optional[str]:
+        """Повертає HTTP-адресу CDP запущеного профілю."""
+        port = self.debug_ports.get(profile_id)
+        if port is None:
+            return None
+        return f"http://127.0.0.1:{port}"
+
+    def get_cdp_endpoint(self, profile_id: str, timeout: float = 2.0) -> Optional[str]:
+        """Повертає websocket-адресу CDP запущеного профілю (блокуючий виклик)."""
+        cdp_url = self.get_cdp_url(profile_id)
+        if not cdp_url:
+            return None
+        try:
+            with urllib.request.urlopen(f"{cdp_url}/json/version", timeout=timeout) as response:
+                return json.loads(response.read().decode("utf-8")).get("webSocketDebuggerUrl")
+        except Exception:
+            return None
+
+    def get_browser_pid(self, profile_id: str) -> Optional[int]:
+        """Повертає PID головного процесу браузера профілю."""
+        return self.browser_pids.get(profile_id)
+
+    def get_browser_pids(self) -> Dict[str, int]:
+        """Повертає копію словника profile_id -> PID браузера."""
+        return dict(self.browser_pids)
+
+    def mark_activity(self, profile_id: str) -> None:
+        """Позначає профіль як активний зараз."""
+        if profile_id in self.running_browsers:
+            self.last_activity[profile_id] = time.monotonic()
+
+    def get_idle_seconds(self, profile_id: str) -> Optional[float]:
+        """Повертає, скільки секунд профіль не проявляв активності."""
+        last = self.last_activity.get(profile_id)
+        if last is None:
+            return None
+        return time.monotonic() - last
+
+    async def set_idle_timeout(self, seconds: float) -> None:
+        """Задає тайм-аут автозупинки й вмикає чи вимикає відстеження введення.
+
+        Args:
+            seconds: Тайм-аут неактивності, с; 0 — автозупинку вимкнено.
+        """
+        enabled, was_enabled = seconds > 0, self.idle_timeout > 0
+        self.idle_timeout = seconds
+        if enabled == was_enabled:
+            return
+        for profile_id, context in list(self.running_browsers.items()):
+            if enabled:
+                for page in list(context.pages):
+                    await self._watch_input(profile_id, page)
+            else:
+                await self._unwatch_input(profile_id)
+
+    async def _track_activity(self, profile_id: str, context: BrowserContext) -> None:
+        """Підписується на події, що свідчать про роботу з профілем.
+
+        Активністю вважаються нові вкладки, навігації головного фрейму,
+        спливаючі вікна, діалоги й завантаження, а поки увімкнено
+        автозупинку, ще й введення в межах однієї сторінки.
+        """
+        def touch(*_):
+            self.mark_activity(profile_id)
+
+        def watch_page(page) -> None:
+            touch()
+            page.on("framenavigated", lambda frame: touch() if frame.parent_frame is None else None)
+            for event in ("popup", "dialog", "download", "filechooser", "close"):
+                page.on(event, touch)
+
+        def on_page(page) -> None:
+            watch_page(page)
+            if self.idle_timeout > 0:
+                asyncio.ensure_future(self._watch_input(profile_id, page))
+
+        for page in context.pages:
+            watch_page(page)
+            if self.idle_timeout > 0:
+                await self._watch_input(profile_id, page)
+        context.on("page", on_page)
+
+    async def _watch_input(self, profile_id: str, page) -> None:
+        """Передає натискання клавіш, клацання, прокручування й повернення до вкладки як активність.
+
+        Playwright про введення не повідомляє, а слухачі в основному світі
+        сторінки та прив'язки Playwright помітні для сайтів. Тому слухачі
+        працюють в ізольованому світі INPUT_WORLD, а прив'язка
+        INPUT_BINDING додається лише до нього через окрему CDP-сесію.
+        """
+        context = self.running_browsers.get(profile_id)
+        if context is None:
+            return
+
+        def on_binding(event: Dict) -> None:
+            if event.get("name") == INPUT_BINDING:
+                self.mark_activity(profile_id)
+
+        try:
+            session = await context.new_cdp_session(page)
+            session.on("Runtime.bindingCalled", on_binding)
+            await session.send("Runtime.enable")
+            await session.send("Runtime.addBinding", {"name": INPUT_BINDING, "executionContextName": INPUT_WORLD})
+            await session.send("Page.addScriptToEvaluateOnNewDocument", {"source": INPUT_SCRIPT, "worldName": INPUT_WORLD})
+            # Вже завантажений документ отримує слухачі без перезавантаження
+            frame_tree = await session.send("Page.getFrameTree")
+            world = await session.send("Page.createIsolatedWorld", {
+                "frameId": frame_tree["frameTree"]["frame"]["id"],
+                "worldName": INPUT_WORLD,
+            })
+            await session.send("Runtime.evaluate", {"expression": INPUT_SCRIPT, "contextId": world["executionContextId"]})
+        except Exception as e:
+            print(f"Не вдалося відстежувати введення в профілі {profile_id}: {e}")
+            return
+        self._input_sessions.setdefault(profile_id, []).append(session)
+
+    async def _unwatch_input(self, profile_id: str) -> None:
+        """Від'єднує CDP-сесії відстеження введення разом з їхніми скриптами."""
+        for session in self._input_sessions.pop(profile_id, []):
+            try:
+                await session.detach()
+            except Exception:
+                pass
+
+    def get_open_tabs(self, profile_id: str) -> List[str]:
+        """Повертає адреси відкритих вкладок запущеного профілю."""
+        context = self.running_browsers.get(profile_id)
+        if context is None:
+            return []
+        try:
+            pages = context.pages
+        except Exception:
+            return []
+        return [page.url for page in pages if page.url and page.url != "about:blank"]
+
+    def session_snapshot(self) -> List[Dict]:
+        """Повертає запущені профілі з відкритими вкладками для відновлення сесії.
+
+        Профілі впорядковано від нещодавно активних до давно неактивних,
+        у цьому ж порядку їх і буде запущено при відновленні.
+        """
+        profile_ids = sorted(
+            self.running_browsers,
+            key=lambda pid: self.last_activity.get(pid, 0.0),
+            reverse=True,
+        )
+        return [
+            {"profile_id": profile_id, "tabs": self.get_open_tabs(profile_id)}
+            for profile_id in profile_ids
+        ]
+
+    async def stop_idle_profiles(self, idle_timeout: float) -> Dict[str, List[str]]:
+        """Зупиняє профілі, неактивні довше за idle_timeout секунд.
+
+        Returns:
+            Словник profile_id -> список відкритих вкладок на момент зупинки.
+        """
+        stopped: Dict[str, List[str]] = {}
+        for profile_id in list(self.running_browsers):
+            idle = self.get_idle_seconds(profile_id)
+            if idle is None or idle < idle_timeout:
+                continue
+            stopped[profile_id] = self.get_open_tabs(profile_id)
+            await self.stop_profile(profile_id)
+        return stopped
+
     async def launch_profile(self, profile_id: str, proxy_data: Optional[Dict] = None,
                       headless: bool = False, profile_settings: Optional[Dict] = None) -> BrowserContext:
         """
@@ -66,54 +341,117 @@ class BrowserManager:
         Returns:
             BrowserContext об'єкт
         """
-        with self._lock:
-            if profile_id in self.running_browsers:
-                return self.running_browsers[profile_id]
+        if profile_id in self.running_browsers:
+            return self.running_browsers[profile_id]
 
-            profile_path = self.create_profile_folder(profile_id)
-            playwright = await self._get_playwright()
+        # Запуски виконуються в циклі подій, тож замість блокування потоку,
+        # яке тримали б між await, паралельні виклики чекають на спільний future
+        pending = self._launching.get(profile_id)
+        if pending is not None:
+            return await asyncio.shield(pending)
 
-            proxy_config = self.get_proxy_config(proxy_data)
-            profile_settings = profile_settings or {}
-
-            user_agent = profile_settings.get("user_agent")
-            locale = profile_settings.get("locale")
-            timezone_id = profile_settings.get("timezone_id")
-            geolocation = profile_settings.get("geolocation")
-            permissions = profile_settings.get("permissions")
-            extra_http_headers = profile_settings.get("extra_http_headers")
-
-            context_options = {
-                "no_viewport": True,
-            }
-            if user_agent:
-                context_options["user_agent"] = user_agent
-            if locale:
-                context_options["locale"] = locale
-            if timezone_id:
-                context_options["timezone_id"] = timezone_id
-            if geolocation:
-                context_options["geolocation"] = geolocation
-            if permissions is not None:
-                context_options["permissions"] = permissions
-            if extra_http_headers:
-                context_options["extra_http_headers"] = extra_http_headers
-
-            # Спробуємо спочатку з Chrome, якщо не вийде - використаємо Chromium
-            launch_options = {
-                "headless": headless,
-            }
-
-            # Додаємо аргументи для анти-детекту
-            browser_args = [
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-                "--start-maximized",
-                "--force-device-scale-factor=1",
-            ]
+        launch = asyncio.get_running_loop().create_future()
+        # Виняток запуску без інших очікувачів не повинен потрапити в лог як неотриманий
+        launch.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._launching[profile_id] = launch
+        try:
+            context = await self._acquire_and_launch(profile_id, proxy_data, headless, profile_settings)
+        except Exception as e:
+            launch.set_exception(e)
+            raise
+        else:
+            launch.set_result(context)
+            return context
+        finally:
+            # Скасований запуск скасовує й очікування інших викликачів
+            if not launch.done():
+                launch.cancel()
+            self._launching.pop(profile_id, None)
 
-            try:
+    async def _acquire_and_launch(self, profile_id: str, proxy_data: Optional[Dict],
+                                  headless: bool, profile_settings: Optional[Dict]) -> BrowserContext:
+        """Бере оренду профілю й запускає браузер, звільняючи оренду при невдачі."""
+        # Профіль, запущений іншим екземпляром застосунку, не відкриваємо вдруге
+        if self.leases is not None:
+            await asyncio.to_thread(self.leases.acquire, profile_id)
+
+        try:
+            return await self._launch_leased(profile_id, proxy_data, headless, profile_settings)
+        except BaseException:
+            if self.leases is not None:
+                self.leases.release(profile_id)
+            raise
+
+    async def _launch_leased(self, profile_id: str, proxy_data: Optional[Dict],
+                             headless: bool, profile_settings: Optional[Dict]) -> BrowserContext:
+        """Запускає браузер профілю, оренду якого вже отримано."""
+        profile_settings = profile_settings or {}
+        ephemeral = is_ephemeral(profile_settings.get("storage_mode"))
+        profile_path = self.get_profile_path(profile_id)
+        if not ephemeral:
+            self.create_profile_folder(profile_id)
+            # Блокування від браузера, що впав, інакше завадили б запуску
+            await asyncio.to_thread(clear_stale_locks, profile_path)
+        playwright = await self._get_playwright()
+
+        proxy_config = self.get_proxy_config(proxy_data)
+
+        user_agent = profile_settings.get("user_agent")
+        locale = profile_settings.get("locale")
+        timezone_id = profile_settings.get("timezone_id")
+        geolocation = profile_settings.get("geolocation")
+        permissions = profile_settings.get("permissions")
+        extra_http_headers = profile_settings.get("extra_http_headers")
+
+        context_options = {
+            "no_viewport": True,
+        }
+        if user_agent:
+            context_options["user_agent"] = user_agent
+        if locale:
+            context_options["locale"] = locale
+        if timezone_id:
+            context_options["timezone_id"] = timezone_id
+        if geolocation:
+            context_options["geolocation"] = geolocation
+        if permissions is not None:
+            context_options["permissions"] = permissions
+        if extra_http_headers:
+            context_options["extra_http_headers"] = extra_http_headers
+
+        # Спробуємо спочатку з Chrome, якщо не вийде - використаємо Chromium
+        launch_options = {
+            "headless": headless,
+        }
+
+        # Додаємо аргументи для анти-детекту
+        browser_args = [
+            "--disable-blink-features=AutomationControlled",
+            "--disable-dev-shm-usage",
+            "--no-sandbox",
+            "--start-maximized",
+            "--force-device-scale-factor=1",
+        ]
+        # Пресет запуску (наприклад, економія пам'яті) додає свої прапорці
+        preset = get_launch_preset(profile_settings.get("launch_preset"))
+        browser_args.extend(preset.args)
+
+        debug_port = None
+        if self.enable_cdp and not ephemeral:
+            debug_port = self._find_free_port()
+            browser_args.append(f"--remote-debugging-port={debug_port}")
+
+        try:
+            if ephemeral:
+                context = await self._new_ephemeral_context(
+                    profile_id,
+                    profile_settings.get("storage_mode"),
+                    (headless, preset.name),
+                    browser_args,
+                    proxy_config,
+                    context_options,
+                )
+            else:
                 # Спробуємо запустити з Chrome
                 try:
                     context = await playwright.chromium.launch_persistent_context(
@@ -134,53 +472,296 @@ class BrowserManager:
                         **context_options
                     )
 
+            try:
+                # Фільтр запитів за типом ресурсу й адресою (скомпільований і кешований)
+                resource_filter = profile_settings.get("resource_filter")
+                if resource_filter is not None:
+                    await context.route("**/*", resource_filter.handle)
+
+                # Облік трафіку через CDP Network кожної вкладки
+                if self.traffic_meter is not None:
+                    proxy_id = proxy_data.get("id") if proxy_data else None
+                    await self.traffic_meter.attach(context, profile_id, proxy_id)
+
                 self.running_browsers[profile_id] = context
+                self.last_activity[profile_id] = time.monotonic()
+                await self._track_activity(profile_id, context)
+                if debug_port is not None:
+                    self.debug_ports[profile_id] = debug_port
+
+                # Тимчасовий профіль ділить процес зі спільним браузером,
+                # тож власного PID (і обмежень ресурсів) у нього немає
+                if ephemeral:
+                    return context
+
+                # Persistent context не надає процес браузера, тому шукаємо його в /proc
+                browser_pid = await asyncio.to_thread(find_browser_pid, profile_path)
+                if browser_pid is not None:
+                    self.browser_pids[profile_id] = browser_pid
+                    resource_limits = profile_settings.get("resource_limits")
+                    if resource_limits is not None and not resource_limits.is_empty():
+                        try:
+                            await asyncio.to_thread(
+                                self.process_limiter.apply, profile_id, browser_pid, resource_limits
+                            )
+                        except Exception as e:
+                            print(f"Не вдалося обмежити ресурси профілю {profile_id}: {e}")
                 return context
-            except Exception as e:
-                print(f"Помилка запуску браузера для профілю {profile_id}: {e}")
+            except BaseException:
+                # Браузер уже працює: без закриття лишилися б його процеси
+                # й блокування профілю, а оренду звільнено б при живому браузері
+                await self._abort_launch(profile_id, context, None if ephemeral else profile_path)
                 raise
+        except Exception as e:
+            print(f"Помилка запуску браузера для профілю {profile_id}: {e}")
+            raise
 
-    async def stop_profile(self, profile_id: str):
-        """Зупиняє браузер профілю."""
-        with self._lock:
-            if profile_id in self.running_browsers:
-                try:
-                    context = self.running_browsers[profile_id]
-                    await context.close()
-                except Exception as e:
-                    print(f"Помилка закриття браузера для профілю {profile_id}: {e}")
-                finally:
-                    del self.running_browsers[profile_id]
+    async def _abort_launch(self, profile_id: str, context: BrowserContext,
+                            profile_path: Optional[Path]) -> None:
+        """Закриває контекст, підготовку якого перервала помилка чи скасування.
 
-    def is_profile_running(self, profile_id: str) -> bool:
-        """Перевіряє, чи запущений профіль."""
-        with self._lock:
-            if profile_id not in self.running_browsers:
-                return False
-            
-            context = self.running_browsers[profile_id]
-            # Перевіряємо, чи контекст ще активний
+        Якщо браузер не закрився за STOP_TIMEOUT, його процеси завершуються
+        за PID. Записи про профіль, його cgroup та оренда звільняються.
+        """
+        try:
+            await asyncio.wait_for(context.close(), STOP_TIMEOUT)
+        except Exception as e:
+            print(f"Не вдалося закрити браузер профілю {profile_id} після невдалого запуску: {e}")
+            pid = self.browser_pids.get(profile_id)
+            if pid is None and profile_path is not None:
+                pid = await asyncio.to_thread(find_browser_pid, profile_path)
+            if pid is not None:
+                await asyncio.to_thread(kill_process_tree, pid)
+        finally:
+            self._forget_profile(profile_id)
+            if profile_id in self.process_limiter.cgroups:
+                await asyncio.to_thread(self.process_limiter.release, profile_id)
+            if self.shared_browsers and not self.closing:
+                await self._close_unused_shared_browsers()
+
+    async def _get_shared_browser(self, key: Tuple[bool, str], browser_args: List[str]) -> Browser:
+        """Повертає спільний браузер тимчасових профілів, запускаючи його за потреби."""
+        async with self._shared_browser_lock:
+            browser = self.shared_browsers.get(key)
+            if browser is not None and browser.is_connected():
+                return browser
+
+            playwright = await self._get_playwright()
+            headless = key[0]
+            try:
+                browser = await playwright.chromium.launch(channel="chrome", headless=headless, args=browser_args)
+            except Exception:
+                browser = await playwright.chromium.launch(headless=headless, args=browser_args)
+            self.shared_browsers[key] = browser
+            return browser
+
+    async def _new_ephemeral_context(self, profile_id: str, storage_mode: str, key: Tuple[bool, str],
+                                     browser_args: List[str], proxy_config: Optional[Dict],
+                                     context_options: Dict) -> BrowserContext:
+        """Створює контекст тимчасового профілю в спільному браузері.
+
+        Стан живе лише в пам'яті контексту; для ephemeral_state cookies і
+        localStorage завантажуються з файлу storage_state і зберігаються
+        в нього при зупинці.
+        """
+        browser = await self._get_shared_browser(key, browser_args)
+        options = dict(context_options)
+        if proxy_config:
+            options["proxy"] = proxy_config
+
+        if storage_mode == EPHEMERAL_STATE:
+            state_path = self.get_profile_path(profile_id) / STORAGE_STATE_FILE
+            if state_path.exists():
+                options["storage_state"] = str(state_path)
+            self.storage_state_paths[profile_id] = state_path
+
+        context = await browser.new_context(**options)
+
+        # Контекст без вкладок не закривається сам, як persistent context,
+        # тому зупиняємо профіль, коли користувач закрив останню вкладку
+        def watch_page(page) -> None:
+            def on_close(_):
+                if not context.pages and self.running_browsers.get(profile_id) is context:
+                    asyncio.ensure_future(self.stop_profile(profile_id))
+            page.on("close", on_close)
+
+        context.on("page", watch_page)
+        return context
+
+    async def _save_storage_state(self, profile_id: str, context: BrowserContext) -> None:
+        """Зберігає cookies і localStorage тимчасового профілю у файл."""
+        state_path = self.storage_state_paths.get(profile_id)
+        if state_path is None:
+            return
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        await context.storage_state(path=str(state_path))
+
+    async def _close_unused_shared_browsers(self) -> None:
+        """Закриває спільні браузери, в яких не лишилося контекстів."""
+        for key, browser in list(self.shared_browsers.items()):
+            try:
+                unused = not browser.is_connected() or not browser.contexts
+            except Exception:
+                unused = True
+            if not unused:
+                continue
+            self.shared_browsers.pop(key, None)
             try:
-                # Спробуємо отримати список сторінок
-                pages = context.pages
-                return True
-            except:
-                # Якщо контекст закритий, видаляємо його
-                del self.running_browsers[profile_id]
-                return False
+                await asyncio.wait_for(browser.close(), STOP_TIMEOUT)
+            except Exception as e:
+                print(f"Помилка закриття спільного браузера: {e}")
+
+    def _forget_profile(self, profile_id: str) -> None:
+        """Видаляє всі записи про профіль, крім cgroup (її звільняє викликач).
+
+        Викликається з циклу подій і не блокує: паралельні запуски
+        координуються через self._launching, а не блокування потоку.
+        """
+        self.running_browsers.pop(profile_id, None)
+        self.debug_ports.pop(profile_id, None)
+        self.browser_pids.pop(profile_id, None)
+        self.last_activity.pop(profile_id, None)
+        self._ping_sessions.pop(profile_id, None)
+        self._ping_misses.pop(profile_id, None)
+        self._input_sessions.pop(profile_id, None)
+        self.storage_state_paths.pop(profile_id, None)
+        if self.leases is not None:
+            self.leases.release(profile_id)
+
+    async def kill_profile(self, profile_id: str) -> bool:
+        """Примусово завершує дерево процесів браузера профілю за PID."""
+        pid = self.browser_pids.get(profile_id)
+        if pid is None:
+            return False
+        return await asyncio.to_thread(kill_process_tree, pid) > 0
+
+    async def stop_profile(self, profile_id: str, timeout: float = STOP_TIMEOUT):
+        """Зупиняє браузер профілю.
+
+        Якщо браузер не закрився за timeout секунд, його процеси завершуються
+        примусово. Зупинка нічого не блокує, тож завислий браузер не
+        затримує is_profile_running і запуски інших профілів.
+        """
+        context = self.running_browsers.get(profile_id)
+        if context is None:
+            return
+        try:
+            await asyncio.wait_for(self._save_storage_state(profile_id, context), timeout)
+        except Exception as e:
+            print(f"Не вдалося зберегти стан профілю {profile_id}: {e}")
+        try:
+            await asyncio.wait_for(context.close(), timeout)
+        except asyncio.TimeoutError:
+            print(f"Браузер профілю {profile_id} не закрився за {timeout:.0f} с, завершуємо примусово")
+            await self.kill_profile(profile_id)
+        except Exception as e:
+            print(f"Помилка закриття браузера для профілю {profile_id}: {e}")
+        finally:
+            self._forget_profile(profile_id)
+            if profile_id in self.process_limiter.cgroups:
+                await asyncio.to_thread(self.process_limiter.release, profile_id)
+            if self.shared_browsers and not self.closing:
+                await self._close_unused_shared_browsers()
+
+    async def _cdp_round_trip(self, profile_id: str, context: BrowserContext) -> None:
+        """Надсилає браузеру профілю дешевий CDP-запит і чекає відповіді."""
+        session = self._ping_sessions.get(profile_id)
+        if session is not None:
+            try:
+                await session.send("Browser.getVersion")
+                return
+            except Exception:
+                # Вкладку сесії закрито — створюємо нову нижче
+                self._ping_sessions.pop(profile_id, None)
+
+        pages = context.pages
+        if not pages:
+            # Без вкладок перевіряємо зв'язок запитом до сховища cookies браузера
+            await context.cookies("about:blank")
+            return
+        session = await context.new_cdp_session(pages[0])
+        self._ping_sessions[profile_id] = session
+        await session.send("Browser.getVersion")
+
+    async def ping_profile(self, profile_id: str, timeout: float = PING_TIMEOUT) -> bool:
+        """Перевіряє, чи відповідає браузер профілю протягом timeout секунд."""
+        context = self.running_browsers.get(profile_id)
+        if context is None:
+            return False
+        try:
+            await asyncio.wait_for(self._cdp_round_trip(profile_id, context), timeout)
+            return True
+        except Exception:
+            return False
+
+    async def recover_hung_profiles(self, timeout: float = PING_TIMEOUT,
+                                    misses: int = HUNG_MISSES) -> List[str]:
+        """Завершує браузери, що не відповіли на misses перевірок поспіль.
+
+        Returns:
+            Список profile_id примусово зупинених профілів.
+        """
+        profile_ids = list(self.running_browsers)
+        results = await asyncio.gather(*(self.ping_profile(pid, timeout) for pid in profile_ids))
+
+        recovered: List[str] = []
+        for profile_id, alive in zip(profile_ids, results):
+            if alive:
+                self._ping_misses.pop(profile_id, None)
+                continue
+            if profile_id not in self.running_browsers:
+                # Профіль зупинили під час перевірки
+                continue
+            self._ping_misses[profile_id] = self._ping_misses.get(profile_id, 0) + 1
+            if self._ping_misses[profile_id] < misses:
+                continue
+
+            print(f"Браузер профілю {profile_id} не відповідає, завершуємо примусово")
+            await self.kill_profile(profile_id)
+            # context.close() на завислому з'єднанні теж зависне, тому лише забуваємо контекст
+            self._forget_profile(profile_id)
+            if profile_id in self.process_limiter.cgroups:
+                await asyncio.to_thread(self.process_limiter.release, profile_id)
+            recovered.append(profile_id)
+        return recovered
+
+    def is_profile_running(self, profile_id: str) -> bool:
+        """Перевіряє, чи запущений профіль.
+
+        Лише читає словники, тож не блокує і безпечна як з циклу подій,
+        так і з інших потоків.
+        """
+        context = self.running_browsers.get(profile_id)
+        if context is None:
+            return False
+        # Перевіряємо, чи контекст ще активний
+        try:
+            context.pages
+            return True
+        except Exception:
+            # Якщо контекст закритий, забуваємо профіль
+            self._forget_profile(profile_id)
+            if profile_id in self.process_limiter.cgroups:
+                threading.Thread(
+                    target=self.process_limiter.release, args=(profile_id,), daemon=True
+                ).start()
+            return False
 
     async def stop_all_profiles(self):
         """Зупиняє всі запущені профілі."""
-        with self._lock:
-            profile_ids = list(self.running_browsers.keys())
-        for profile_id in profile_ids:
+        for profile_id in list(self.running_browsers):
             await self.stop_profile(profile_id)
 
     async def cleanup(self):
         """Очищає ресурси (закриває Playwright)."""
+        self.closing = True
         await self.stop_all_profiles()
+        await self._close_unused_shared_browsers()
         if self.playwright:
-            await self.playwright.stop()
+            try:
+                await asyncio.wait_for(self.playwright.stop(), STOP_TIMEOUT)
+            except Exception as e:
+                print(f"Помилка зупинки Playwright: {e}")
             self.playwright = None
 
     def cleanup_sync(self):
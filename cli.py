@@ -0,0 +1,377 @@
+"""
+Консольний режим без GUI для пакетного керування профілями та проксі.
+
+Приклади:
+    python cli.py import-proxies proxies.txt
+    python cli.py export-proxies -o proxies.txt
+    python cli.py check-proxies --workers 100
+    python cli.py create-profiles --count 1000 --prefix Farm --os Linux
+    python cli.py import-profiles profiles.csv
+    python cli.py export-bundle -o profiles.tar [<profile_id> ...]
+    python cli.py import-bundle profiles.tar
+    python cli.py launch <profile_id> [<profile_id> ...] [--headless]
+    python cli.py stop <profile_id> [<profile_id> ...]
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from database.async_db import AsyncDatabase
+from database.db_handler import Database
+from app_funcs.parse_proxy_line import parse_proxy_line
+from app_funcs.build_profile_launch_settings import build_profile_launch_settings
+from app_funcs.start_profile import start_profile
+from app_funcs.apply_launch_limits import apply_launch_limits
+from modules.profile_bundle import export_profiles, import_profiles
+from modules.profile_import import import_profile_templates, read_profile_templates
+from modules.proxy_checker import PlaywrightProxyChecker, build_proxy_url, check_proxy_http
+
+# Як часто друкувати прогрес для довгих операцій
+PROGRESS_EVERY = 1000
+
+
+class HeadlessApp:
+    """Мінімальний застосунок без Flet, що перевикористовує логіку UI-версії."""
+    parse_proxy_line = parse_proxy_line
+    build_profile_launch_settings = build_profile_launch_settings
+    start_profile = start_profile
+    apply_launch_limits = apply_launch_limits
+
+    def __init__(self, db_path: str):
+        self.db = Database(db_path)
+        self.adb = AsyncDatabase(self.db)
+        self._browser_manager = None
+        self._launch_scheduler = None
+        self.traffic_meter = None
+
+    @property
+    def browser_manager(self):
+        # Менеджер потрібен для папок профілів; Playwright — лише для запуску
+        if self._browser_manager is None:
+            from browser_logic import BrowserManager
+            self._browser_manager = BrowserManager()
+        return self._browser_manager
+
+    def prepare_launch(self):
+        """Готує менеджер браузерів до запуску профілів з цього процесу.
+
+        Лише перед запуском завершуються браузери, що лишилися після
+        аварійного виходу, і стартує оренда профілів: команди, що нічого не
+        запускають, не повинні зупиняти браузери чи тримати потік оренд.
+        """
+        manager = self.browser_manager
+        manager.reap_orphans()
+        # Профілі, запущені в GUI чи іншому процесі, не запускаються вдруге
+        from modules.profile_leases import LeaseManager
+        manager.leases = LeaseManager(self.db, manager.profiles_dir)
+        manager.leases.start()
+        # cgroup профілів готується до запуску драйвера Playwright
+        if self.db.has_resource_limits():
+            manager.process_limiter.prepare()
+        # Облік трафіку за тим самим налаштуванням, що й у GUI
+        if self.db.get_setting("traffic_accounting", "0") == "1":
+            from modules.traffic_meter import TrafficMeter
+            self.traffic_meter = TrafficMeter(self.db)
+            self.traffic_meter.start()
+            manager.traffic_meter = self.traffic_meter
+        return manager
+
+    @property
+    def launch_scheduler(self):
+        # Ті самі ліміти запуску, що й у GUI
+        if self._launch_scheduler is None:
+            from modules.launch_scheduler import LaunchScheduler
+            self._launch_scheduler = LaunchScheduler(self.browser_manager)
+            self.apply_launch_limits()
+        return self._launch_scheduler
+
+
+def emit(message: str):
+    print(message, flush=True)
+
+
+def cmd_import_proxies(app: HeadlessApp, args) -> int:
+    stats = {"lines": 0, "skipped": 0}
+
+    def parsed_proxies():
+        with open(args.file, 'r', encoding='utf-8') as f:
+            for line in f:
+                stats["lines"] += 1
+                proxy_data = app.parse_proxy_line(line)
+                if not proxy_data:
+                    stats["skipped"] += 1
+                    continue
+                proxy_data["name"] = f"Проксі {proxy_data['host']}:{proxy_data['port']}"
+                if stats["lines"] % PROGRESS_EVERY == 0:
+                    emit(f"Прочитано рядків: {stats['lines']}")
+                yield proxy_data
+
+    imported = app.db.bulk_create_proxies(parsed_proxies())
+    emit(f"Імпортовано: {imported}, пропущено рядків: {stats['skipped']}")
+    return 0 if imported else 1
+
+
+def cmd_export_proxies(app: HeadlessApp, args) -> int:
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        count = 0
+        for proxy in app.db.get_all_proxies():
+            out.write(build_proxy_url(proxy) + "\n")
+            count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    if args.output:
+        emit(f"Експортовано: {count}")
+    return 0
+
+
+def cmd_check_proxies(app: HeadlessApp, args) -> int:
+    proxies = app.db.get_all_proxies()
+    if args.ids:
+        wanted = set(args.ids)
+        proxies = [p for p in proxies if p['id'] in wanted]
+    if not proxies:
+        emit("Немає проксі для перевірки")
+        return 1
+
+    from browser_logic import BrowserManager
+
+    playwright_checker = PlaywrightProxyChecker(max_parallel=args.browser_contexts)
+
+    def check(proxy):
+        try:
+            return check_proxy_http(proxy, timeout=args.timeout)
+        except Exception as e:
+            # Альтернативна перевірка через Playwright для SOCKS
+            if proxy['type'] in ['socks4', 'socks5']:
+                return playwright_checker.check(BrowserManager.get_proxy_config(proxy))
+            return {'status': 'failed', 'error': str(e)}
+
+    working = failed = 0
+    try:
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            futures = {pool.submit(check, proxy): proxy for proxy in proxies}
+            for done, future in enumerate(as_completed(futures), 1):
+                proxy = futures[future]
+                status = future.result()
+                if status.get('status') == 'working':
+                    working += 1
+                else:
+                    failed += 1
+                error = f" ({status['error']})" if status.get('error') else ""
+                emit(f"[{done}/{len(proxies)}] {proxy['id']} {proxy['host']}:{proxy['port']} "
+                     f"{status.get('status')}{error}")
+    finally:
+        playwright_checker.close()
+
+    emit(f"Перевірка завершена. Працюють: {working}, не працюють: {failed}")
+    return 0
+
+
+def cmd_create_profiles(app: HeadlessApp, args) -> int:
+    start_number = app.db.get_next_profile_number()
+    templates = (
+        {
+            "name": f"{args.prefix}_{start_number + i}",
+            "proxy": args.proxy_id,
+            "tags": args.tags,
+            "os": args.os,
+        }
+        for i in range(args.count)
+    )
+    created = import_profile_templates(
+        app.db,
+        app.browser_manager,
+        templates,
+        progress=lambda total: emit(f"Створено профілів: {total}/{args.count}"),
+    )
+    return 0 if created == args.count else 1
+
+
+def cmd_import_profiles(app: HeadlessApp, args) -> int:
+    try:
+        created = import_profile_templates(
+            app.db,
+            app.browser_manager,
+            read_profile_templates(args.file),
+            progress=lambda total: emit(f"Створено профілів: {total}"),
+        )
+    except ValueError as e:
+        emit(f"Помилка імпорту профілів: {e}")
+        return 1
+    emit(f"Імпортовано профілів: {created}")
+    return 0 if created else 1
+
+
+def cmd_export_bundle(app: HeadlessApp, args) -> int:
+    profile_ids = args.profile_ids or [p['profile_id'] for p in app.db.get_all_profiles()]
+    out = open(args.output, 'wb') if args.output != "-" else sys.stdout.buffer
+    try:
+        exported = export_profiles(
+            app.db,
+            app.browser_manager,
+            profile_ids,
+            out,
+            workers=args.workers,
+            progress=lambda total: print(f"Експортовано: {total}/{len(profile_ids)}", file=sys.stderr, flush=True),
+        )
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+    print(f"Експортовано профілів: {exported}", file=sys.stderr, flush=True)
+    return 0
+
+
+def cmd_import_bundle(app: HeadlessApp, args) -> int:
+    source = open(args.file, 'rb') if args.file != "-" else sys.stdin.buffer
+    try:
+        imported = import_profiles(
+            app.db,
+            app.browser_manager,
+            source,
+            workers=args.workers,
+            progress=lambda total: emit(f"Імпортовано: {total}"),
+        )
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+    emit(f"Імпортовано профілів: {imported}")
+    return 0
+
+
+def call_control_api(app: HeadlessApp, method: str, path: str) -> dict:
+    """Виконує запит до локального API запущеного застосунку."""
+    port = app.db.get_setting("api_port", "8765")
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{port}{path}",
+        data=b"{}" if method == "POST" else None,
+        method=method,
+        headers={"Content-Type": "application/json"},
+    )
+    token = app.db.get_setting("api_token")
+    if token:
+        request.add_header("Authorization", f"Bearer {token}")
+    with urllib.request.urlopen(request, timeout=120) as response:
+        return json.loads(response.read().decode("utf-8"))
+
+
+def cmd_launch(app: HeadlessApp, args) -> int:
+    if args.api:
+        for profile_id in args.profile_ids:
+            result = call_control_api(app, "POST", f"/profiles/{profile_id}/launch")
+            emit(json.dumps(result, ensure_ascii=False))
+        return 0
+
+    app.prepare_launch()
+
+    async def run():
+        for profile_id in args.profile_ids:
+            try:
+                await app.start_profile(profile_id, headless=args.headless)
+                emit(f"Запущено: {profile_id}")
+            except Exception as e:
+                emit(f"Помилка запуску {profile_id}: {e}")
+
+        # Тримаємо процес, доки відкритий хоча б один профіль
+        try:
+            while any(app.browser_manager.is_profile_running(pid) for pid in args.profile_ids):
+                await asyncio.sleep(1)
+        finally:
+            await app.browser_manager.cleanup()
+            app.browser_manager.leases.stop()
+            if app.traffic_meter is not None:
+                app.traffic_meter.stop()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def cmd_stop(app: HeadlessApp, args) -> int:
+    # Профілі належать іншому процесу, тому зупиняємо через його API
+    for profile_id in args.profile_ids:
+        try:
+            result = call_control_api(app, "POST", f"/profiles/{profile_id}/stop")
+            emit(json.dumps(result, ensure_ascii=False))
+        except Exception as e:
+            emit(f"Помилка зупинки {profile_id}: {e}")
+            return 1
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Anty-Detect Browser CLI")
+    parser.add_argument("--db", default="browser_profiles.db", help="Шлях до бази даних")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    p = subparsers.add_parser("import-proxies", help="Імпорт проксі з .txt")
+    p.add_argument("file")
+    p.set_defaults(func=cmd_import_proxies)
+
+    p = subparsers.add_parser("export-proxies", help="Експорт проксі у текстовий формат")
+    p.add_argument("-o", "--output")
+    p.set_defaults(func=cmd_export_proxies)
+
+    p = subparsers.add_parser("check-proxies", help="Перевірка проксі")
+    p.add_argument("--ids", type=int, nargs="*")
+    p.add_argument("--workers", type=int, default=50)
+    p.add_argument("--browser-contexts", type=int, default=5)
+    p.add_argument("--timeout", type=float, default=15)
+    p.set_defaults(func=cmd_check_proxies)
+
+    p = subparsers.add_parser("create-profiles", help="Створення профілів")
+    p.add_argument("--count", type=int, required=True)
+    p.add_argument("--prefix", default="ID")
+    p.add_argument("--os", default="Windows")
+    p.add_argument("--proxy-id", type=int)
+    p.add_argument("--tags")
+    p.set_defaults(func=cmd_create_profiles)
+
+    p = subparsers.add_parser("import-profiles", help="Створення профілів із шаблону CSV/JSONL")
+    p.add_argument("file")
+    p.set_defaults(func=cmd_import_profiles)
+
+    p = subparsers.add_parser("export-bundle", help="Експорт профілів з даними в архів")
+    p.add_argument("profile_ids", nargs="*")
+    p.add_argument("-o", "--output", required=True, help="Файл архіву або '-' для stdout")
+    p.add_argument("--workers", type=int, default=4)
+    p.set_defaults(func=cmd_export_bundle)
+
+    p = subparsers.add_parser("import-bundle", help="Імпорт профілів з архіву")
+    p.add_argument("file", help="Файл архіву або '-' для stdin")
+    p.add_argument("--workers", type=int, default=4)
+    p.set_defaults(func=cmd_import_bundle)
+
+    p = subparsers.add_parser("launch", help="Запуск профілів")
+    p.add_argument("profile_ids", nargs="+")
+    p.add_argument("--headless", action="store_true")
+    p.add_argument("--api", action="store_true", help="Запустити через API запущеного застосунку")
+    p.set_defaults(func=cmd_launch)
+
+    p = subparsers.add_parser("stop", help="Зупинка профілів через API застосунку")
+    p.add_argument("profile_ids", nargs="+")
+    p.set_defaults(func=cmd_stop)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    app = HeadlessApp(args.db)
+    started = time.perf_counter()
+    code = args.func(app, args)
+    # Не змішуємо службовий вивід з даними, що йдуть у stdout
+    if (args.command, getattr(args, "output", None)) not in (("export-proxies", None), ("export-bundle", "-")):
+        emit(f"Готово за {time.perf_counter() - started:.1f} с")
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
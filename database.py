@@ -10,6 +10,8 @@ import os
 # Expose package path so that `database.db_handler` can be imported
 __path__ = [os.path.join(os.path.dirname(__file__), "database")]
 
+from database.async_db import AsyncDatabase  # noqa: E402
 from database.db_handler import Database, save_profile  # noqa: E402
+from database.models import Profile, Proxy  # noqa: E402
 
-__all__ = ["Database", "save_profile"]
+__all__ = ["AsyncDatabase", "Database", "Profile", "Proxy", "save_profile"]
@@ -1,4 +1,6 @@
 """Database package exports."""
+from .async_db import AsyncDatabase
 from .db_handler import Database, save_profile
+from .models import Profile, Proxy
 
-__all__ = ["Database", "save_profile"]
+__all__ = ["AsyncDatabase", "Database", "Profile", "Proxy", "save_profile"]
@@ -0,0 +1,100 @@
+"""Non-blocking Database access for asyncio code.
+
+``AsyncDatabase`` runs ``Database`` methods on one dedicated thread that
+owns a single persistent SQLite connection, so coroutines on the UI event
+loop never block on disk I/O. The sync and async facades share one query
+cache, so writes through either invalidate reads through both.
+"""
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+from .db_handler import Database
+
+
+class _PersistentConnection(sqlite3.Connection):
+    """Connection whose ``close()`` is a no-op, so Database methods reuse it."""
+
+    def close(self) -> None:
+        pass
+
+    def close_for_real(self) -> None:
+        super().close()
+
+
+class _ThreadBoundDatabase(Database):
+    """Database that reuses one connection owned by the DB thread."""
+
+    def __init__(self, db: Database):
+        # The schema is already migrated by the wrapped instance
+        self.db_path = db.db_path
+        self.cache = db.cache
+        self.changes = db.changes
+        self._conn: Optional[_PersistentConnection] = None
+
+    def get_connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, factory=_PersistentConnection)
+            self._conn.row_factory = sqlite3.Row
+        return self._conn
+
+    def call(self, func: Callable[..., Any]) -> Any:
+        try:
+            return func()
+        except Exception:
+            # Do not leave a half-finished transaction on the shared connection
+            if self._conn is not None and self._conn.in_transaction:
+                self._conn.rollback()
+            raise
+
+    def close_connection(self) -> None:
+        if self._conn is not None:
+            self._conn.close_for_real()
+            self._conn = None
+
+
+class AsyncDatabase:
+    """Awaitable facade over ``Database``.
+
+    Any public ``Database`` method is available as a coroutine function with
+    the same signature, e.g. ``await adb.get_profile_by_id(profile_id)``.
+    Calls are executed one at a time in submission order.
+    """
+
+    def __init__(self, db: Database):
+        self.db = db
+        self._bound = _ThreadBoundDatabase(db)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db")
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run ``func(*args, **kwargs)`` on the DB thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._bound.call, partial(func, *args, **kwargs)
+        )
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        method = getattr(self._bound, name)
+        if not callable(method):
+            raise AttributeError(name)
+
+        async def call(*args, **kwargs):
+            return await self.run(method, *args, **kwargs)
+
+        call.__name__ = name
+        call.__doc__ = method.__doc__
+        return call
+
+    def close(self) -> None:
+        """Close the persistent connection and stop the DB thread."""
+        try:
+            self._executor.submit(self._bound.close_connection).result(timeout=5)
+        except Exception:
+            pass
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,101 @@
+"""Read-through query cache for the Database layer.
+
+Single-row lookups live in a bounded LRU; list queries are stored as
+snapshots that are never evicted but are dropped when a table they depend
+on changes. Every entry is tagged with the tables it was read from, and
+writes invalidate by table name. Writes by other processes are picked up
+by ``Database.poll_changes``, which invalidates only the tables they touched.
+
+A loader result is only stored if none of its tables changed while it was
+running, so a concurrent write can never leave a stale entry behind.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class QueryCache:
+    """Thread-safe cache with per-table invalidation and hit/miss counters."""
+
+    def __init__(self, max_rows: int = 1024):
+        """
+        Args:
+            max_rows: Maximum number of single-row entries kept in the LRU.
+        """
+        self.max_rows = max_rows
+        self._lock = threading.Lock()
+        self._rows: "OrderedDict[Hashable, Tuple[Tuple[str, ...], object]]" = OrderedDict()
+        self._snapshots: Dict[Hashable, Tuple[Tuple[str, ...], object]] = {}
+        self._versions: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _token(self, tables: Tuple[str, ...]) -> Tuple[int, ...]:
+        return tuple(self._versions.setdefault(table, 0) for table in tables)
+
+    def _get(self, store, key: Hashable, tables: Tuple[str, ...], loader: Callable[[], T], bounded: bool) -> T:
+        with self._lock:
+            entry = store.get(key)
+            if entry is not None:
+                self.hits += 1
+                if bounded:
+                    store.move_to_end(key)
+                return entry[1]
+            self.misses += 1
+            token = self._token(tables)
+
+        value = loader()
+
+        with self._lock:
+            if self._token(tables) == token:
+                store[key] = (tables, value)
+                if bounded:
+                    store.move_to_end(key)
+                    while len(store) > self.max_rows:
+                        store.popitem(last=False)
+        return value
+
+    def get_row(self, key: Hashable, tables: Iterable[str], loader: Callable[[], T]) -> T:
+        """Return a cached single-row lookup, loading it on a miss."""
+        return self._get(self._rows, key, tuple(tables), loader, bounded=True)
+
+    def get_snapshot(self, key: Hashable, tables: Iterable[str], loader: Callable[[], T]) -> T:
+        """Return a cached list query snapshot, loading it on a miss."""
+        return self._get(self._snapshots, key, tuple(tables), loader, bounded=False)
+
+    def invalidate(self, *tables: str) -> None:
+        """Drop every entry that depends on any of the given tables."""
+        changed = set(tables)
+        with self._lock:
+            for table in changed:
+                self._versions[table] = self._versions.get(table, 0) + 1
+            for store in (self._rows, self._snapshots):
+                stale = [key for key, (deps, _) in store.items() if changed.intersection(deps)]
+                for key in stale:
+                    del store[key]
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._rows.clear()
+            self._snapshots.clear()
+            for table in self._versions:
+                self._versions[table] += 1
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss counters and current entry counts."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "rows": len(self._rows),
+                "snapshots": len(self._snapshots),
+            }
@@ -0,0 +1,91 @@
+"""Cheap detection of committed writes, including writes by other processes.
+
+``PRAGMA data_version`` on a long-lived connection changes whenever any
+other connection (in this or another process) commits to the database, and
+costs no I/O when nothing changed. Only when it moves are the per-table
+counters in ``table_versions`` read; triggers bump them on every insert,
+update and delete, so callers learn exactly which tables changed.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+from typing import Dict, NamedTuple, Optional, Set, Tuple
+
+
+class ChangeToken(NamedTuple):
+    """Point in the database history to compare later reads against."""
+
+    data_version: int
+    versions: Tuple[Tuple[str, int], ...]
+
+
+class ChangeTracker:
+    """Reports tables written since a given ``ChangeToken``.
+
+    Args:
+        db_path: Path to the SQLite database, already migrated.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._last: Optional[ChangeToken] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # data_version is only meaningful on one connection kept open for good;
+        # it never writes, so its own commits cannot hide anyone else's
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        return self._conn
+
+    def _read(self, since: Optional[ChangeToken]) -> ChangeToken:
+        conn = self._connection()
+        # data_version first: a commit landing between the two reads is
+        # seen again on the next call instead of being lost
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if since is not None and since.data_version == data_version:
+            return since
+        versions = tuple(conn.execute("SELECT name, version FROM table_versions ORDER BY name").fetchall())
+        return ChangeToken(data_version, versions)
+
+    def token(self) -> ChangeToken:
+        """Return the current change token."""
+        with self._lock:
+            return self._read(None)
+
+    def changed_since(self, since: ChangeToken) -> Tuple[ChangeToken, Set[str]]:
+        """Return the current token and the tables written after ``since``.
+
+        Costs a single ``PRAGMA data_version`` when nothing was committed.
+        """
+        with self._lock:
+            current = self._read(since)
+        if current is since:
+            return since, set()
+        return current, _diff(since.versions, current.versions)
+
+    def poll(self) -> Set[str]:
+        """Return tables written since the previous ``poll`` call.
+
+        The first call only records the starting point and returns nothing.
+        """
+        with self._lock:
+            current = self._read(self._last)
+            previous, self._last = self._last, current
+        if previous is None or current is previous:
+            return set()
+        return _diff(previous.versions, current.versions)
+
+    def close(self) -> None:
+        """Close the watch connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def _diff(old: Tuple[Tuple[str, int], ...], new: Tuple[Tuple[str, int], ...]) -> Set[str]:
+    before: Dict[str, int] = dict(old)
+    return {name for name, version in new if before.get(name) != version}
@@ -5,16 +5,72 @@ Contains the Database class and helper functions for profile persistence.
 from __future__ import annotations
 
 import sqlite3
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .cache import QueryCache
+from .changes import ChangeToken, ChangeTracker
+from .migrations import migrate
+from .models import PROXY_COLUMNS, Profile, Proxy
+
+
+def _chunked(items: Iterable, size: int) -> Iterator[List]:
+    """Yield lists of up to ``size`` items from an iterable."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
 
 
 class Database:
     """SQLite database access layer for profiles and proxies."""
 
-    def __init__(self, db_path: str = "browser_profiles.db"):
+    def __init__(self, db_path: str = "browser_profiles.db", cache_size: int = 1024):
         self.db_path = db_path
+        self.cache = QueryCache(max_rows=cache_size)
         self.init_database()
+        self.changes = ChangeTracker(db_path)
+        # Starting point for poll_changes; earlier writes are already in the schema
+        self.changes.poll()
+
+    def change_token(self) -> ChangeToken:
+        """Return a token marking the current state of every tracked table."""
+        return self.changes.token()
+
+    def changed_tables(self, since: ChangeToken) -> Tuple[ChangeToken, Set[str]]:
+        """Return the current token and the tables written after ``since``.
+
+        Writes by any connection or process are seen. When nothing was
+        committed this costs one ``PRAGMA data_version``.
+        """
+        return self.changes.changed_since(since)
+
+    def poll_changes(self) -> Set[str]:
+        """Drop cached reads of tables written since the previous poll.
+
+        Writes through this instance invalidate the cache immediately; this
+        catches writes by other processes and must be called periodically
+        by long-running callers.
+
+        Returns:
+            Names of the tables that changed.
+        """
+        changed = self.changes.poll()
+        if changed:
+            self.cache.invalidate(*changed)
+        return changed
+
+    def cache_stats(self) -> Dict[str, float]:
+        """Return cache hit/miss counters.
+
+        Returns:
+            Dict with hits, misses, hit_rate and cached entry counts.
+        """
+        return self.cache.stats()
 
     def get_connection(self) -> sqlite3.Connection:
         """Create a new database connection.
@@ -27,92 +83,16 @@ class Database:
         return conn
 
     def init_database(self) -> None:
-        """Initialize database schema if it doesn't exist."""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS profiles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                profile_id TEXT UNIQUE NOT NULL,
-                notes TEXT,
-                proxy_id INTEGER,
-                tags TEXT,
-                os TEXT,
-                user_agent TEXT,
-                open_tabs TEXT,
-                timezone_mode TEXT,
-                timezone_value TEXT,
-                geolocation_mode TEXT,
-                geolocation_lat REAL,
-                geolocation_lon REAL,
-                language_mode TEXT,
-                languages TEXT,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                FOREIGN KEY (proxy_id) REFERENCES proxies(id)
-            )
-            """
-        )
-
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS proxies (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                type TEXT NOT NULL,
-                host TEXT NOT NULL,
-                port INTEGER NOT NULL,
-                username TEXT,
-                password TEXT,
-                created_at TEXT NOT NULL
-            )
-            """
-        )
-
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
-            )
-            """
-        )
-
-        conn.commit()
-        conn.close()
-
-        self._ensure_profile_columns()
+        """Bring the database schema up to date.
 
-    def _ensure_profile_columns(self) -> None:
-        """Add missing columns to the profiles table for backward compatibility."""
+        On an up-to-date database this costs a single ``PRAGMA user_version``
+        read; pending migrations run once, each in its own transaction.
+        """
         conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("PRAGMA table_info(profiles)")
-        existing_columns = {row[1] for row in cursor.fetchall()}
-
-        columns_to_add = {
-            "os": "TEXT",
-            "user_agent": "TEXT",
-            "open_tabs": "TEXT",
-            "timezone_mode": "TEXT",
-            "timezone_value": "TEXT",
-            "geolocation_mode": "TEXT",
-            "geolocation_lat": "REAL",
-            "geolocation_lon": "REAL",
-            "language_mode": "TEXT",
-            "languages": "TEXT",
-        }
-
-        for column, col_type in columns_to_add.items():
-            if column not in existing_columns:
-                cursor.execute(f"ALTER TABLE profiles ADD COLUMN {column} {col_type}")
-
-        conn.commit()
-        conn.close()
+        try:
+            migrate(conn)
+        finally:
+            conn.close()
 
     def get_next_profile_number(self) -> int:
         """Get next sequential profile number.
@@ -144,6 +124,10 @@ class Database:
         geolocation_lon: float | None = None,
         language_mode: str | None = None,
         languages: str | None = None,
+        resource_limits: str | None = None,
+        launch_preset: str | None = None,
+        routing_rules: str | None = None,
+        storage_mode: str | None = None,
     ) -> int:
         """Create a new profile.
 
@@ -160,9 +144,10 @@ class Database:
                 name, profile_id, notes, proxy_id, tags,
                 os, user_agent, open_tabs, timezone_mode, timezone_value,
                 geolocation_mode, geolocation_lat, geolocation_lon,
-                language_mode, languages, created_at, updated_at
+                language_mode, languages, resource_limits, launch_preset, routing_rules,
+                storage_mode, created_at, updated_at
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 name,
@@ -180,6 +165,10 @@ class Database:
                 geolocation_lon,
                 language_mode,
                 languages,
+                resource_limits,
+                launch_preset,
+                routing_rules,
+                storage_mode,
                 now,
                 now,
             ),
@@ -188,19 +177,90 @@ class Database:
         profile_db_id = cursor.lastrowid
         conn.commit()
         conn.close()
+        self.cache.invalidate("profiles")
         return profile_db_id
 
-    def get_all_profiles(self) -> List[Dict]:
+    def bulk_create_profiles(self, profiles: Iterable[Dict], chunk_size: int = 1000) -> int:
+        """Create many profiles using chunked transactions.
+
+        Args:
+            profiles: Iterable of dicts with the same keys as
+                ``create_profile`` arguments; ``name`` and ``profile_id``
+                are required.
+            chunk_size: Number of rows inserted per transaction.
+
+        Returns:
+            Number of created profiles.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        now = datetime.now().isoformat()
+        created = 0
+
+        try:
+            for chunk in _chunked(profiles, chunk_size):
+                cursor.executemany(
+                    """
+                    INSERT INTO profiles (
+                        name, profile_id, notes, proxy_id, tags,
+                        os, user_agent, open_tabs, timezone_mode, timezone_value,
+                        geolocation_mode, geolocation_lat, geolocation_lon,
+                        language_mode, languages, resource_limits, launch_preset, routing_rules,
+                        storage_mode, created_at, updated_at
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            profile["name"],
+                            profile["profile_id"],
+                            profile.get("notes") or "",
+                            profile.get("proxy_id"),
+                            profile.get("tags") or "",
+                            profile.get("os"),
+                            profile.get("user_agent"),
+                            profile.get("open_tabs"),
+                            profile.get("timezone_mode"),
+                            profile.get("timezone_value"),
+                            profile.get("geolocation_mode"),
+                            profile.get("geolocation_lat"),
+                            profile.get("geolocation_lon"),
+                            profile.get("language_mode"),
+                            profile.get("languages"),
+                            profile.get("resource_limits"),
+                            profile.get("launch_preset"),
+                            profile.get("routing_rules"),
+                            profile.get("storage_mode"),
+                            now,
+                            now,
+                        )
+                        for profile in chunk
+                    ],
+                )
+                conn.commit()
+                created += len(chunk)
+        finally:
+            conn.close()
+            self.cache.invalidate("profiles")
+
+        return created
+
+    def get_all_profiles(self) -> List[Profile]:
         """Return all profiles with proxy info."""
+        return list(self.cache.get_snapshot("profiles", ("profiles", "proxies"), self._query_all_profiles))
+
+    def _query_all_profiles(self) -> List[Profile]:
         conn = self.get_connection()
         cursor = conn.cursor()
+        cursor.row_factory = Profile.row_factory
 
         cursor.execute(
             """
             SELECT p.id, p.name, p.profile_id, p.notes, p.proxy_id, p.tags,
                    p.os, p.user_agent, p.open_tabs, p.timezone_mode, p.timezone_value,
                    p.geolocation_mode, p.geolocation_lat, p.geolocation_lon,
-                   p.language_mode, p.languages,
+                   p.language_mode, p.languages, p.resource_limits, p.launch_preset,
+                   p.routing_rules, p.storage_mode,
                    pr.name as proxy_name, pr.type as proxy_type,
                    pr.host as proxy_host, pr.port as proxy_port
             FROM profiles p
@@ -212,19 +272,39 @@ class Database:
         rows = cursor.fetchall()
         conn.close()
 
-        return [dict(row) for row in rows]
+        return rows
+
+    def has_resource_limits(self) -> bool:
+        """Return True if any profile has resource limits set."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-    def get_profile_by_id(self, profile_id: str) -> Optional[Dict]:
+        cursor.execute("SELECT 1 FROM profiles WHERE resource_limits IS NOT NULL LIMIT 1")
+        row = cursor.fetchone()
+        conn.close()
+
+        return row is not None
+
+    def get_profile_by_id(self, profile_id: str) -> Optional[Profile]:
         """Return a profile by profile_id."""
+        return self.cache.get_row(
+            ("profile", profile_id),
+            ("profiles", "proxies"),
+            lambda: self._query_profile_by_id(profile_id),
+        )
+
+    def _query_profile_by_id(self, profile_id: str) -> Optional[Profile]:
         conn = self.get_connection()
         cursor = conn.cursor()
+        cursor.row_factory = Profile.row_factory
 
         cursor.execute(
             """
             SELECT p.id, p.name, p.profile_id, p.notes, p.proxy_id, p.tags,
                    p.os, p.user_agent, p.open_tabs, p.timezone_mode, p.timezone_value,
                    p.geolocation_mode, p.geolocation_lat, p.geolocation_lon,
-                   p.language_mode, p.languages,
+                   p.language_mode, p.languages, p.resource_limits, p.launch_preset,
+                   p.routing_rules, p.storage_mode,
                    pr.name as proxy_name, pr.type as proxy_type,
                    pr.host as proxy_host, pr.port as proxy_port,
                    pr.username as proxy_username, pr.password as proxy_password
@@ -238,7 +318,7 @@ class Database:
         row = cursor.fetchone()
         conn.close()
 
-        return dict(row) if row else None
+        return row
 
     def update_profile(
         self,
@@ -257,8 +337,17 @@ class Database:
         geolocation_lon: float | None = None,
         language_mode: str | None = None,
         languages: str | None = None,
+        resource_limits: str | None = None,
+        launch_preset: str | None = None,
+        routing_rules: str | None = None,
+        storage_mode: str | None = None,
     ) -> None:
-        """Update profile fields by profile_id."""
+        """Update profile fields by profile_id.
+
+        ``None`` leaves a field unchanged; pass an empty string to clear
+        ``resource_limits``, ``launch_preset``, ``routing_rules`` or
+        ``storage_mode``.
+        """
         conn = self.get_connection()
         cursor = conn.cursor()
 
@@ -307,6 +396,18 @@ class Database:
         if languages is not None:
             updates.append("languages = ?")
             params.append(languages)
+        if resource_limits is not None:
+            updates.append("resource_limits = ?")
+            params.append(resource_limits or None)
+        if launch_preset is not None:
+            updates.append("launch_preset = ?")
+            params.append(launch_preset or None)
+        if routing_rules is not None:
+            updates.append("routing_rules = ?")
+            params.append(routing_rules or None)
+        if storage_mode is not None:
+            updates.append("storage_mode = ?")
+            params.append(storage_mode or None)
 
         updates.append("updated_at = ?")
         params.append(datetime.now().isoformat())
@@ -323,6 +424,7 @@ class Database:
 
         conn.commit()
         conn.close()
+        self.cache.invalidate("profiles")
 
     def delete_profile(self, profile_id: str) -> None:
         """Delete a profile by profile_id."""
@@ -333,6 +435,7 @@ class Database:
 
         conn.commit()
         conn.close()
+        self.cache.invalidate("profiles")
 
     def create_proxy(
         self,
@@ -363,29 +466,86 @@ class Database:
         proxy_id = cursor.lastrowid
         conn.commit()
         conn.close()
+        self.cache.invalidate("proxies")
         return proxy_id
 
-    def get_all_proxies(self) -> List[Dict]:
+    def bulk_create_proxies(self, proxies: Iterable[Dict], chunk_size: int = 5000) -> int:
+        """Create many proxies using chunked transactions.
+
+        Args:
+            proxies: Iterable of dicts with name, type, host, port and
+                optional username/password keys.
+            chunk_size: Number of rows inserted per transaction.
+
+        Returns:
+            Number of created proxies.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        now = datetime.now().isoformat()
+        created = 0
+
+        try:
+            for chunk in _chunked(proxies, chunk_size):
+                cursor.executemany(
+                    """
+                    INSERT INTO proxies (name, type, host, port, username, password, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            proxy["name"],
+                            proxy["type"],
+                            proxy["host"],
+                            proxy["port"],
+                            proxy.get("username"),
+                            proxy.get("password"),
+                            now,
+                        )
+                        for proxy in chunk
+                    ],
+                )
+                conn.commit()
+                created += len(chunk)
+        finally:
+            conn.close()
+            self.cache.invalidate("proxies")
+
+        return created
+
+    def get_all_proxies(self) -> List[Proxy]:
         """Return all proxies."""
+        return list(self.cache.get_snapshot("proxies", ("proxies",), self._query_all_proxies))
+
+    def _query_all_proxies(self) -> List[Proxy]:
         conn = self.get_connection()
         cursor = conn.cursor()
+        cursor.row_factory = Proxy.row_factory
 
-        cursor.execute("SELECT * FROM proxies ORDER BY created_at DESC")
+        cursor.execute(f"SELECT {PROXY_COLUMNS} FROM proxies ORDER BY created_at DESC")
         rows = cursor.fetchall()
         conn.close()
 
-        return [dict(row) for row in rows]
+        return rows
 
-    def get_proxy_by_id(self, proxy_id: int) -> Optional[Dict]:
+    def get_proxy_by_id(self, proxy_id: int) -> Optional[Proxy]:
         """Return proxy by ID."""
+        return self.cache.get_row(
+            ("proxy", proxy_id),
+            ("proxies",),
+            lambda: self._query_proxy_by_id(proxy_id),
+        )
+
+    def _query_proxy_by_id(self, proxy_id: int) -> Optional[Proxy]:
         conn = self.get_connection()
         cursor = conn.cursor()
+        cursor.row_factory = Proxy.row_factory
 
-        cursor.execute("SELECT * FROM proxies WHERE id = ?", (proxy_id,))
+        cursor.execute(f"SELECT {PROXY_COLUMNS} FROM proxies WHERE id = ?", (proxy_id,))
         row = cursor.fetchone()
         conn.close()
 
-        return dict(row) if row else None
+        return row
 
     def update_proxy(
         self,
@@ -440,6 +600,7 @@ class Database:
 
         conn.commit()
         conn.close()
+        self.cache.invalidate("proxies")
 
     def delete_proxy(self, proxy_id: int) -> None:
         """Delete proxy by ID and unlink from profiles."""
@@ -451,9 +612,70 @@ class Database:
 
         conn.commit()
         conn.close()
+        self.cache.invalidate("proxies", "profiles")
+
+    def add_traffic_stats(self, rows: Iterable[Tuple[str, int, str, int, int, int]]) -> None:
+        """Add traffic counters in a single transaction.
+
+        Args:
+            rows: Tuples of (profile_id, proxy_id, day, bytes_sent,
+                bytes_received, requests); values are added to existing
+                counters for the same profile, proxy and day.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.executemany(
+                """
+                INSERT INTO traffic_stats (profile_id, proxy_id, day, bytes_sent, bytes_received, requests)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (profile_id, proxy_id, day) DO UPDATE SET
+                    bytes_sent = bytes_sent + excluded.bytes_sent,
+                    bytes_received = bytes_received + excluded.bytes_received,
+                    requests = requests + excluded.requests
+                """,
+                list(rows),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+            self.cache.invalidate("traffic_stats")
+
+    def get_traffic_by_profile(self) -> Dict[str, Tuple[int, int]]:
+        """Return total (bytes_sent, bytes_received) per profile_id."""
+        return dict(self.cache.get_snapshot(
+            "traffic_by_profile", ("traffic_stats",), lambda: self._query_traffic("profile_id")
+        ))
+
+    def get_traffic_by_proxy(self) -> Dict[int, Tuple[int, int]]:
+        """Return total (bytes_sent, bytes_received) per proxy_id."""
+        return dict(self.cache.get_snapshot(
+            "traffic_by_proxy", ("traffic_stats",), lambda: self._query_traffic("proxy_id")
+        ))
+
+    def _query_traffic(self, column: str) -> Dict:
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            f"""
+            SELECT {column}, SUM(bytes_sent), SUM(bytes_received)
+            FROM traffic_stats
+            GROUP BY {column}
+            """
+        )
+        totals = {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+        conn.close()
+
+        return totals
 
     def get_setting(self, key: str, default: str | None = None) -> Optional[str]:
         """Get a setting value by key."""
+        value = self.cache.get_row(("setting", key), ("settings",), lambda: self._query_setting(key))
+        return value if value is not None else default
+
+    def _query_setting(self, key: str) -> Optional[str]:
         conn = self.get_connection()
         cursor = conn.cursor()
 
@@ -461,7 +683,7 @@ class Database:
         row = cursor.fetchone()
         conn.close()
 
-        return row[0] if row else default
+        return row[0] if row else None
 
     def set_setting(self, key: str, value: str) -> None:
         """Persist a setting value."""
@@ -478,6 +700,140 @@ class Database:
 
         conn.commit()
         conn.close()
+        self.cache.invalidate("settings")
+
+    def delete_setting(self, key: str) -> None:
+        """Remove a setting."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("DELETE FROM settings WHERE key = ?", (key,))
+
+        conn.commit()
+        conn.close()
+        self.cache.invalidate("settings")
+
+    def acquire_profile_lease(
+        self,
+        profile_id: str,
+        owner: str,
+        hostname: str,
+        pid: int,
+        ttl: float,
+        steal_from: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """Take or renew the lease on a profile.
+
+        Args:
+            profile_id: Profile to lease.
+            owner: Unique id of the lease holder.
+            hostname: Host of the lease holder.
+            pid: Process id of the lease holder.
+            ttl: Seconds until the lease expires without a heartbeat.
+            steal_from: Owner whose unexpired lease may be taken over, e.g.
+                a local process known to be dead.
+
+        Returns:
+            None if the lease is now held by ``owner``; otherwise the row of
+            the current holder with ``owner``, ``hostname``, ``pid`` and
+            ``expires_at``.
+        """
+        conn = self.get_connection()
+        conn.isolation_level = None
+        cursor = conn.cursor()
+        now = time.time()
+
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute(
+                "SELECT owner, hostname, pid, expires_at FROM profile_leases WHERE profile_id = ?",
+                (profile_id,),
+            )
+            row = cursor.fetchone()
+            if row is not None and row["owner"] not in (owner, steal_from) and row["expires_at"] > now:
+                cursor.execute("ROLLBACK")
+                return dict(row)
+
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO profile_leases (profile_id, owner, hostname, pid, acquired_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (profile_id, owner, hostname, pid, now, now + ttl),
+            )
+            cursor.execute("COMMIT")
+            return None
+        except Exception:
+            if conn.in_transaction:
+                cursor.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def release_profile_lease(self, profile_id: str, owner: str) -> None:
+        """Drop a lease if it is still held by ``owner``."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "DELETE FROM profile_leases WHERE profile_id = ? AND owner = ?",
+            (profile_id, owner),
+        )
+
+        conn.commit()
+        conn.close()
+
+    def renew_profile_leases(self, owner: str, ttl: float) -> int:
+        """Extend every lease held by ``owner``.
+
+        Returns:
+            Number of renewed leases.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "UPDATE profile_leases SET expires_at = ? WHERE owner = ?",
+            (time.time() + ttl, owner),
+        )
+        renewed = cursor.rowcount
+
+        conn.commit()
+        conn.close()
+
+        return renewed
+
+    def release_profile_leases(self, owner: str) -> None:
+        """Drop every lease held by ``owner``."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("DELETE FROM profile_leases WHERE owner = ?", (owner,))
+
+        conn.commit()
+        conn.close()
+
+    def get_profile_leases(self, exclude_owner: Optional[str] = None) -> Dict[str, Dict]:
+        """Return unexpired leases keyed by profile_id.
+
+        Args:
+            exclude_owner: Leave out leases held by this owner.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            SELECT profile_id, owner, hostname, pid, expires_at
+            FROM profile_leases
+            WHERE expires_at > ? AND owner != ?
+            """,
+            (time.time(), exclude_owner or ""),
+        )
+        leases = {row["profile_id"]: dict(row) for row in cursor.fetchall()}
+        conn.close()
+
+        return leases
 
 
 def save_profile(
@@ -498,6 +854,10 @@ def save_profile(
     geolocation_lon: float | None = None,
     language_mode: str | None = None,
     languages: str | None = None,
+    resource_limits: str | None = None,
+    launch_preset: str | None = None,
+    routing_rules: str | None = None,
+    storage_mode: str | None = None,
 ) -> int:
     """Save a profile using the Database instance.
 
@@ -518,6 +878,10 @@ def save_profile(
         geolocation_lon: Longitude if manual.
         language_mode: Language mode.
         languages: JSON string with language list.
+        resource_limits: JSON string with cgroup limits.
+        launch_preset: Launch preset name, None for the global default.
+        routing_rules: JSON string with request filtering rules.
+        storage_mode: ``ephemeral`` or ``ephemeral_state``, None for persistent.
 
     Returns:
         Database row ID of the created profile.
@@ -542,6 +906,10 @@ def save_profile(
             geolocation_lon=geolocation_lon,
             language_mode=language_mode,
             languages=languages,
+            resource_limits=resource_limits,
+            launch_preset=launch_preset,
+            routing_rules=routing_rules,
+            storage_mode=storage_mode,
         )
     except Exception as exc:
         raise RuntimeError(f"Failed to save profile: {exc}") from exc
@@ -0,0 +1,239 @@
+"""Versioned schema migrations.
+
+The schema version is stored in ``PRAGMA user_version``. Each migration
+step upgrades the schema by one version and runs exactly once, inside a
+transaction together with the version bump. To change the schema, append
+a new step to ``MIGRATIONS``; never edit a step that has already shipped.
+"""
+from __future__ import annotations
+
+import sqlite3
+from typing import Callable, List
+
+
+def _initial_schema(cursor: sqlite3.Cursor) -> None:
+    """Create base tables and add columns missing in legacy databases."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS profiles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            profile_id TEXT UNIQUE NOT NULL,
+            notes TEXT,
+            proxy_id INTEGER,
+            tags TEXT,
+            os TEXT,
+            user_agent TEXT,
+            open_tabs TEXT,
+            timezone_mode TEXT,
+            timezone_value TEXT,
+            geolocation_mode TEXT,
+            geolocation_lat REAL,
+            geolocation_lon REAL,
+            language_mode TEXT,
+            languages TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            FOREIGN KEY (proxy_id) REFERENCES proxies(id)
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS proxies (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            type TEXT NOT NULL,
+            host TEXT NOT NULL,
+            port INTEGER NOT NULL,
+            username TEXT,
+            password TEXT,
+            created_at TEXT NOT NULL
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS settings (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+        """
+    )
+
+    # Databases created before versioning may lack newer profile columns
+    cursor.execute("PRAGMA table_info(profiles)")
+    existing_columns = {row[1] for row in cursor.fetchall()}
+
+    columns_to_add = {
+        "os": "TEXT",
+        "user_agent": "TEXT",
+        "open_tabs": "TEXT",
+        "timezone_mode": "TEXT",
+        "timezone_value": "TEXT",
+        "geolocation_mode": "TEXT",
+        "geolocation_lat": "REAL",
+        "geolocation_lon": "REAL",
+        "language_mode": "TEXT",
+        "languages": "TEXT",
+    }
+
+    for column, col_type in columns_to_add.items():
+        if column not in existing_columns:
+            cursor.execute(f"ALTER TABLE profiles ADD COLUMN {column} {col_type}")
+
+
+def _list_indexes(cursor: sqlite3.Cursor) -> None:
+    """Index the columns used by list ordering and proxy lookups."""
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_profiles_created_at ON profiles(created_at)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_profiles_proxy_id ON profiles(proxy_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_proxies_created_at ON proxies(created_at)")
+
+
+def _profile_resource_limits(cursor: sqlite3.Cursor) -> None:
+    """Add per-profile cgroup limits stored as JSON."""
+    cursor.execute("ALTER TABLE profiles ADD COLUMN resource_limits TEXT")
+
+
+def _profile_launch_preset(cursor: sqlite3.Cursor) -> None:
+    """Add the per-profile launch preset; NULL means the global default."""
+    cursor.execute("ALTER TABLE profiles ADD COLUMN launch_preset TEXT")
+
+
+def _profile_routing_rules(cursor: sqlite3.Cursor) -> None:
+    """Add per-profile request filtering rules stored as JSON."""
+    cursor.execute("ALTER TABLE profiles ADD COLUMN routing_rules TEXT")
+
+
+def _traffic_stats(cursor: sqlite3.Cursor) -> None:
+    """Daily traffic counters per profile and proxy (proxy_id 0 is direct)."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS traffic_stats (
+            profile_id TEXT NOT NULL,
+            proxy_id INTEGER NOT NULL DEFAULT 0,
+            day TEXT NOT NULL,
+            bytes_sent INTEGER NOT NULL DEFAULT 0,
+            bytes_received INTEGER NOT NULL DEFAULT 0,
+            requests INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (profile_id, proxy_id, day)
+        )
+        """
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_traffic_stats_proxy_id ON traffic_stats(proxy_id)")
+
+
+def _profile_storage_mode(cursor: sqlite3.Cursor) -> None:
+    """Persistent or ephemeral profile storage (NULL keeps the persistent default)."""
+    cursor.execute("ALTER TABLE profiles ADD COLUMN storage_mode TEXT")
+
+
+def _profile_leases(cursor: sqlite3.Cursor) -> None:
+    """Cross-process leases on running profiles, renewed by heartbeats."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS profile_leases (
+            profile_id TEXT PRIMARY KEY,
+            owner TEXT NOT NULL,
+            hostname TEXT NOT NULL,
+            pid INTEGER NOT NULL,
+            acquired_at REAL NOT NULL,
+            expires_at REAL NOT NULL
+        )
+        """
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_profile_leases_owner ON profile_leases(owner)")
+
+
+def _table_versions(cursor: sqlite3.Cursor) -> None:
+    """Add per-table write counters kept up to date by triggers."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS table_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    # Tables added later get their counters and triggers in their own step
+    for table in ("profiles", "proxies", "settings", "traffic_stats", "profile_leases"):
+        cursor.execute("INSERT OR IGNORE INTO table_versions (name) VALUES (?)", (table,))
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            cursor.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_{event.lower()}_version
+                AFTER {event} ON {table}
+                BEGIN
+                    UPDATE table_versions SET version = version + 1 WHERE name = '{table}';
+                END
+                """
+            )
+
+
+# Index i upgrades the schema from version i to version i + 1
+MIGRATIONS: List[Callable[[sqlite3.Cursor], None]] = [
+    _initial_schema,
+    _list_indexes,
+    _profile_resource_limits,
+    _profile_launch_preset,
+    _profile_routing_rules,
+    _traffic_stats,
+    _profile_storage_mode,
+    _profile_leases,
+    _table_versions,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Return the schema version stored in the database."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """Apply pending migrations.
+
+    Each step runs in its own ``BEGIN IMMEDIATE`` transaction, so
+    concurrent processes serialize on the write lock and a step never runs
+    twice.
+
+    Args:
+        conn: Open SQLite connection.
+
+    Returns:
+        Schema version after migration.
+
+    Raises:
+        RuntimeError: If the database was created by a newer version.
+    """
+    version = get_schema_version(conn)
+    if version == SCHEMA_VERSION:
+        return version
+    if version > SCHEMA_VERSION:
+        raise RuntimeError(
+            f"Database schema version {version} is newer than supported {SCHEMA_VERSION}"
+        )
+
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None
+    try:
+        while True:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                # Another process may have migrated while we waited for the lock
+                version = get_schema_version(conn)
+                if version >= SCHEMA_VERSION:
+                    cursor.execute("COMMIT")
+                    return version
+                MIGRATIONS[version](cursor)
+                cursor.execute(f"PRAGMA user_version = {version + 1}")
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+    finally:
+        conn.isolation_level = isolation_level
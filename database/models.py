@@ -0,0 +1,105 @@
+"""Typed row objects returned by the Database layer.
+
+Rows are slotted dataclasses filled positionally by a cursor
+``row_factory``, which is cheaper in memory and construction time than
+``dict(sqlite3.Row)``. For compatibility with code that still treats rows
+as mappings, they also support ``row["field"]``, ``row.get("field")`` and
+``dict(row)``.
+
+Rows are frozen because the query cache hands the same instances to every
+caller; use ``dataclasses.replace`` or ``dict(row)`` to get a modified copy.
+"""
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar, FrozenSet, Iterator, Optional, Tuple
+
+
+class _MappingRow:
+    """Read-only mapping interface over dataclass fields."""
+
+    __slots__ = ()
+    FIELDS: ClassVar[Tuple[str, ...]] = ()
+    _FIELD_SET: ClassVar[FrozenSet[str]] = frozenset()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._FIELD_SET
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.FIELDS)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self._FIELD_SET:
+            return default
+        return getattr(self, key)
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.FIELDS
+
+    @classmethod
+    def row_factory(cls, cursor: sqlite3.Cursor, row: tuple):
+        """``sqlite3`` row factory; query columns must follow field order."""
+        return cls(*row)
+
+
+def _finalize(cls):
+    cls.FIELDS = tuple(f.name for f in fields(cls))
+    cls._FIELD_SET = frozenset(cls.FIELDS)
+    return cls
+
+
+@_finalize
+@dataclass(slots=True, frozen=True)
+class Proxy(_MappingRow):
+    """Row of the ``proxies`` table."""
+
+    id: int
+    name: str
+    type: str
+    host: str
+    port: int
+    username: Optional[str] = None
+    password: Optional[str] = None
+    created_at: Optional[str] = None
+
+
+@_finalize
+@dataclass(slots=True, frozen=True)
+class Profile(_MappingRow):
+    """Row of the ``profiles`` table joined with its proxy."""
+
+    id: int
+    name: str
+    profile_id: str
+    notes: Optional[str] = None
+    proxy_id: Optional[int] = None
+    tags: Optional[str] = None
+    os: Optional[str] = None
+    user_agent: Optional[str] = None
+    open_tabs: Optional[str] = None
+    timezone_mode: Optional[str] = None
+    timezone_value: Optional[str] = None
+    geolocation_mode: Optional[str] = None
+    geolocation_lat: Optional[float] = None
+    geolocation_lon: Optional[float] = None
+    language_mode: Optional[str] = None
+    languages: Optional[str] = None
+    resource_limits: Optional[str] = None
+    launch_preset: Optional[str] = None
+    routing_rules: Optional[str] = None
+    storage_mode: Optional[str] = None
+    proxy_name: Optional[str] = None
+    proxy_type: Optional[str] = None
+    proxy_host: Optional[str] = None
+    proxy_port: Optional[int] = None
+    proxy_username: Optional[str] = None
+    proxy_password: Optional[str] = None
+
+
+PROXY_COLUMNS = ", ".join(Proxy.FIELDS)
@@ -0,0 +1,311 @@
+"""Local automation control API.
+
+Serves a small HTTP/JSON API on an asyncio server so external tooling can
+list, launch, stop and query profiles without going through the UI.
+
+Endpoints:
+    GET  /profiles                  List profiles with their status.
+    GET  /profiles/<id>             Status of a single profile.
+    POST /profiles/<id>/launch      Launch a profile.
+    POST /profiles/<id>/stop        Stop a profile.
+    POST /profiles/batch            Body: {"action": "launch"|"stop",
+                                           "profile_ids": [...]}.
+    GET  /resources                 Latest RSS/CPU/child-process samples of
+                                    all running profiles.
+
+Every request must carry ``Authorization: Bearer <token>``; a random token
+is generated when none is configured. Because the API hands out CDP
+endpoints, requests from browsers are refused as well: the ``Host`` header
+must name a loopback address (against DNS rebinding), a foreign ``Origin``
+is rejected, and POST bodies must be ``application/json``, which a web page
+cannot send cross-origin without a CORS preflight this server never grants.
+"""
+from __future__ import annotations
+
+import asyncio
+import hmac
+import json
+import secrets
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+# Largest accepted request body; a batch of thousands of profile IDs fits
+MAX_BODY_SIZE = 256 * 1024
+LOOPBACK_HOSTS = {"127.0.0.1", "localhost", "::1"}
+
+HTTP_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    415: "Unsupported Media Type",
+    500: "Internal Server Error",
+}
+
+
+def generate_token() -> str:
+    """Return a new random API token."""
+    return secrets.token_urlsafe(32)
+
+
+def _host_name(value: str) -> str:
+    """Strip the port from a ``Host`` header or URL authority."""
+    if value.startswith("["):
+        return value[1:].partition("]")[0]
+    return value.rpartition(":")[0] if value.count(":") == 1 else value
+
+
+def is_loopback_host(value: Optional[str]) -> bool:
+    """Return True if a ``Host`` header names this machine's loopback interface."""
+    return bool(value) and _host_name(value.strip().lower()) in LOOPBACK_HOSTS
+
+
+def is_local_origin(value: Optional[str]) -> bool:
+    """Return True if an ``Origin`` header is absent or a loopback http(s) origin."""
+    if value is None:
+        return True
+    scheme, sep, authority = value.strip().lower().partition("://")
+    return bool(sep) and scheme in ("http", "https") and is_loopback_host(authority)
+
+
+class ControlAPIServer:
+    """Asyncio HTTP server exposing profile lifecycle operations.
+
+    The server must run on the same event loop as the ``BrowserManager``
+    it controls, because Playwright objects are bound to their loop.
+    Database access goes through an ``AsyncDatabase`` so request handling
+    never blocks that loop. Without a ``token`` a random one is generated;
+    read it from ``self.token``.
+    """
+
+    def __init__(
+        self,
+        db,
+        browser_manager,
+        launch_profile: Callable[[str], Awaitable[object]],
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        token: Optional[str] = None,
+        on_change: Optional[Callable[[], None]] = None,
+        resource_monitor=None,
+        launch_scheduler=None,
+    ):
+        self.db = db
+        self.browser_manager = browser_manager
+        self.launch_profile = launch_profile
+        self.host = host
+        self.port = port
+        self.token = token or generate_token()
+        self.on_change = on_change
+        self.resource_monitor = resource_monitor
+        self.launch_scheduler = launch_scheduler
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._server is not None
+
+    async def start(self) -> None:
+        """Start listening for API requests."""
+        if self._server is None:
+            self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+
+    async def stop(self) -> None:
+        """Stop the server and close the listening socket."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def profile_status(self, profile: Dict) -> Dict:
+        """Build the status payload for a profile row."""
+        profile_id = profile["profile_id"]
+        is_running = self.browser_manager.is_profile_running(profile_id)
+        ws_endpoint = None
+        if is_running:
+            ws_endpoint = await asyncio.to_thread(self.browser_manager.get_cdp_endpoint, profile_id)
+        if is_running:
+            status = "running"
+        elif self.launch_scheduler is not None and self.launch_scheduler.is_launching(profile_id):
+            status = "launching"
+        elif self.launch_scheduler is not None and self.launch_scheduler.is_queued(profile_id):
+            status = "queued"
+        else:
+            status = "stopped"
+        return {
+            "profile_id": profile_id,
+            "name": profile.get("name"),
+            "status": status,
+            "cdp_url": self.browser_manager.get_cdp_url(profile_id) if is_running else None,
+            "ws_endpoint": ws_endpoint,
+            "resources": self._resources(profile_id) if is_running else None,
+            "idle_seconds": self._idle_seconds(profile_id) if is_running else None,
+        }
+
+    def _idle_seconds(self, profile_id: str) -> Optional[int]:
+        idle = self.browser_manager.get_idle_seconds(profile_id)
+        return int(idle) if idle is not None else None
+
+    def _resources(self, profile_id: str) -> Optional[Dict]:
+        if self.resource_monitor is None:
+            return None
+        stats = self.resource_monitor.get(profile_id)
+        return stats.to_dict() if stats else None
+
+    async def _launch(self, profile_id: str) -> Dict:
+        profile = await self.db.get_profile_by_id(profile_id)
+        if not profile:
+            return {"profile_id": profile_id, "error": "Profile not found"}
+        try:
+            await self.launch_profile(profile_id)
+        except asyncio.CancelledError:
+            # Queued launch was cancelled by a stop request
+            return {"profile_id": profile_id, "error": "Launch cancelled"}
+        except Exception as exc:
+            return {"profile_id": profile_id, "error": str(exc)}
+        return await self.profile_status(profile)
+
+    async def _stop(self, profile_id: str) -> Dict:
+        profile = await self.db.get_profile_by_id(profile_id)
+        if not profile:
+            return {"profile_id": profile_id, "error": "Profile not found"}
+        if self.launch_scheduler is not None:
+            self.launch_scheduler.cancel(profile_id)
+        await self.browser_manager.stop_profile(profile_id)
+        return await self.profile_status(profile)
+
+    async def dispatch(self, method: str, path: str, body: Optional[Dict]) -> Tuple[int, object]:
+        """Route a request to its handler.
+
+        Returns:
+            Tuple of HTTP status code and JSON-serializable payload.
+        """
+        parts = [part for part in path.split("?", 1)[0].split("/") if part]
+        if parts == ["resources"]:
+            if method != "GET":
+                return 405, {"error": "Method not allowed"}
+            if self.resource_monitor is None:
+                return 200, []
+            return 200, [
+                {"profile_id": profile_id, **stats.to_dict()}
+                for profile_id, stats in self.resource_monitor.snapshot().items()
+            ]
+
+        if not parts or parts[0] != "profiles":
+            return 404, {"error": "Not found"}
+
+        if len(parts) == 1:
+            if method != "GET":
+                return 405, {"error": "Method not allowed"}
+            profiles = await self.db.get_all_profiles()
+            return 200, [await self.profile_status(profile) for profile in profiles]
+
+        if len(parts) == 2 and parts[1] == "batch":
+            if method != "POST":
+                return 405, {"error": "Method not allowed"}
+            action = (body or {}).get("action")
+            profile_ids = (body or {}).get("profile_ids")
+            if action not in ("launch", "stop") or not isinstance(profile_ids, list):
+                return 400, {"error": "Expected {'action': 'launch'|'stop', 'profile_ids': [...]}"}
+            handler = self._launch if action == "launch" else self._stop
+            results: List[Dict] = await asyncio.gather(
+                *(handler(str(profile_id)) for profile_id in profile_ids)
+            )
+            self._notify_change()
+            return 200, results
+
+        profile_id = parts[1]
+        if len(parts) == 2:
+            if method != "GET":
+                return 405, {"error": "Method not allowed"}
+            profile = await self.db.get_profile_by_id(profile_id)
+            if not profile:
+                return 404, {"error": "Profile not found"}
+            return 200, await self.profile_status(profile)
+
+        if len(parts) == 3 and parts[2] in ("launch", "stop"):
+            if method != "POST":
+                return 405, {"error": "Method not allowed"}
+            handler = self._launch if parts[2] == "launch" else self._stop
+            result = await handler(profile_id)
+            self._notify_change()
+            if result.get("error") == "Profile not found":
+                return 404, result
+            return (500 if "error" in result else 200), result
+
+        return 404, {"error": "Not found"}
+
+    def _notify_change(self) -> None:
+        if self.on_change:
+            try:
+                self.on_change()
+            except Exception:
+                pass
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            status, payload = await self._handle_request(reader)
+        except Exception as exc:
+            status, payload = 500, {"error": str(exc)}
+
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        try:
+            writer.write(head.encode("ascii") + data)
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _handle_request(self, reader: asyncio.StreamReader) -> Tuple[int, object]:
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        try:
+            method, path, _version = request_line.split(" ", 2)
+        except ValueError:
+            return 400, {"error": "Malformed request line"}
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if not is_loopback_host(headers.get("host")):
+            return 403, {"error": "Host must be a loopback address"}
+        if not is_local_origin(headers.get("origin")):
+            return 403, {"error": "Cross-origin requests are not allowed"}
+        authorization = headers.get("authorization", "")
+        if not hmac.compare_digest(authorization.encode("latin-1"), f"Bearer {self.token}".encode("utf-8")):
+            return 401, {"error": "Unauthorized"}
+
+        method = method.upper()
+        content_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+        if method == "POST" and content_type != "application/json":
+            return 415, {"error": "Content-Type must be application/json"}
+
+        body = None
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            return 400, {"error": "Invalid Content-Length"}
+        if length < 0:
+            return 400, {"error": "Invalid Content-Length"}
+        if length > MAX_BODY_SIZE:
+            return 413, {"error": "Payload too large"}
+        if length:
+            try:
+                body = json.loads((await reader.readexactly(length)).decode("utf-8"))
+            except asyncio.IncompleteReadError:
+                return 400, {"error": "Body shorter than Content-Length"}
+            except ValueError:
+                return 400, {"error": "Invalid JSON body"}
+
+        return await self.dispatch(method, path, body)
@@ -0,0 +1,218 @@
+"""Admission control for profile launches.
+
+``LaunchScheduler`` sits in front of ``BrowserManager.launch_profile``.
+A launch is admitted only while the number of running profiles is below
+``max_running`` and ``MemAvailable`` from ``/proc/meminfo`` is above
+``min_free_bytes``; otherwise it waits in a priority queue (FIFO within
+the same priority). Admitted launches run concurrently and count towards
+``max_running`` until they finish, so a burst of submits cannot overshoot
+the limit while browsers are still starting.
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+MEMINFO_PATH = "/proc/meminfo"
+POLL_INTERVAL = 2.0
+
+
+def read_mem_available() -> Optional[int]:
+    """Return ``MemAvailable`` in bytes, or None if it cannot be read."""
+    try:
+        with open(MEMINFO_PATH, "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+@dataclass(order=True)
+class _QueuedLaunch:
+    priority: int
+    seq: int
+    profile_id: str = field(compare=False)
+    launch: Callable[[], Awaitable[object]] = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    task: Optional[asyncio.Task] = field(default=None, compare=False)
+
+
+class LaunchScheduler:
+    """Queue of pending launches gated by profile count and free memory.
+
+    Args:
+        browser_manager: BrowserManager whose running profiles are counted.
+        max_running: Maximum number of running profiles, 0 for no limit.
+        min_free_bytes: Minimum ``MemAvailable`` required to admit a launch,
+            0 to disable the check.
+        on_change: Optional callback invoked when the queue changes.
+        poll_interval: Seconds between admission checks while blocked.
+    """
+
+    def __init__(
+        self,
+        browser_manager,
+        max_running: int = 0,
+        min_free_bytes: int = 0,
+        on_change: Optional[Callable[[], None]] = None,
+        poll_interval: float = POLL_INTERVAL,
+    ):
+        self.browser_manager = browser_manager
+        self.max_running = max_running
+        self.min_free_bytes = min_free_bytes
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        # Why the head of the queue is waiting: "max_running", "memory" or None
+        self.blocked_by: Optional[str] = None
+        self._heap: List[_QueuedLaunch] = []
+        self._entries: Dict[str, _QueuedLaunch] = {}
+        # Admitted launches that have not finished yet
+        self._launching: Dict[str, _QueuedLaunch] = {}
+        self._counter = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def _running_count(self) -> int:
+        # A launch is counted once, whether or not its browser is registered yet
+        return len(self.browser_manager.running_browsers.keys() | self._launching.keys())
+
+    def check_admission(self) -> Optional[str]:
+        """Return the reason a launch cannot start now, or None."""
+        if self.max_running > 0 and self._running_count() >= self.max_running:
+            return "max_running"
+        if self.min_free_bytes > 0:
+            available = read_mem_available()
+            if available is not None and available < self.min_free_bytes:
+                return "memory"
+        return None
+
+    async def submit(
+        self,
+        profile_id: str,
+        launch: Callable[[], Awaitable[object]],
+        priority: int = 0,
+    ):
+        """Queue a launch and wait until it has run.
+
+        Args:
+            profile_id: Profile being launched; a second submit for a queued
+                profile waits for the first one.
+            launch: Coroutine function that performs the launch.
+            priority: Lower values are admitted first.
+
+        Returns:
+            Result of ``launch()``.
+
+        Raises:
+            asyncio.CancelledError: If the launch was cancelled.
+        """
+        if self.browser_manager.is_profile_running(profile_id):
+            return await launch()
+
+        entry = self._entries.get(profile_id) or self._launching.get(profile_id)
+        if entry is None:
+            entry = _QueuedLaunch(
+                priority, next(self._counter), profile_id, launch,
+                asyncio.get_running_loop().create_future(),
+            )
+            heapq.heappush(self._heap, entry)
+            self._entries[profile_id] = entry
+            if self._task is None:
+                self._task = asyncio.create_task(self._dispatch())
+            self._notify()
+        # Cancelling one waiter must not cancel the launch for the others
+        return await asyncio.shield(entry.future)
+
+    async def _dispatch(self) -> None:
+        self._wakeup = asyncio.Event()
+        try:
+            while self._heap:
+                reason = self.check_admission()
+                if reason != self.blocked_by:
+                    self.blocked_by = reason
+                    self._notify()
+                if reason:
+                    # A finished launch may free a slot before the next poll
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    self._wakeup.clear()
+                    continue
+
+                entry = heapq.heappop(self._heap)
+                self._entries.pop(entry.profile_id, None)
+                self._launching[entry.profile_id] = entry
+                entry.task = asyncio.create_task(self._run(entry))
+                self._notify()
+        finally:
+            self._task = None
+            self._wakeup = None
+            self.blocked_by = None
+
+    async def _run(self, entry: _QueuedLaunch) -> None:
+        try:
+            result = await entry.launch()
+        except asyncio.CancelledError:
+            # Waiters must not hang on a launch that will never finish
+            entry.future.cancel()
+            raise
+        except Exception as exc:
+            if not entry.future.done():
+                entry.future.set_exception(exc)
+        else:
+            if not entry.future.done():
+                entry.future.set_result(result)
+        finally:
+            self._launching.pop(entry.profile_id, None)
+            if self._wakeup is not None:
+                self._wakeup.set()
+            self._notify()
+
+    def cancel(self, profile_id: str) -> bool:
+        """Cancel a queued or in-progress launch.
+
+        Returns:
+            False if the profile was neither queued nor launching.
+        """
+        entry = self._launching.get(profile_id)
+        if entry is not None:
+            entry.task.cancel()
+            return True
+        entry = self._entries.pop(profile_id, None)
+        if entry is None:
+            return False
+        self._heap.remove(entry)
+        heapq.heapify(self._heap)
+        entry.future.cancel()
+        self._notify()
+        return True
+
+    def is_launching(self, profile_id: str) -> bool:
+        return profile_id in self._launching
+
+    def is_queued(self, profile_id: str) -> bool:
+        return profile_id in self._entries
+
+    def queue_position(self, profile_id: str) -> Optional[int]:
+        """Return the 1-based position of a queued launch."""
+        entry = self._entries.get(profile_id) or self._launching.get(profile_id)
+        if entry is None:
+            return None
+        return sum(1 for other in self._heap if other < entry) + 1
+
+    def queued_ids(self) -> List[str]:
+        """Return queued profile IDs in admission order."""
+        return [entry.profile_id for entry in sorted(self._heap)]
+
+    def _notify(self) -> None:
+        if self.on_change:
+            try:
+                self.on_change()
+            except Exception:
+                pass
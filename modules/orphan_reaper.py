@@ -0,0 +1,160 @@
+"""Cleanup of browsers and profile locks left behind by a crashed app.
+
+When the app dies without running its exit handlers, the Playwright driver
+goes with it but Chromium keeps running with its profile directory locked,
+and the next launch of that profile fails or hangs on the ``Singleton*``
+files. Browsers started by Playwright talk to the driver over a pipe, so an
+orphan cannot be reattached; it is terminated instead.
+
+A browser is an orphan when its ``--user-data-dir`` is under the profiles
+directory and its parent is no longer a Playwright driver. Browsers of
+another running instance still have their driver as parent and are left
+alone.
+"""
+from __future__ import annotations
+
+import os
+import signal
+import socket
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from .process_monitor import (
+    PROC_ROOT,
+    _read_stat,
+    iter_pids,
+    kill_process_tree,
+    proc_available,
+    read_cmdline,
+)
+
+SINGLETON_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie")
+TERMINATE_GRACE = 5.0
+
+_USER_DATA_PREFIX = "--user-data-dir="
+
+
+def _is_under(path: str, root: str) -> bool:
+    return os.path.commonpath([path, root]) == root and path != root
+
+
+def find_orphan_browsers(profiles_dir) -> Dict[str, int]:
+    """Return ``{user_data_dir: browser_pid}`` of orphaned browsers.
+
+    Only the main browser process of each tree is returned; helpers carry
+    ``--type=`` and die with it.
+    """
+    if not proc_available():
+        return {}
+    root = os.path.realpath(str(profiles_dir))
+    orphans: Dict[str, int] = {}
+    for pid in iter_pids():
+        args = read_cmdline(pid)
+        if any(arg.startswith("--type=") for arg in args):
+            continue
+        user_data_dir = next(
+            (arg[len(_USER_DATA_PREFIX):] for arg in args if arg.startswith(_USER_DATA_PREFIX)),
+            None,
+        )
+        if user_data_dir is None:
+            continue
+        user_data_dir = os.path.realpath(user_data_dir)
+        if not _is_under(user_data_dir, root):
+            continue
+        stat = _read_stat(pid)
+        if stat is None:
+            continue
+        parent_args = read_cmdline(stat[0])
+        if any("playwright" in arg for arg in parent_args):
+            continue
+        orphans[user_data_dir] = pid
+    return orphans
+
+
+def _alive(pid: int) -> bool:
+    stat_path = f"{PROC_ROOT}/{pid}/stat"
+    if not os.path.exists(stat_path):
+        return False
+    try:
+        with open(stat_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return False
+    # A zombie has exited and only waits to be reaped by its parent
+    return data[data.rfind(b")") + 2:][:1] != b"Z"
+
+
+def terminate_browsers(pids: Iterable[int], grace: float = TERMINATE_GRACE) -> None:
+    """Ask browsers to exit with SIGTERM, then kill trees still alive after ``grace``.
+
+    SIGTERM lets Chromium flush cookies and session state to disk. All
+    browsers share one grace period, so many orphans do not add up.
+    """
+    pending = []
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+            pending.append(pid)
+        except ProcessLookupError:
+            pass
+    deadline = time.monotonic() + grace
+    while pending and time.monotonic() < deadline:
+        time.sleep(0.1)
+        pending = [pid for pid in pending if _alive(pid)]
+    for pid in pending:
+        kill_process_tree(pid)
+
+
+def _lock_owner_alive(lock_path: Path) -> bool:
+    """Check the ``<hostname>-<pid>`` target of a Chromium ``SingletonLock``."""
+    try:
+        target = os.readlink(lock_path)
+    except OSError:
+        return False
+    hostname, _, pid = target.rpartition("-")
+    if hostname != socket.gethostname() or not pid.isdigit():
+        # Locked from another host (shared storage); not ours to judge
+        return True
+    return _alive(int(pid))
+
+
+def clear_stale_locks(profile_path) -> bool:
+    """Remove ``Singleton*`` files of a profile whose owner process is gone.
+
+    Returns:
+        True if stale locks were removed.
+    """
+    profile_path = Path(profile_path)
+    lock_path = profile_path / "SingletonLock"
+    if not lock_path.is_symlink() or _lock_owner_alive(lock_path):
+        return False
+    for name in SINGLETON_FILES:
+        try:
+            (profile_path / name).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            print(f"Cannot remove {profile_path / name}: {exc}")
+    return True
+
+
+def reap_orphans(profiles_dir, grace: float = TERMINATE_GRACE) -> List[str]:
+    """Terminate orphaned browsers and clear stale locks under ``profiles_dir``.
+
+    Returns:
+        Names of profile directories whose browser was terminated.
+    """
+    orphans = find_orphan_browsers(profiles_dir)
+    if orphans:
+        terminate_browsers(orphans.values(), grace)
+
+    try:
+        entries = list(os.scandir(profiles_dir))
+    except OSError:
+        entries = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            clear_stale_locks(entry.path)
+
+    return [os.path.basename(path) for path in orphans]
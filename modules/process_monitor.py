@@ -0,0 +1,246 @@
+"""Resource monitoring of browser process trees via ``/proc``.
+
+Each running profile is one Chromium browser process plus its renderer,
+GPU and utility children. ``ResourceMonitor`` samples every tree at a
+fixed low rate from a background thread and keeps the latest totals, so
+readers (UI, control API) never touch ``/proc`` themselves.
+
+Only Linux is supported; on other platforms the monitor reports nothing.
+RSS is summed over the tree, so memory shared between Chromium processes
+is counted more than once; treat it as an upper bound.
+"""
+from __future__ import annotations
+
+import os
+import signal
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+PROC_ROOT = "/proc"
+SAMPLE_INTERVAL = 5.0
+
+try:
+    CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+    PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    CLOCK_TICKS = 100
+    PAGE_SIZE = 4096
+
+
+@dataclass(slots=True)
+class ProcessTreeStats:
+    """Resource totals for one browser process tree."""
+
+    pid: int
+    rss_bytes: int
+    cpu_percent: float
+    children: int
+    sampled_at: float
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def proc_available() -> bool:
+    """Return True if ``/proc`` can be used for sampling."""
+    return os.path.isdir(os.path.join(PROC_ROOT, "self"))
+
+
+def _read_stat(pid: int) -> Optional[Tuple[int, int, int]]:
+    """Return ``(ppid, cpu_ticks, rss_bytes)`` of a process or None if it is gone."""
+    try:
+        with open(f"{PROC_ROOT}/{pid}/stat", "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    # The command name is wrapped in parentheses and may contain spaces
+    fields = data[data.rfind(b")") + 2:].split()
+    try:
+        ppid = int(fields[1])
+        cpu_ticks = int(fields[11]) + int(fields[12])
+        rss_bytes = int(fields[21]) * PAGE_SIZE
+    except (IndexError, ValueError):
+        return None
+    return ppid, cpu_ticks, rss_bytes
+
+
+def iter_pids() -> Iterator[int]:
+    """Yield the PIDs of all processes visible in ``/proc``."""
+    try:
+        entries = os.listdir(PROC_ROOT)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.isdigit():
+            yield int(entry)
+
+
+def read_cmdline(pid: int) -> List[str]:
+    """Return the command line of a process, or an empty list."""
+    try:
+        with open(f"{PROC_ROOT}/{pid}/cmdline", "rb") as f:
+            data = f.read()
+    except OSError:
+        return []
+    return [arg.decode("utf-8", "replace") for arg in data.split(b"\0") if arg]
+
+
+def _walk_tree(root: int, children: Dict[int, List[int]]) -> List[int]:
+    tree = [root]
+    index = 0
+    while index < len(tree):
+        tree.extend(children.get(tree[index], ()))
+        index += 1
+    return tree
+
+
+def process_tree(root: int) -> List[int]:
+    """Return ``root`` followed by all of its descendants."""
+    children: Dict[int, List[int]] = {}
+    for pid in iter_pids():
+        stat = _read_stat(pid)
+        if stat is not None:
+            children.setdefault(stat[0], []).append(pid)
+    return _walk_tree(root, children)
+
+
+def find_browser_pid(user_data_dir) -> Optional[int]:
+    """Find the main Chromium process that uses a user data directory.
+
+    Child processes inherit ``--user-data-dir`` but also carry ``--type=``,
+    so the browser process is the one without it.
+    """
+    if not proc_available():
+        return None
+    target = os.path.realpath(str(user_data_dir))
+    prefix = "--user-data-dir="
+    for pid in iter_pids():
+        args = read_cmdline(pid)
+        if any(arg.startswith("--type=") for arg in args):
+            continue
+        for arg in args:
+            if arg.startswith(prefix) and os.path.realpath(arg[len(prefix):]) == target:
+                return pid
+    return None
+
+
+def kill_process_tree(root: int) -> int:
+    """Kill a process and its descendants.
+
+    Children are collected before the root dies, since Chromium helpers are
+    reparented once their browser process exits. Without ``/proc`` only the
+    root is killed.
+
+    Returns:
+        Number of processes signalled.
+    """
+    pids = process_tree(root) if proc_available() else [root]
+    kill_signal = getattr(signal, "SIGKILL", signal.SIGTERM)
+    killed = 0
+    for pid in pids:
+        try:
+            os.kill(pid, kill_signal)
+            killed += 1
+        except (ProcessLookupError, PermissionError):
+            pass
+    return killed
+
+
+class ResourceMonitor:
+    """Background sampler of RSS, CPU and child counts per profile.
+
+    Args:
+        pid_source: Callable returning ``{profile_id: browser_pid}`` for the
+            profiles to sample, e.g. ``BrowserManager.get_browser_pids``.
+        interval: Seconds between samples.
+    """
+
+    def __init__(self, pid_source: Callable[[], Dict[str, int]], interval: float = SAMPLE_INTERVAL):
+        self.pid_source = pid_source
+        self.interval = interval
+        self._stats: Dict[str, ProcessTreeStats] = {}
+        self._cpu_ticks: Dict[str, Tuple[int, int, float]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the sampling thread (no-op without ``/proc``)."""
+        if self._thread is not None or not proc_available():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="resource-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sample()
+            except Exception as exc:
+                print(f"Resource sampling failed: {exc}")
+            self._stop.wait(self.interval)
+
+    def sample(self) -> Dict[str, ProcessTreeStats]:
+        """Take one sample of every tracked process tree."""
+        targets = self.pid_source()
+        if not targets:
+            self._stats = {}
+            self._cpu_ticks = {}
+            return {}
+
+        # One pass over /proc builds the parent -> children map for all trees
+        children: Dict[int, List[int]] = {}
+        stats: Dict[int, Tuple[int, int, int]] = {}
+        for pid in iter_pids():
+            stat = _read_stat(pid)
+            if stat is None:
+                continue
+            stats[pid] = stat
+            children.setdefault(stat[0], []).append(pid)
+
+        now = time.monotonic()
+        sampled_at = time.time()
+        result: Dict[str, ProcessTreeStats] = {}
+        cpu_ticks: Dict[str, Tuple[int, int, float]] = {}
+        for profile_id, root in targets.items():
+            if root not in stats:
+                continue
+            tree = _walk_tree(root, children)
+            ticks = sum(stats[pid][1] for pid in tree)
+            rss = sum(stats[pid][2] for pid in tree)
+
+            cpu_percent = 0.0
+            previous = self._cpu_ticks.get(profile_id)
+            if previous and previous[0] == root and now > previous[2]:
+                # Exited children take their ticks with them, so clamp at zero
+                delta = max(0, ticks - previous[1])
+                cpu_percent = delta / CLOCK_TICKS / (now - previous[2]) * 100
+            cpu_ticks[profile_id] = (root, ticks, now)
+
+            result[profile_id] = ProcessTreeStats(
+                pid=root,
+                rss_bytes=rss,
+                cpu_percent=round(cpu_percent, 1),
+                children=len(tree) - 1,
+                sampled_at=sampled_at,
+            )
+
+        self._cpu_ticks = cpu_ticks
+        self._stats = result
+        return result
+
+    def get(self, profile_id: str) -> Optional[ProcessTreeStats]:
+        """Return the latest sample for a profile."""
+        return self._stats.get(profile_id)
+
+    def snapshot(self) -> Dict[str, ProcessTreeStats]:
+        """Return the latest samples of all profiles."""
+        return dict(self._stats)
@@ -0,0 +1,396 @@
+"""Streaming export/import of full profile bundles.
+
+A bundle is an uncompressed PAX tar stream with:
+
+* ``bundle.json``: format marker and version;
+* ``profiles.jsonl``: one profile row per line with its proxy inlined;
+* ``data/<profile_id>.tar.gz``: the profile user-data directory without
+  cache directories, with its SHA-256 in the ``ANTY.sha256`` PAX header.
+
+Each profile directory is compressed in a worker thread (zlib releases the
+GIL) into a spooled temporary file, so memory use is bounded by the number
+of workers regardless of profile size.
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterable, List, Optional
+
+BUNDLE_FORMAT = "anty-profile-bundle"
+BUNDLE_VERSION = 1
+CHECKSUM_HEADER = "ANTY.sha256"
+
+# Chromium directories that are safe to drop and rebuilt on next launch
+EXCLUDED_DIRS = {
+    "Cache",
+    "Code Cache",
+    "GPUCache",
+    "ShaderCache",
+    "GrShaderCache",
+    "GraphiteDawnCache",
+    "DawnCache",
+    "DawnGraphiteCache",
+    "DawnWebGPUCache",
+    "CacheStorage",
+    "ScriptCache",
+    "Crashpad",
+    "component_crx_cache",
+    "optimization_guide_model_store",
+}
+EXCLUDED_FILE_PREFIXES = ("Singleton",)
+
+PROFILE_FIELDS = (
+    "name", "profile_id", "notes", "tags", "os", "user_agent", "open_tabs",
+    "timezone_mode", "timezone_value", "geolocation_mode", "geolocation_lat",
+    "geolocation_lon", "language_mode", "languages", "resource_limits",
+    "launch_preset", "routing_rules", "storage_mode",
+)
+PROXY_FIELDS = ("name", "type", "host", "port", "username", "password")
+# Columns the database refuses to leave empty
+REQUIRED_PROFILE_FIELDS = ("name",)
+REQUIRED_PROXY_FIELDS = ("name", "type", "host", "port")
+
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def _exclude_filter(info: tarfile.TarInfo) -> Optional[tarfile.TarInfo]:
+    parts = Path(info.name).parts
+    if any(part in EXCLUDED_DIRS for part in parts):
+        return None
+    if parts and parts[-1].startswith(EXCLUDED_FILE_PREFIXES):
+        return None
+    if info.issym() or info.islnk() or info.isdev():
+        return None
+    return info
+
+
+def _pack_profile_dir(profile_path: Path, level: int) -> tuple:
+    """Compress a profile directory into a spooled temp file.
+
+    Returns:
+        Tuple of (file object positioned at 0, size, sha256 hex digest).
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    with tarfile.open(fileobj=spool, mode="w:gz", compresslevel=level) as archive:
+        if profile_path.exists():
+            archive.add(str(profile_path), arcname=".", filter=_exclude_filter)
+
+    size = spool.tell()
+    spool.seek(0)
+    digest = hashlib.sha256()
+    for block in iter(lambda: spool.read(COPY_BUFFER_SIZE), b""):
+        digest.update(block)
+    spool.seek(0)
+    return spool, size, digest.hexdigest()
+
+
+def _add_bytes(archive: tarfile.TarFile, name: str, data: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(time.time())
+    archive.addfile(info, io.BytesIO(data))
+
+
+def _profile_record(db, profile: Dict) -> Dict:
+    record = {field: profile.get(field) for field in PROFILE_FIELDS}
+    record["proxy"] = None
+    if profile.get("proxy_id"):
+        proxy = db.get_proxy_by_id(profile["proxy_id"])
+        if proxy:
+            record["proxy"] = {field: proxy.get(field) for field in PROXY_FIELDS}
+    return record
+
+
+def export_profiles(
+    db,
+    browser_manager,
+    profile_ids: Iterable[str],
+    output: BinaryIO,
+    workers: int = 4,
+    compresslevel: int = 6,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """Write a bundle with the given profiles to a binary stream.
+
+    Running profiles should be stopped first so their files are consistent.
+
+    Args:
+        db: Database instance.
+        browser_manager: BrowserManager that owns the profile directories.
+        profile_ids: IDs of the profiles to export.
+        output: Writable binary stream (file, socket, pipe).
+        workers: Number of parallel compression threads.
+        compresslevel: gzip level for profile data.
+        progress: Optional callback receiving the number of exported profiles.
+
+    Returns:
+        Number of exported profiles.
+    """
+    profiles = []
+    for profile_id in profile_ids:
+        profile = db.get_profile_by_id(profile_id)
+        if profile:
+            profiles.append(profile)
+
+    records = "".join(
+        json.dumps(_profile_record(db, profile), ensure_ascii=False) + "\n" for profile in profiles
+    )
+
+    with tarfile.open(fileobj=output, mode="w|", format=tarfile.PAX_FORMAT) as archive:
+        _add_bytes(
+            archive,
+            "bundle.json",
+            json.dumps({"format": BUNDLE_FORMAT, "version": BUNDLE_VERSION}).encode("utf-8"),
+        )
+        _add_bytes(archive, "profiles.jsonl", records.encode("utf-8"))
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # At most workers * 2 packed archives are held at any time
+            pending: List = []
+            exported = 0
+
+            def write_next() -> None:
+                nonlocal exported
+                profile_id, future = pending.pop(0)
+                spool, size, digest = future.result()
+                try:
+                    info = tarfile.TarInfo(f"data/{profile_id}.tar.gz")
+                    info.size = size
+                    info.mtime = int(time.time())
+                    info.pax_headers = {CHECKSUM_HEADER: digest}
+                    archive.addfile(info, spool)
+                finally:
+                    spool.close()
+                exported += 1
+                if progress:
+                    progress(exported)
+
+            for profile in profiles:
+                profile_id = profile["profile_id"]
+                profile_path = browser_manager.get_profile_path(profile_id)
+                pending.append((profile_id, pool.submit(_pack_profile_dir, profile_path, compresslevel)))
+                if len(pending) >= workers * 2:
+                    write_next()
+
+            while pending:
+                write_next()
+
+    return exported
+
+
+def _check_profile_id(profile_id) -> str:
+    """Return ``profile_id`` if it is a canonical UUID as generated by the app.
+
+    IDs come from an untrusted bundle and become directory names, so
+    anything else (``..``, separators, absolute paths) is rejected.
+    """
+    try:
+        valid = isinstance(profile_id, str) and str(uuid.UUID(profile_id)) == profile_id
+    except ValueError:
+        valid = False
+    if not valid:
+        raise ValueError(f"Invalid profile id in bundle: {profile_id!r}")
+    return profile_id
+
+
+def _check_record(record) -> Dict:
+    """Return a bundled profile record if the database will accept it.
+
+    Runs for every record before any proxy, row or directory is created,
+    so a bad record cannot leave a bundle half-imported.
+    """
+    if not isinstance(record, dict):
+        raise ValueError("Malformed profile record in bundle")
+    profile_id = _check_profile_id(record.get("profile_id"))
+    missing = [field for field in REQUIRED_PROFILE_FIELDS if record.get(field) in (None, "")]
+    proxy = record.get("proxy")
+    if proxy is not None:
+        if not isinstance(proxy, dict):
+            raise ValueError(f"Malformed proxy of profile {profile_id}")
+        missing += [f"proxy.{field}" for field in REQUIRED_PROXY_FIELDS if proxy.get(field) in (None, "")]
+    if missing:
+        raise ValueError(f"Profile {profile_id} in bundle has no {', '.join(missing)}")
+    return record
+
+
+def _profile_destination(browser_manager, profile_id: str) -> Path:
+    """Return the profile directory, checking that it stays inside profiles_dir."""
+    root = Path(browser_manager.profiles_dir).resolve()
+    destination = Path(browser_manager.get_profile_path(profile_id)).resolve()
+    if destination.parent != root:
+        raise ValueError(f"Unsafe profile path in bundle: {profile_id!r}")
+    return destination
+
+
+def _safe_extract(spool: BinaryIO, target: Path) -> None:
+    """Extract a profile archive, rejecting paths outside the target."""
+    target_root = target.resolve()
+    with tarfile.open(fileobj=spool, mode="r:gz") as archive:
+        for member in archive:
+            if not (member.isfile() or member.isdir()):
+                continue
+            destination = (target_root / member.name).resolve()
+            if destination != target_root and target_root not in destination.parents:
+                raise ValueError(f"Unsafe path in bundle: {member.name}")
+            if member.isdir():
+                destination.mkdir(parents=True, exist_ok=True)
+                continue
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            source = archive.extractfile(member)
+            with open(destination, "wb") as f:
+                shutil.copyfileobj(source, f, COPY_BUFFER_SIZE)
+
+
+class _ProxyMatcher:
+    """Reuse saved proxies that match bundled ones, creating the rest."""
+
+    def __init__(self, db):
+        self.db = db
+        self._known = {
+            self._key(proxy): proxy["id"] for proxy in db.get_all_proxies()
+        }
+
+    @staticmethod
+    def _key(proxy: Dict) -> tuple:
+        return (proxy.get("type"), proxy.get("host"), int(proxy.get("port") or 0), proxy.get("username"))
+
+    def resolve(self, proxy: Optional[Dict]) -> Optional[int]:
+        if not proxy:
+            return None
+        key = self._key(proxy)
+        if key not in self._known:
+            self._known[key] = self.db.create_proxy(**{field: proxy.get(field) for field in PROXY_FIELDS})
+        return self._known[key]
+
+
+def import_profiles(
+    db,
+    browser_manager,
+    source: BinaryIO,
+    workers: int = 4,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """Read a bundle from a binary stream and recreate its profiles.
+
+    Profile archives are verified against their checksums before they are
+    extracted. Profiles whose ID already exists get a new ID. IDs must be
+    UUIDs, so a crafted bundle cannot write outside the profiles directory.
+
+    Args:
+        db: Database instance.
+        browser_manager: BrowserManager that owns the profile directories.
+        source: Readable binary stream with the bundle.
+        workers: Number of parallel extraction threads.
+        progress: Optional callback receiving the number of imported profiles.
+
+    Returns:
+        Number of imported profiles.
+
+    Raises:
+        ValueError: If the bundle is malformed or a checksum does not match.
+    """
+    records: Dict[str, Dict] = {}
+    id_map: Dict[str, tuple] = {}
+    staged: Dict[str, Path] = {}
+    futures = []
+    header_seen = False
+
+    staging_root = Path(tempfile.mkdtemp(prefix=".import-", dir=str(browser_manager.profiles_dir)))
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool, \
+                tarfile.open(fileobj=source, mode="r|") as archive:
+            for member in archive:
+                if member.name == "bundle.json":
+                    header = json.loads(archive.extractfile(member).read().decode("utf-8"))
+                    if header.get("format") != BUNDLE_FORMAT or header.get("version") != BUNDLE_VERSION:
+                        raise ValueError("Unsupported bundle format")
+                    header_seen = True
+                elif member.name == "profiles.jsonl":
+                    for line in archive.extractfile(member).read().decode("utf-8").splitlines():
+                        if line.strip():
+                            record = _check_record(json.loads(line))
+                            records[record["profile_id"]] = record
+                elif member.name.startswith("data/") and member.name.endswith(".tar.gz"):
+                    if not header_seen:
+                        raise ValueError("Bundle header is missing")
+                    old_id = _check_profile_id(member.name[len("data/"):-len(".tar.gz")])
+                    if old_id not in records:
+                        raise ValueError(f"Unknown profile in bundle: {old_id}")
+
+                    expected = member.pax_headers.get(CHECKSUM_HEADER)
+                    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+                    digest = hashlib.sha256()
+                    source_file = archive.extractfile(member)
+                    for block in iter(lambda: source_file.read(COPY_BUFFER_SIZE), b""):
+                        digest.update(block)
+                        spool.write(block)
+                    if not expected or digest.hexdigest() != expected:
+                        spool.close()
+                        raise ValueError(f"Checksum mismatch for profile {old_id}")
+                    spool.seek(0)
+
+                    target = staging_root / old_id
+
+                    def extract(spool=spool, target=target):
+                        try:
+                            _safe_extract(spool, target)
+                        finally:
+                            spool.close()
+
+                    staged[old_id] = target
+                    futures.append(pool.submit(extract))
+                    # Bound the number of buffered archives awaiting extraction
+                    while len(futures) >= workers * 2:
+                        futures.pop(0).result()
+
+            for future in futures:
+                future.result()
+
+        if not header_seen:
+            raise ValueError("Bundle header is missing")
+
+        proxies = _ProxyMatcher(db)
+        rows = []
+        for old_id, record in records.items():
+            new_id = old_id
+            if db.get_profile_by_id(old_id) or browser_manager.get_profile_path(old_id).exists():
+                new_id = browser_manager.generate_profile_id()
+            # Every destination is checked before anything is moved into place
+            id_map[old_id] = (new_id, _profile_destination(browser_manager, new_id))
+
+            row = {field: record.get(field) for field in PROFILE_FIELDS}
+            row["profile_id"] = new_id
+            row["proxy_id"] = proxies.resolve(record.get("proxy"))
+            rows.append(row)
+
+        moved: List[Path] = []
+        try:
+            for old_id, (new_id, destination) in id_map.items():
+                if old_id in staged and staged[old_id].exists():
+                    os.replace(staged[old_id], destination)
+                else:
+                    destination.mkdir()
+                moved.append(destination)
+                if progress:
+                    progress(len(moved))
+            # One transaction: either every row is inserted or none is
+            db.bulk_create_profiles(rows, chunk_size=max(len(rows), 1))
+        except BaseException:
+            # Directories without rows would be orphans nothing ever cleans up
+            for destination in moved:
+                shutil.rmtree(destination, ignore_errors=True)
+            raise
+        return len(moved)
+    finally:
+        shutil.rmtree(staging_root, ignore_errors=True)
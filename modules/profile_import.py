@@ -0,0 +1,221 @@
+"""Bulk profile import from CSV/JSONL templates.
+
+Each template row may contain ``name``, ``notes``, ``tags``, ``proxy``,
+``os`` and ``tabs`` fields. ``proxy`` is resolved as a proxy ID, a saved
+proxy name, ``host:port`` of a saved proxy, or a proxy line that is
+created on the fly. ``tabs`` is a JSON list or URLs separated by ``|`` or
+newlines.
+"""
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from modules.fingerprint import generate_user_agent
+from modules.proxy_parser import parse_proxy_line
+
+TEMPLATE_FIELDS = ("name", "notes", "tags", "proxy", "os", "tabs")
+# How many failing rows are listed in the error message
+MAX_REPORTED_ERRORS = 20
+
+
+def read_profile_templates(path: str) -> Iterator[Dict]:
+    """Stream template rows from a ``.csv`` or ``.jsonl`` file.
+
+    Args:
+        path: Path to the template file.
+
+    Yields:
+        Template rows as dicts.
+
+    Raises:
+        ValueError: If the file extension is not supported or a JSONL
+            line is not valid JSON.
+    """
+    suffix = Path(path).suffix.lower()
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if suffix == ".csv":
+            for row in csv.DictReader(f):
+                yield {key.strip().lower(): value for key, value in row.items() if key}
+        elif suffix in (".jsonl", ".ndjson"):
+            for number, line in enumerate(f, 1):
+                line = line.strip()
+                if line:
+                    try:
+                        yield json.loads(line)
+                    except ValueError as exc:
+                        raise ValueError(f"Line {number}: invalid JSON: {exc}") from exc
+        else:
+            raise ValueError(f"Unsupported template format: {suffix}")
+
+
+def parse_tabs(value) -> List[str]:
+    """Normalize the ``tabs`` template field to a list of URLs."""
+    if not value:
+        return []
+    if isinstance(value, list):
+        return [str(url).strip() for url in value if str(url).strip()]
+    value = str(value).strip()
+    if value.startswith("["):
+        try:
+            return [str(url).strip() for url in json.loads(value) if str(url).strip()]
+        except ValueError:
+            pass
+    return [url.strip() for url in value.replace("|", "\n").splitlines() if url.strip()]
+
+
+class ProxyResolver:
+    """Resolve template proxy references against saved proxies.
+
+    Saved proxies are loaded once and indexed by ID, name and
+    ``host:port``; unknown proxy lines are created and indexed as well.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._by_id: Dict[int, int] = {}
+        self._by_key: Dict[str, int] = {}
+        for proxy in db.get_all_proxies():
+            self._index(proxy["id"], proxy["name"], proxy["host"], proxy["port"])
+
+    def _index(self, proxy_id: int, name: str, host: str, port: int) -> None:
+        self._by_id[proxy_id] = proxy_id
+        self._by_key.setdefault(name, proxy_id)
+        self._by_key.setdefault(f"{host}:{port}", proxy_id)
+
+    def check(self, reference) -> None:
+        """Validate a reference the way ``resolve`` would, without creating anything.
+
+        Raises:
+            ValueError: If the reference matches nothing and is not a
+                valid proxy line.
+        """
+        if reference in (None, ""):
+            return
+        reference = str(reference).strip()
+        if (reference.isdigit() and int(reference) in self._by_id) or reference in self._by_key:
+            return
+        if not parse_proxy_line(reference):
+            raise ValueError(f"Unknown proxy reference: {reference}")
+
+    def resolve(self, reference) -> Optional[int]:
+        """Return the proxy ID for a reference, creating the proxy if needed.
+
+        Raises:
+            ValueError: If the reference matches nothing and is not a
+                valid proxy line.
+        """
+        if reference in (None, ""):
+            return None
+        reference = str(reference).strip()
+        if reference.isdigit() and int(reference) in self._by_id:
+            return int(reference)
+        if reference in self._by_key:
+            return self._by_key[reference]
+
+        proxy_data = parse_proxy_line(reference)
+        if not proxy_data:
+            raise ValueError(f"Unknown proxy reference: {reference}")
+        key = f"{proxy_data['host']}:{proxy_data['port']}"
+        if key in self._by_key:
+            return self._by_key[key]
+
+        name = f"Proxy {key}"
+        proxy_id = self.db.create_proxy(
+            name=name,
+            type=proxy_data["type"],
+            host=proxy_data["host"],
+            port=proxy_data["port"],
+            username=proxy_data.get("username"),
+            password=proxy_data.get("password"),
+        )
+        self._index(proxy_id, name, proxy_data["host"], proxy_data["port"])
+        return proxy_id
+
+
+def import_profile_templates(
+    db,
+    browser_manager,
+    templates: Iterable[Dict],
+    chunk_size: int = 500,
+    folder_workers: int = 8,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """Create profiles from template rows in chunked transactions.
+
+    Every row is validated before anything is written, so a bad row
+    cannot leave the file half-imported. Profile folders for each chunk
+    are created with a thread pool before the chunk is written to the
+    database.
+
+    Args:
+        db: Database instance.
+        browser_manager: BrowserManager used for IDs and profile folders.
+        templates: Template rows, e.g. from ``read_profile_templates``.
+        chunk_size: Number of profiles per transaction.
+        folder_workers: Thread pool size for folder creation.
+        progress: Optional callback receiving the running total.
+
+    Returns:
+        Number of created profiles.
+
+    Raises:
+        ValueError: Listing the failing rows by number (1-based, header
+            excluded) if any row is invalid; nothing is created then.
+    """
+    resolver = ProxyResolver(db)
+    rows: List[Dict] = []
+    errors: List[str] = []
+    for number, template in enumerate(templates, 1):
+        if not isinstance(template, dict):
+            errors.append(f"Row {number}: not an object")
+            continue
+        try:
+            resolver.check(template.get("proxy"))
+        except ValueError as exc:
+            errors.append(f"Row {number}: {exc}")
+            continue
+        rows.append(template)
+    if errors:
+        listed = errors[:MAX_REPORTED_ERRORS]
+        if len(errors) > len(listed):
+            listed.append(f"... and {len(errors) - len(listed)} more")
+        raise ValueError(f"{len(errors)} invalid row(s), nothing imported:\n" + "\n".join(listed))
+
+    next_number = db.get_next_profile_number()
+    created = 0
+    chunk: List[Dict] = []
+
+    def flush() -> None:
+        nonlocal created
+        browser_manager.create_profile_folders(
+            [row["profile_id"] for row in chunk], max_workers=folder_workers
+        )
+        created += db.bulk_create_profiles(chunk, chunk_size=chunk_size)
+        chunk.clear()
+        if progress:
+            progress(created)
+
+    for index, template in enumerate(rows):
+        os_name = (template.get("os") or "Windows").strip()
+        chunk.append(
+            {
+                "name": (template.get("name") or "").strip() or f"ID_{next_number + index}",
+                "profile_id": browser_manager.generate_profile_id(),
+                "notes": template.get("notes") or "",
+                "tags": template.get("tags") or "",
+                "proxy_id": resolver.resolve(template.get("proxy")),
+                "os": os_name,
+                "user_agent": template.get("user_agent") or generate_user_agent(os_name),
+                "open_tabs": json.dumps(parse_tabs(template.get("tabs")), ensure_ascii=False),
+            }
+        )
+        if len(chunk) >= chunk_size:
+            flush()
+
+    if chunk:
+        flush()
+
+    return created
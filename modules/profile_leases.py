@@ -0,0 +1,216 @@
+"""Cross-process leases that keep a profile from being launched twice.
+
+``BrowserManager.running_browsers`` only knows the profiles of its own
+process (and of its own session in Flet web mode). Two instances sharing
+the database would otherwise open the same profile directory at once and
+corrupt it.
+
+A launch takes two locks:
+
+* an advisory file lock on ``<profiles_dir>/.locks/<profile_id>.lock``,
+  released by the OS when the process dies. It is per open file, so it
+  also separates web sessions of one process;
+* a row in ``profile_leases``, renewed by a heartbeat and expiring after
+  ``LEASE_TTL`` seconds. It covers instances on other hosts sharing the
+  database and tells the UI which profiles run elsewhere.
+
+A leftover row of an instance on this host (crashed, or its release is
+still pending) is taken over as soon as the file lock is free, instead of
+waiting for it to expire.
+"""
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+LEASE_TTL = 60.0
+HEARTBEAT_INTERVAL = 20.0
+LOCKS_DIR = ".locks"
+
+
+class ProfileLeasedError(RuntimeError):
+    """The profile is running in another instance; ``holder`` describes it."""
+
+    def __init__(self, profile_id: str, holder: Optional[Dict] = None):
+        if holder:
+            where = f"{holder.get('hostname')} (PID {holder.get('pid')})"
+        else:
+            where = "another process on this host"
+        super().__init__(f"Profile {profile_id} is running in {where}")
+        self.profile_id = profile_id
+        self.holder = holder
+
+
+class _FileLock:
+    """Non-blocking exclusive lock on a file, held while the file is open."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = None
+
+    def acquire(self) -> bool:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(self.path, "a+b")
+        try:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            handle.close()
+            return False
+        self._file = handle
+        return True
+
+    def release(self) -> None:
+        if self._file is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        except OSError:
+            pass
+        finally:
+            self._file.close()
+            self._file = None
+
+
+class LeaseManager:
+    """Leases of the profiles launched by one ``BrowserManager``.
+
+    Args:
+        db: Database with the ``profile_leases`` methods.
+        profiles_dir: Directory holding the profile folders.
+        ttl: Seconds a lease survives without a heartbeat.
+        heartbeat_interval: Seconds between lease renewals.
+    """
+
+    def __init__(self, db, profiles_dir, ttl: float = LEASE_TTL,
+                 heartbeat_interval: float = HEARTBEAT_INTERVAL):
+        self.db = db
+        self.locks_dir = Path(profiles_dir) / LOCKS_DIR
+        self.ttl = ttl
+        self.heartbeat_interval = heartbeat_interval
+        self.hostname = socket.gethostname()
+        self.pid = os.getpid()
+        self.owner = f"{self.hostname}:{self.pid}:{uuid.uuid4().hex[:8]}"
+        self._file_locks: Dict[str, _FileLock] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # DB writes for acquire and release run in order on one thread, so a
+        # pending release can never delete a lease taken again after it
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="profile-lease")
+
+    def acquire(self, profile_id: str) -> None:
+        """Lease a profile for this instance (blocking, call from a thread).
+
+        Raises:
+            ProfileLeasedError: If another instance holds the profile.
+        """
+        self._worker.submit(self._acquire, profile_id).result()
+
+    def _acquire(self, profile_id: str) -> None:
+        with self._lock:
+            if profile_id in self._file_locks:
+                return
+            file_lock = _FileLock(self.locks_dir / f"{profile_id}.lock")
+            if not file_lock.acquire():
+                raise ProfileLeasedError(profile_id, self.db.get_profile_leases(self.owner).get(profile_id))
+            self._file_locks[profile_id] = file_lock
+
+        try:
+            holder = self.db.acquire_profile_lease(profile_id, self.owner, self.hostname, self.pid, self.ttl)
+            if holder is not None and holder["hostname"] == self.hostname:
+                # Holders on this host keep the file lock we now have, so the
+                # holder has stopped or crashed and only its row is left
+                holder = self.db.acquire_profile_lease(
+                    profile_id, self.owner, self.hostname, self.pid, self.ttl, steal_from=holder["owner"]
+                )
+        except Exception:
+            self._release_file_lock(profile_id)
+            raise
+        if holder is not None:
+            self._release_file_lock(profile_id)
+            raise ProfileLeasedError(profile_id, holder)
+
+    def release(self, profile_id: str) -> None:
+        """Give up a lease without blocking; the DB row is removed in the background."""
+        with self._lock:
+            held = profile_id in self._file_locks
+        if not held:
+            return
+        self._release_file_lock(profile_id)
+        if not self._stop.is_set():
+            self._worker.submit(self._release_row, profile_id)
+
+    def is_held(self, profile_id: str) -> bool:
+        """Return True if this instance holds the profile's lease."""
+        return profile_id in self._file_locks
+
+    def leased_elsewhere(self) -> Dict[str, Dict]:
+        """Return unexpired leases of other instances keyed by profile_id."""
+        return self.db.get_profile_leases(exclude_owner=self.owner)
+
+    def heartbeat(self) -> None:
+        """Extend all leases of this instance."""
+        if self._file_locks:
+            self.db.renew_profile_leases(self.owner, self.ttl)
+
+    def start(self) -> None:
+        """Start the heartbeat thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="lease-heartbeat", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop heartbeats and release every lease of this instance."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._worker.shutdown(wait=True)
+        with self._lock:
+            profile_ids = list(self._file_locks)
+        for profile_id in profile_ids:
+            self._release_file_lock(profile_id)
+        try:
+            self.db.release_profile_leases(self.owner)
+        except Exception as exc:
+            print(f"Failed to release profile leases: {exc}")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.heartbeat_interval):
+            try:
+                self.heartbeat()
+            except Exception as exc:
+                print(f"Profile lease heartbeat failed: {exc}")
+
+    def _release_file_lock(self, profile_id: str) -> None:
+        with self._lock:
+            file_lock = self._file_locks.pop(profile_id, None)
+        if file_lock is not None:
+            file_lock.release()
+
+    def _release_row(self, profile_id: str) -> None:
+        try:
+            self.db.release_profile_lease(profile_id, self.owner)
+        except Exception as exc:
+            print(f"Failed to release lease of {profile_id}: {exc}")
@@ -0,0 +1,187 @@
+"""Proxy checking utilities.
+
+Provides a plain HTTP checker built on ``requests`` and a Playwright-based
+checker that keeps one long-lived headless browser and runs each check in
+its own short-lived context.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Dict, Optional
+
+
+def build_proxy_url(proxy: Dict) -> str:
+    """Build a ``requests``-style proxy URL from a proxy row."""
+    proxy_url = f"{proxy['type']}://"
+    if proxy.get("username") and proxy.get("password"):
+        proxy_url += f"{proxy['username']}:{proxy['password']}@"
+    proxy_url += f"{proxy['host']}:{proxy['port']}"
+    return proxy_url
+
+
+def check_proxy_http(proxy: Dict, timeout: float = 15) -> Dict:
+    """Check a proxy by requesting ipify through it.
+
+    Args:
+        proxy: Proxy row with type, host, port and optional credentials.
+        timeout: Request timeout in seconds.
+
+    Returns:
+        Status dict with ``status`` and optional ``error`` keys.
+
+    Raises:
+        Exception: If the request itself fails (connection, TLS, timeout).
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    proxy_url = build_proxy_url(proxy)
+    proxies_dict = {"http": proxy_url, "https": proxy_url}
+
+    with requests.Session() as session:
+        retry = Retry(total=1, backoff_factor=0.1)
+        adapter = HTTPAdapter(max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        response = session.get(
+            "https://api.ipify.org?format=json",
+            proxies=proxies_dict,
+            timeout=timeout,
+            allow_redirects=True,
+        )
+
+    if response.status_code == 200:
+        return {"status": "working"}
+    return {"status": "failed", "error": f"HTTP {response.status_code}"}
+
+
+class PlaywrightProxyChecker:
+    """Checks proxies through a shared headless Chromium instance.
+
+    The browser and its Playwright driver live on a dedicated event loop
+    thread, so checks can be submitted from any worker thread without
+    interfering with the async driver used by ``BrowserManager``.
+    """
+
+    def __init__(
+        self,
+        max_parallel: int = 5,
+        timeout_ms: int = 15000,
+        check_url: str = "https://www.google.com",
+    ):
+        self.max_parallel = max_parallel
+        self.timeout_ms = timeout_ms
+        self.check_url = check_url
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._playwright = None
+        self._browser = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._browser_lock: Optional[asyncio.Lock] = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the checker event loop thread on first use."""
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run_loop():
+                    asyncio.set_event_loop(loop)
+                    self._semaphore = asyncio.Semaphore(self.max_parallel)
+                    self._browser_lock = asyncio.Lock()
+                    ready.set()
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=run_loop, daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    async def _get_browser(self):
+        """Return the shared browser, launching it if needed."""
+        async with self._browser_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+
+            if self._playwright is None:
+                from playwright.async_api import async_playwright
+
+                self._playwright = await async_playwright().start()
+
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            return self._browser
+
+    async def _check_in_context(self, proxy_config: Optional[Dict]) -> Dict:
+        browser = await self._get_browser()
+        context = await browser.new_context(proxy=proxy_config)
+        try:
+            page = await context.new_page()
+            page.set_default_timeout(self.timeout_ms)
+            await page.goto(self.check_url)
+
+            if "google" in page.url.lower():
+                return {"status": "working"}
+            return {"status": "failed"}
+        finally:
+            try:
+                await context.close()
+            except Exception:
+                pass
+
+    async def _check(self, proxy_config: Optional[Dict]) -> Dict:
+        async with self._semaphore:
+            # Allow time for a cold browser launch on top of the page timeout
+            return await asyncio.wait_for(
+                self._check_in_context(proxy_config),
+                timeout=self.timeout_ms / 1000 * 2,
+            )
+
+    def check(self, proxy_config: Optional[Dict]) -> Dict:
+        """Check a proxy and block until the result is known.
+
+        Args:
+            proxy_config: Playwright proxy configuration.
+
+        Returns:
+            Status dict with ``status`` and optional ``error`` keys.
+        """
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self._check(proxy_config), loop)
+        try:
+            return future.result()
+        except Exception as exc:
+            return {"status": "failed", "error": str(exc) or type(exc).__name__}
+
+    async def _shutdown(self) -> None:
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    def close(self) -> None:
+        """Close the shared browser and stop the checker loop."""
+        with self._start_lock:
+            loop = self._loop
+            self._loop = None
+        if loop is None:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=10)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
@@ -0,0 +1,231 @@
+"""Per-profile resource limits for browser process trees on Linux.
+
+When the cgroup v2 hierarchy of this process is delegated to us, each
+profile's browser tree is moved into its own child cgroup with
+``memory.max``, ``cpu.weight`` and ``pids.max`` set, so a runaway page is
+throttled or OOM-killed inside its own profile only.
+
+Without a writable cgroup the CPU weight is approximated with ``nice`` and
+``ionice``; memory and pids limits cannot be enforced per tree that way
+and are skipped.
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+import shutil
+import subprocess
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from modules.process_monitor import process_tree
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+PROC_SELF_CGROUP = "/proc/self/cgroup"
+CONTROLLERS = ("memory", "cpu", "pids")
+APP_LEAF = "anty-app"
+DEFAULT_CPU_WEIGHT = 100
+
+
+@dataclass(slots=True)
+class ResourceLimits:
+    """Limits stored in the ``resource_limits`` column of a profile."""
+
+    memory_max_mb: Optional[int] = None
+    cpu_weight: Optional[int] = None
+    pids_max: Optional[int] = None
+
+    def is_empty(self) -> bool:
+        return self.memory_max_mb is None and self.cpu_weight is None and self.pids_max is None
+
+    @classmethod
+    def from_json(cls, text: Optional[str]) -> "ResourceLimits":
+        """Parse the stored JSON, ignoring malformed or non-positive values."""
+        try:
+            data = json.loads(text) if text else {}
+        except (TypeError, ValueError):
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+
+        values = {}
+        for name in ("memory_max_mb", "cpu_weight", "pids_max"):
+            try:
+                value = int(data.get(name))
+            except (TypeError, ValueError):
+                continue
+            if value > 0:
+                values[name] = value
+        if "cpu_weight" in values:
+            values["cpu_weight"] = min(values["cpu_weight"], 10000)
+        return cls(**values)
+
+    def to_json(self) -> Optional[str]:
+        """Serialize for storage, or None when no limit is set."""
+        if self.is_empty():
+            return None
+        return json.dumps({key: value for key, value in asdict(self).items() if value is not None})
+
+
+def _own_cgroup(cgroup_root: str) -> Optional[Path]:
+    """Return the cgroup v2 directory of this process."""
+    try:
+        with open(PROC_SELF_CGROUP, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("0::"):
+                    path = Path(cgroup_root) / line[3:].strip().lstrip("/")
+                    return path if (path / "cgroup.controllers").exists() else None
+    except OSError:
+        pass
+    return None
+
+
+def _write(path: Path, value: str) -> None:
+    with open(path, "w", encoding="ascii") as f:
+        f.write(value)
+
+
+def cpu_weight_to_nice(weight: int) -> int:
+    """Map a cgroup ``cpu.weight`` to the nice value with a similar share.
+
+    The scheduler weight drops by ~1.25x per nice step and weight 100
+    corresponds to nice 0; raising priority (negative nice) needs
+    privileges, so the result is clamped to 0..19.
+    """
+    nice = round(math.log(DEFAULT_CPU_WEIGHT / weight, 1.25))
+    return max(0, min(19, nice))
+
+
+class ProcessLimiter:
+    """Applies ``ResourceLimits`` to browser process trees."""
+
+    def __init__(self, cgroup_root: str = CGROUP_ROOT):
+        self.cgroup_root = cgroup_root
+        self.cgroups: Dict[str, Path] = {}
+        self._base: Optional[Path] = None
+        self._base_checked = False
+        self._lock = threading.Lock()
+
+    def prepare(self) -> bool:
+        """Set up the cgroup hierarchy; call at startup before spawning children.
+
+        Returns:
+            True if per-profile cgroups are available.
+        """
+        return self._prepare_base() is not None
+
+    def _prepare_base(self) -> Optional[Path]:
+        """Enable controllers for children of our cgroup, once.
+
+        cgroup v2 does not allow enabling controllers for the children of a
+        cgroup that still has processes ("no internal processes"), so every
+        process in it is moved into a leaf first: this one and any child
+        already spawned, such as the Playwright driver. Returns None if the
+        hierarchy is not delegated.
+        """
+        with self._lock:
+            if self._base_checked:
+                return self._base
+            self._base_checked = True
+
+            own = _own_cgroup(self.cgroup_root)
+            if own is None:
+                return None
+            try:
+                available = (own / "cgroup.controllers").read_text().split()
+                wanted = [name for name in CONTROLLERS if name in available]
+                if not wanted:
+                    return None
+                enabled = (own / "cgroup.subtree_control").read_text().split()
+                if not all(name in enabled for name in wanted):
+                    leaf = own / APP_LEAF
+                    leaf.mkdir(exist_ok=True)
+                    for pid in (own / "cgroup.procs").read_text().split():
+                        try:
+                            _write(leaf / "cgroup.procs", pid)
+                        except ProcessLookupError:
+                            pass
+                    _write(own / "cgroup.subtree_control", " ".join(f"+{name}" for name in wanted))
+            except OSError:
+                return None
+            self._base = own
+            return own
+
+    def apply(self, profile_id: str, browser_pid: int, limits: ResourceLimits) -> Optional[str]:
+        """Limit the process tree rooted at ``browser_pid``.
+
+        Returns:
+            ``"cgroup"``, ``"nice"`` or None if nothing was applied.
+        """
+        if limits.is_empty():
+            return None
+        tree = process_tree(browser_pid)
+
+        base = self._prepare_base()
+        if base is not None:
+            cgroup = base / f"profile-{profile_id}"
+            try:
+                cgroup.mkdir(exist_ok=True)
+                if limits.memory_max_mb is not None:
+                    _write(cgroup / "memory.max", str(limits.memory_max_mb * 1024 * 1024))
+                if limits.cpu_weight is not None:
+                    _write(cgroup / "cpu.weight", str(limits.cpu_weight))
+                if limits.pids_max is not None:
+                    _write(cgroup / "pids.max", str(limits.pids_max))
+                # The parent goes first so children forked meanwhile inherit the cgroup
+                for pid in tree:
+                    try:
+                        _write(cgroup / "cgroup.procs", str(pid))
+                    except ProcessLookupError:
+                        pass
+                self.cgroups[profile_id] = cgroup
+                return "cgroup"
+            except OSError as exc:
+                print(f"cgroup limits unavailable for profile {profile_id}: {exc}")
+                self._remove_cgroup(cgroup, attempts=1)
+
+        if limits.cpu_weight is None:
+            return None
+        self._renice(tree, cpu_weight_to_nice(limits.cpu_weight))
+        return "nice"
+
+    @staticmethod
+    def _renice(pids: List[int], nice: int) -> None:
+        if nice <= 0:
+            return
+        ionice = shutil.which("ionice")
+        io_level = str(min(7, 4 + nice // 5))
+        for pid in pids:
+            try:
+                os.setpriority(os.PRIO_PROCESS, pid, nice)
+            except (OSError, AttributeError):
+                continue
+            if ionice:
+                subprocess.run(
+                    [ionice, "-c", "2", "-n", io_level, "-p", str(pid)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=False,
+                )
+
+    @staticmethod
+    def _remove_cgroup(cgroup: Path, attempts: int = 10) -> None:
+        # rmdir fails until every process of the tree has exited
+        for _ in range(attempts):
+            try:
+                cgroup.rmdir()
+                return
+            except FileNotFoundError:
+                return
+            except OSError:
+                time.sleep(0.2)
+
+    def release(self, profile_id: str) -> None:
+        """Remove the profile's cgroup after its browser has exited."""
+        cgroup = self.cgroups.pop(profile_id, None)
+        if cgroup is not None:
+            self._remove_cgroup(cgroup)
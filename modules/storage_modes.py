@@ -0,0 +1,22 @@
+"""Profile storage modes.
+
+``persistent`` profiles run in their own Chromium with a user-data
+directory on disk. ``ephemeral`` profiles are lightweight contexts inside
+one Chromium shared by all ephemeral profiles and keep their state only
+in memory; ``ephemeral_state`` additionally saves cookies and local
+storage as a Playwright ``storage_state`` file on stop and loads it on
+the next launch.
+"""
+from __future__ import annotations
+
+PERSISTENT = "persistent"
+EPHEMERAL = "ephemeral"
+EPHEMERAL_STATE = "ephemeral_state"
+
+STORAGE_MODES = (PERSISTENT, EPHEMERAL, EPHEMERAL_STATE)
+STORAGE_STATE_FILE = "storage_state.json"
+
+
+def is_ephemeral(storage_mode: str | None) -> bool:
+    """Return True for modes that run as a context in the shared browser."""
+    return storage_mode in (EPHEMERAL, EPHEMERAL_STATE)
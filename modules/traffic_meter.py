@@ -0,0 +1,154 @@
+"""Per-profile and per-proxy network traffic accounting.
+
+``TrafficMeter`` listens to the CDP ``Network`` domain of every page of a
+profile's context and accumulates bytes in memory. A background thread
+flushes the counters to the ``traffic_stats`` table in one transaction,
+so the database sees one write per interval instead of one per request.
+
+Received bytes come from ``Network.loadingFinished.encodedDataLength``
+(wire size including headers). Sent bytes are estimated from the request
+line, headers and post data. Cross-site iframes and service workers run in
+separate targets and are not counted.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+FLUSH_INTERVAL = 30.0
+
+_SENT, _RECEIVED, _REQUESTS = range(3)
+
+
+def _request_size(request: Dict) -> int:
+    headers = request.get("headers") or {}
+    size = len(request.get("method", "")) + len(request.get("url", "")) + 12
+    size += sum(len(name) + len(str(value)) + 4 for name, value in headers.items())
+    size += len(request.get("postData") or "")
+    return size
+
+
+class TrafficMeter:
+    """In-memory traffic counters with batched persistence.
+
+    Args:
+        db: Database with ``add_traffic_stats``.
+        flush_interval: Seconds between flushes of pending counters.
+    """
+
+    def __init__(self, db, flush_interval: float = FLUSH_INTERVAL):
+        self.db = db
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        # (profile_id, proxy_id, day) -> [sent, received, requests]
+        self._pending: Dict[Tuple[str, int, str], List[int]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, profile_id: str, proxy_id: Optional[int], sent: int = 0,
+               received: int = 0, requests: int = 0) -> None:
+        """Add traffic for a profile; ``proxy_id`` None means a direct connection."""
+        key = (profile_id, proxy_id or 0, date.today().isoformat())
+        with self._lock:
+            counters = self._pending.get(key)
+            if counters is None:
+                counters = self._pending[key] = [0, 0, 0]
+            counters[_SENT] += sent
+            counters[_RECEIVED] += received
+            counters[_REQUESTS] += requests
+
+    def flush(self) -> int:
+        """Write pending counters to the database.
+
+        Returns:
+            Number of written rows. On failure the counters are kept and
+            retried on the next flush.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        rows = [(*key, *counters) for key, counters in pending.items()]
+        try:
+            self.db.add_traffic_stats(rows)
+        except Exception as exc:
+            print(f"Traffic stats flush failed: {exc}")
+            with self._lock:
+                for key, counters in pending.items():
+                    current = self._pending.setdefault(key, [0, 0, 0])
+                    for index, value in enumerate(counters):
+                        current[index] += value
+            return 0
+        return len(rows)
+
+    def totals(self, stored: Dict, by: str = "profile") -> Dict:
+        """Merge stored totals with counters not flushed yet.
+
+        Args:
+            stored: ``{key: (sent, received)}`` from the database.
+            by: ``"profile"`` or ``"proxy"``.
+        """
+        index = 0 if by == "profile" else 1
+        merged = dict(stored)
+        with self._lock:
+            for key, counters in self._pending.items():
+                sent, received = merged.get(key[index], (0, 0))
+                merged[key[index]] = (sent + counters[_SENT], received + counters[_RECEIVED])
+        return merged
+
+    def start(self) -> None:
+        """Start the periodic flush thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="traffic-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flush thread and write what is left."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    async def attach(self, context, profile_id: str, proxy_id: Optional[int]) -> None:
+        """Count traffic of all current and future pages of a context."""
+
+        def record(sent=0, received=0, requests=0):
+            self.record(profile_id, proxy_id, sent, received, requests)
+
+        async def watch(page) -> None:
+            try:
+                session = await context.new_cdp_session(page)
+                session.on(
+                    "Network.requestWillBeSent",
+                    lambda event: record(sent=_request_size(event.get("request") or {})),
+                )
+                session.on(
+                    "Network.loadingFinished",
+                    lambda event: record(received=int(event.get("encodedDataLength") or 0), requests=1),
+                )
+                session.on("Network.loadingFailed", lambda event: record(requests=1))
+                session.on(
+                    "Network.webSocketFrameSent",
+                    lambda event: record(sent=len((event.get("response") or {}).get("payloadData", ""))),
+                )
+                session.on(
+                    "Network.webSocketFrameReceived",
+                    lambda event: record(received=len((event.get("response") or {}).get("payloadData", ""))),
+                )
+                await session.send("Network.enable")
+            except Exception:
+                # The page was closed before the session attached
+                pass
+
+        for page in context.pages:
+            await watch(page)
+        context.on("page", lambda page: asyncio.ensure_future(watch(page)))
@@ -0,0 +1,110 @@
+import os
+import sys
+import threading
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+
+def run_async(coro, timeout=5.0):
+    """Run a coroutine on its own loop in a worker thread.
+
+    A deadlock that blocks the loop thread fails the test instead of hanging
+    the whole run.
+    """
+    import asyncio
+
+    outcome = {}
+
+    def target():
+        try:
+            outcome["result"] = asyncio.run(coro)
+        except BaseException as exc:
+            outcome["error"] = exc
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        pytest.fail(f"event loop still blocked after {timeout} s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("result")
+
+
+class FakePage:
+    def __init__(self, url="about:blank"):
+        self.url = url
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    def emit(self, event, *args):
+        for handler in self.handlers.get(event, []):
+            handler(*args)
+
+
+class FakeCDPSession:
+    def __init__(self, page):
+        self.page = page
+        self.handlers = {}
+        self.sent = []
+        self.detached = False
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    def emit(self, event, params):
+        for handler in self.handlers.get(event, []):
+            handler(params)
+
+    async def send(self, method, params=None):
+        self.sent.append((method, params or {}))
+        if method == "Page.getFrameTree":
+            return {"frameTree": {"frame": {"id": "main"}}}
+        if method == "Page.createIsolatedWorld":
+            return {"executionContextId": 7}
+        return {}
+
+    async def detach(self):
+        self.detached = True
+
+
+class FakeContext:
+    def __init__(self, pages=None):
+        self.pages = pages if pages is not None else [FakePage()]
+        self.handlers = {}
+        self.cdp_sessions = []
+        self.closed = False
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    async def new_cdp_session(self, page):
+        session = FakeCDPSession(page)
+        self.cdp_sessions.append(session)
+        return session
+
+    async def close(self):
+        self.closed = True
+
+
+class NullLimiter:
+    """ProcessLimiter stand-in that never touches cgroups or priorities."""
+
+    def __init__(self):
+        self.cgroups = {}
+        self.prepared = False
+
+    def prepare(self):
+        self.prepared = True
+        return False
+
+    def apply(self, profile_id, browser_pid, limits):
+        return None
+
+    def release(self, profile_id):
+        self.cgroups.pop(profile_id, None)
@@ -0,0 +1,41 @@
+import asyncio
+import time
+
+from database.async_db import AsyncDatabase
+from database.db_handler import Database
+from tests.conftest import run_async
+
+TICK = 0.01
+READ_TIME = 0.3
+
+
+def test_loop_keeps_ticking_during_reads(tmp_path):
+    db = Database(str(tmp_path / "profiles.db"))
+    db.create_profile(name="ID_1", profile_id="a")
+    adb = AsyncDatabase(db)
+    query = adb._bound._query_all_profiles
+
+    def slow_query():
+        # Stands in for a cold read of a large profiles table
+        time.sleep(READ_TIME)
+        return query()
+
+    adb._bound._query_all_profiles = slow_query
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        lags = []
+        read = asyncio.ensure_future(adb.get_all_profiles())
+        while not read.done():
+            expected = loop.time() + TICK
+            await asyncio.sleep(TICK)
+            lags.append(loop.time() - expected)
+        return await read, lags
+
+    try:
+        profiles, lags = run_async(scenario())
+    finally:
+        adb.close()
+    assert [p.profile_id for p in profiles] == ["a"]
+    assert len(lags) >= READ_TIME / TICK / 3
+    assert max(lags) < READ_TIME / 2
@@ -0,0 +1,31 @@
+import asyncio
+
+import backend as backend_module
+from backend import PROFILES, Backend
+from tests.conftest import run_async
+
+
+def test_watchers_belong_to_backend_not_session(tmp_path, monkeypatch):
+    monkeypatch.setattr(backend_module, "WATCHDOG_INTERVAL", 0.01)
+    backend = Backend(str(tmp_path / "profiles.db"), str(tmp_path / "profiles"))
+    backend._stop.set()
+    topics = []
+    backend.events.subscribe(topics.append)
+
+    async def recover_hung_profiles():
+        return ["a"]
+
+    backend.browser_manager.recover_hung_profiles = recover_hung_profiles
+
+    async def scenario():
+        session = asyncio.ensure_future(backend.start_watchers())
+        await session
+        # The session that started them is gone, the watchers keep running
+        await asyncio.sleep(0.05)
+        running = [task for task in backend._tasks if not task.done()]
+        for task in running:
+            task.cancel()
+        return len(running)
+
+    assert run_async(scenario()) == 3
+    assert PROFILES in topics
@@ -0,0 +1,150 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from browser_logic import BrowserManager
+from tests.conftest import FakeContext, NullLimiter, run_async
+
+
+def slow_launches(manager, delay=0.05):
+    """Replace the Playwright launch with one that yields to the loop."""
+    calls = []
+
+    async def launch_leased(profile_id, proxy_data, headless, profile_settings):
+        calls.append(profile_id)
+        await asyncio.sleep(delay)
+        context = FakeContext()
+        manager.running_browsers[profile_id] = context
+        return context
+
+    manager._launch_leased = launch_leased
+    return calls
+
+
+def test_concurrent_launches_of_different_profiles(tmp_path):
+    manager = BrowserManager(str(tmp_path), process_limiter=NullLimiter())
+    calls = slow_launches(manager)
+
+    async def scenario():
+        return await asyncio.gather(manager.launch_profile("a"), manager.launch_profile("b"))
+
+    first, second = run_async(scenario())
+    assert first is manager.running_browsers["a"]
+    assert second is manager.running_browsers["b"]
+    assert sorted(calls) == ["a", "b"]
+
+
+def test_concurrent_launches_of_one_profile_share_the_launch(tmp_path):
+    manager = BrowserManager(str(tmp_path), process_limiter=NullLimiter())
+    calls = slow_launches(manager)
+
+    async def scenario():
+        return await asyncio.gather(manager.launch_profile("a"), manager.launch_profile("a"))
+
+    first, second = run_async(scenario())
+    assert first is second
+    assert calls == ["a"]
+    assert manager._launching == {}
+
+
+def test_failed_launch_is_reported_to_every_caller(tmp_path):
+    manager = BrowserManager(str(tmp_path), process_limiter=NullLimiter())
+
+    async def launch_leased(*args):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("no browser")
+
+    manager._launch_leased = launch_leased
+
+    async def scenario():
+        return await asyncio.gather(
+            manager.launch_profile("a"), manager.launch_profile("a"), return_exceptions=True
+        )
+
+    results = run_async(scenario())
+    assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+    assert manager._launching == {}
+
+
+def test_is_profile_running_during_launch(tmp_path):
+    manager = BrowserManager(str(tmp_path), process_limiter=NullLimiter())
+    slow_launches(manager, delay=0.1)
+
+    async def scenario():
+        launch = asyncio.ensure_future(manager.launch_profile("a"))
+        await asyncio.sleep(0.01)
+        during = manager.is_profile_running("a")
+        await launch
+        return during, manager.is_profile_running("a")
+
+    assert run_async(scenario()) == (False, True)
+
+
+def test_manager_does_not_prepare_cgroups(tmp_path):
+    limiter = NullLimiter()
+    BrowserManager(str(tmp_path), process_limiter=limiter)
+    assert not limiter.prepared
+
+
+def test_input_is_not_tracked_while_auto_stop_is_off(tmp_path):
+    manager = BrowserManager(str(tmp_path), process_limiter=NullLimiter())
+    context = FakeContext()
+    manager.running_browsers["a"] = context
+    run_async(manager._track_activity("a", context))
+    assert context.cdp_sessions == []
+
+
+def test_input_on_a_single_page_keeps_profile_running(tmp_path):
+    from browser_logic import INPUT_BINDING, INPUT_WORLD
+
+    manager = BrowserManager(str(tmp_path), process_limiter=NullLimiter())
+    context = FakeContext()
+    manager.running_browsers["a"] = context
+    run_async(manager._track_activity("a", context))
+    run_async(manager.set_idle_timeout(600))
+
+    session, = context.cdp_sessions
+    # Listeners and binding live only in the isolated world, never in the page's own
+    sent = dict(session.sent)
+    assert sent["Runtime.addBinding"] == {"name": INPUT_BINDING, "executionContextName": INPUT_WORLD}
+    assert sent["Page.addScriptToEvaluateOnNewDocument"]["worldName"] == INPUT_WORLD
+    assert sent["Runtime.evaluate"]["contextId"] == 7
+
+    # No navigation or new tab for an hour, only typing and scrolling on the page
+    manager.last_activity["a"] -= 3600
+    session.emit("Runtime.bindingCalled", {"name": INPUT_BINDING, "payload": ""})
+
+    stopped = run_async(manager.stop_idle_profiles(600))
+    assert stopped == {}
+    assert manager.running_browsers["a"] is context
+    assert manager.get_idle_seconds("a") < 600
+
+    run_async(manager.set_idle_timeout(0))
+    assert session.detached
+
+
+def test_failed_setup_closes_the_new_context(tmp_path):
+    manager = BrowserManager(str(tmp_path), process_limiter=NullLimiter())
+    context = FakeContext()
+
+    async def route(pattern, handler):
+        raise RuntimeError("route failed")
+
+    async def launch_persistent_context(**options):
+        return context
+
+    context.route = route
+    manager.playwright = SimpleNamespace(
+        chromium=SimpleNamespace(launch_persistent_context=launch_persistent_context)
+    )
+    released = []
+    manager.leases = SimpleNamespace(acquire=lambda profile_id: None, release=released.append)
+
+    settings = {"resource_filter": SimpleNamespace(handle=None)}
+    with pytest.raises(RuntimeError, match="route failed"):
+        run_async(manager.launch_profile("a", profile_settings=settings))
+
+    assert context.closed
+    assert "a" not in manager.running_browsers
+    assert "a" in released
@@ -0,0 +1,24 @@
+from types import SimpleNamespace
+
+import cli
+from browser_logic import BrowserManager
+
+
+def test_commands_without_launch_do_not_reap_or_lease(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    reaped = []
+    monkeypatch.setattr(BrowserManager, "reap_orphans", lambda self: reaped.append(self) or [])
+    app = cli.HeadlessApp(str(tmp_path / "profiles.db"))
+
+    args = SimpleNamespace(count=3, prefix="ID", os="Linux", proxy_id=None, tags="")
+    assert cli.cmd_create_profiles(app, args) == 0
+    assert reaped == []
+    assert app.browser_manager.leases is None
+    assert len(app.db.get_all_profiles()) == 3
+
+
+def test_proxy_config_needs_no_manager():
+    proxy = {"type": "socks5", "host": "10.0.0.1", "port": 1080, "username": "u", "password": "p"}
+    assert BrowserManager.get_proxy_config(proxy) == {
+        "server": "socks5://10.0.0.1:1080", "username": "u", "password": "p",
+    }
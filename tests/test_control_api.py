@@ -0,0 +1,128 @@
+import asyncio
+import json
+
+import pytest
+
+from modules.control_api import ControlAPIServer, is_local_origin, is_loopback_host
+from tests.conftest import run_async
+
+TOKEN = "secret-token"
+
+
+class FakeAsyncDatabase:
+    async def get_all_profiles(self):
+        return [{"profile_id": "a", "name": "A"}]
+
+    async def get_profile_by_id(self, profile_id):
+        return {"profile_id": profile_id, "name": profile_id.upper()} if profile_id == "a" else None
+
+
+class FakeBrowserManager:
+    def __init__(self):
+        self.stopped = []
+
+    def is_profile_running(self, profile_id):
+        return False
+
+    async def stop_profile(self, profile_id):
+        self.stopped.append(profile_id)
+
+
+def request(server, raw):
+    async def scenario():
+        reader = asyncio.StreamReader()
+        reader.feed_data(raw)
+        reader.feed_eof()
+        return await server._handle_request(reader)
+
+    return run_async(scenario())
+
+
+def http(method, path, headers, body=b""):
+    lines = [f"{method} {path} HTTP/1.1"] + [f"{name}: {value}" for name, value in headers.items()]
+    if body:
+        lines.append(f"Content-Length: {len(body)}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+@pytest.fixture
+def server():
+    async def launch(profile_id):
+        return None
+
+    return ControlAPIServer(FakeAsyncDatabase(), FakeBrowserManager(), launch, token=TOKEN)
+
+
+def good_headers(**extra):
+    headers = {"Host": "127.0.0.1:8765", "Authorization": f"Bearer {TOKEN}"}
+    headers.update(extra)
+    return headers
+
+
+def test_token_is_generated_when_not_configured():
+    first = ControlAPIServer(None, None, None)
+    second = ControlAPIServer(None, None, None)
+    assert first.token and second.token and first.token != second.token
+
+
+def test_authorized_get(server):
+    status, payload = request(server, http("GET", "/profiles", good_headers()))
+    assert status == 200
+    assert payload[0]["profile_id"] == "a"
+
+
+def test_missing_token_is_rejected(server):
+    status, _ = request(server, http("GET", "/profiles", {"Host": "127.0.0.1:8765"}))
+    assert status == 401
+
+
+@pytest.mark.parametrize("host", ["evil.example", "evil.example:8765", "127.0.0.1.evil.example", ""])
+def test_foreign_host_is_rejected(server, host):
+    status, _ = request(server, http("GET", "/profiles", good_headers(Host=host)))
+    assert status == 403
+
+
+@pytest.mark.parametrize("origin", ["https://evil.example", "null", "http://127.0.0.1.evil.example"])
+def test_foreign_origin_is_rejected(server, origin):
+    status, _ = request(server, http("GET", "/profiles", good_headers(Origin=origin)))
+    assert status == 403
+
+
+def test_text_plain_post_is_rejected(server):
+    body = json.dumps({"action": "stop", "profile_ids": ["a"]}).encode()
+    status, _ = request(
+        server, http("POST", "/profiles/batch", good_headers(**{"Content-Type": "text/plain"}), body)
+    )
+    assert status == 415
+    assert server.browser_manager.stopped == []
+
+
+def test_json_post_is_accepted(server):
+    body = json.dumps({"action": "stop", "profile_ids": ["a"]}).encode()
+    headers = good_headers(**{"Content-Type": "application/json; charset=utf-8"})
+    status, payload = request(server, http("POST", "/profiles/batch", headers, body))
+    assert status == 200
+    assert server.browser_manager.stopped == ["a"]
+
+
+def test_host_and_origin_helpers():
+    assert is_loopback_host("localhost:8765")
+    assert is_loopback_host("[::1]:8765")
+    assert not is_loopback_host(None)
+    assert is_local_origin(None)
+    assert is_local_origin("http://localhost:3000")
+    assert not is_local_origin("file://")
+
+
+@pytest.mark.parametrize("length, expected", [("abc", 400), ("-5", 400), ("1e3", 400), (str(10 ** 9), 413)])
+def test_bad_content_length_is_rejected(server, length, expected):
+    headers = good_headers(**{"Content-Type": "application/json", "Content-Length": length})
+    status, _ = request(server, http("POST", "/profiles/batch", headers))
+    assert status == expected
+    assert server.browser_manager.stopped == []
+
+
+def test_truncated_body_is_rejected(server):
+    headers = good_headers(**{"Content-Type": "application/json", "Content-Length": "100"})
+    status, _ = request(server, http("POST", "/profiles/batch", headers) + b'{"action"')
+    assert status == 400
@@ -0,0 +1,22 @@
+import dataclasses
+
+import pytest
+
+from database.db_handler import Database
+
+
+def test_cached_rows_cannot_be_mutated(tmp_path):
+    db = Database(str(tmp_path / "profiles.db"))
+    proxy_id = db.create_proxy(name="p", type="http", host="127.0.0.1", port=8080)
+    db.create_profile(name="ID_1", profile_id="a", proxy_id=proxy_id)
+
+    profile = db.get_all_profiles()[0]
+    proxy = db.get_proxy_by_id(proxy_id)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        profile.name = "changed"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        proxy.port = 1
+
+    assert db.get_all_profiles()[0] is profile
+    assert dataclasses.replace(profile, name="copy").name == "copy"
+    assert db.get_all_profiles()[0].name == "ID_1"
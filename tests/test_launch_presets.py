@@ -0,0 +1,12 @@
+import pytest
+
+from modules.launch_presets import LAUNCH_PRESETS
+
+# Switches that move WebGL to software rendering and change its fingerprint
+GPU_SWITCHES = ("--disable-gpu", "--use-gl", "--use-angle", "--disable-software-rasterizer", "--disable-webgl")
+
+
+@pytest.mark.parametrize("name", sorted(LAUNCH_PRESETS))
+def test_presets_keep_the_webgl_fingerprint(name):
+    args = LAUNCH_PRESETS[name].args
+    assert not [arg for arg in args if arg.startswith(GPU_SWITCHES)]
@@ -0,0 +1,111 @@
+import asyncio
+
+from browser_logic import BrowserManager
+from modules.launch_scheduler import LaunchScheduler
+from tests.conftest import FakeContext, NullLimiter, run_async
+
+
+def make_scheduler(tmp_path, delay=0.1):
+    manager = BrowserManager(str(tmp_path), process_limiter=NullLimiter())
+    launched = []
+
+    async def launch_leased(profile_id, proxy_data, headless, profile_settings):
+        launched.append(profile_id)
+        await asyncio.sleep(delay)
+        context = FakeContext()
+        manager.running_browsers[profile_id] = context
+        return context
+
+    manager._launch_leased = launch_leased
+    scheduler = LaunchScheduler(manager)
+
+    def submit(profile_id):
+        return scheduler.submit(profile_id, lambda: manager.launch_profile(profile_id))
+
+    return manager, scheduler, submit, launched
+
+
+def test_submit_while_launch_in_progress(tmp_path):
+    manager, scheduler, submit, launched = make_scheduler(tmp_path)
+
+    async def scenario():
+        first = asyncio.ensure_future(submit("a"))
+        await asyncio.sleep(0.02)
+        # "a" is being launched by the dispatcher and is no longer queued
+        assert launched == ["a"] and not scheduler.is_queued("a")
+        second = asyncio.ensure_future(submit("b"))
+        again = asyncio.ensure_future(submit("a"))
+        return await asyncio.gather(first, second, again)
+
+    first, second, again = run_async(scenario())
+    assert first is again is manager.running_browsers["a"]
+    assert second is manager.running_browsers["b"]
+    assert launched == ["a", "b"]
+
+
+def test_queue_respects_max_running(tmp_path):
+    manager, scheduler, submit, launched = make_scheduler(tmp_path, delay=0.01)
+    scheduler.max_running = 1
+    scheduler.poll_interval = 0.01
+
+    async def scenario():
+        await submit("a")
+        waiting = asyncio.ensure_future(submit("b"))
+        await asyncio.sleep(0.05)
+        blocked = (scheduler.blocked_by, scheduler.queued_ids())
+        await manager.stop_profile("a")
+        await waiting
+        return blocked
+
+    assert run_async(scenario()) == ("max_running", ["b"])
+    assert launched == ["a", "b"]
+
+
+def test_launches_run_concurrently_without_limits(tmp_path):
+    manager, scheduler, submit, launched = make_scheduler(tmp_path, delay=0.2)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await asyncio.gather(*(submit(pid) for pid in "abcde"))
+        return loop.time() - started
+
+    assert run_async(scenario()) < 0.5
+    assert sorted(launched) == list("abcde")
+
+
+def test_in_flight_slots_count_towards_max_running(tmp_path):
+    manager, scheduler, submit, launched = make_scheduler(tmp_path, delay=0.05)
+    scheduler.max_running = 2
+    scheduler.poll_interval = 0.01
+
+    async def scenario():
+        waiters = [asyncio.ensure_future(submit(pid)) for pid in "abc"]
+        await asyncio.sleep(0.02)
+        state = (sorted(launched), scheduler.queued_ids())
+        await waiters[0]
+        await manager.stop_profile("a")
+        await asyncio.gather(*waiters)
+        return state
+
+    # "c" waits while "a" and "b" are still starting, not only once they run
+    assert run_async(scenario()) == (["a", "b"], ["c"])
+    assert launched[2] == "c"
+
+
+def test_cancel_in_flight_launch(tmp_path):
+    manager, scheduler, submit, launched = make_scheduler(tmp_path, delay=1.0)
+
+    async def scenario():
+        waiter = asyncio.ensure_future(submit("a"))
+        await asyncio.sleep(0.02)
+        assert scheduler.is_launching("a")
+        assert scheduler.cancel("a")
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            return "cancelled"
+
+    assert run_async(scenario()) == "cancelled"
+    assert not scheduler.is_launching("a")
+    assert "a" not in manager.running_browsers
@@ -0,0 +1,120 @@
+import hashlib
+import io
+import json
+import tarfile
+import uuid
+
+import pytest
+
+from browser_logic import BrowserManager
+from database.db_handler import Database
+from modules.profile_bundle import BUNDLE_FORMAT, BUNDLE_VERSION, CHECKSUM_HEADER, export_profiles, import_profiles
+from tests.conftest import NullLimiter
+
+
+def add_bytes(archive, name, data, pax_headers=None):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    if pax_headers:
+        info.pax_headers = pax_headers
+    archive.addfile(info, io.BytesIO(data))
+
+
+def profile_archive(files):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for name, data in files.items():
+            add_bytes(archive, name, data)
+    return buffer.getvalue()
+
+
+def crafted_bundle(*profile_ids, records=None):
+    data = profile_archive({"Default/Preferences": b"{}"})
+    records = records or [{"name": "x", "profile_id": profile_id} for profile_id in profile_ids]
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w", format=tarfile.PAX_FORMAT) as archive:
+        add_bytes(archive, "bundle.json", json.dumps({"format": BUNDLE_FORMAT, "version": BUNDLE_VERSION}).encode())
+        add_bytes(archive, "profiles.jsonl", "".join(json.dumps(record) + "\n" for record in records).encode())
+        for record in records:
+            add_bytes(
+                archive, f"data/{record['profile_id']}.tar.gz", data,
+                pax_headers={CHECKSUM_HEADER: hashlib.sha256(data).hexdigest()},
+            )
+    buffer.seek(0)
+    return buffer
+
+
+@pytest.fixture
+def env(tmp_path):
+    db = Database(str(tmp_path / "test.db"))
+    manager = BrowserManager(str(tmp_path / "profiles"), process_limiter=NullLimiter())
+    return tmp_path, db, manager
+
+
+@pytest.mark.parametrize("profile_id", ["../../escaped", "../escaped", "/tmp/escaped", "a/b", ".."])
+def test_import_rejects_path_traversal(env, profile_id):
+    tmp_path, db, manager = env
+
+    with pytest.raises(ValueError):
+        import_profiles(db, manager, crafted_bundle(profile_id))
+
+    assert not (tmp_path / "escaped").exists()
+    assert not (tmp_path.parent / "escaped").exists()
+    assert db.get_all_profiles() == []
+    # Nothing but an empty profiles directory is left behind
+    assert list(manager.profiles_dir.iterdir()) == []
+
+
+def test_import_accepts_generated_ids(env):
+    tmp_path, db, manager = env
+    profile_id = str(uuid.uuid4())
+
+    assert import_profiles(db, manager, crafted_bundle(profile_id)) == 1
+
+    assert (manager.profiles_dir / profile_id / "Default" / "Preferences").read_bytes() == b"{}"
+    assert [p.profile_id for p in db.get_all_profiles()] == [profile_id]
+
+
+def test_round_trip_gets_new_id_when_profile_exists(env):
+    tmp_path, db, manager = env
+    profile_id = manager.generate_profile_id()
+    db.create_profile("original", profile_id)
+    (manager.create_profile_folder(profile_id) / "Cookies").write_bytes(b"cookies")
+
+    bundle = io.BytesIO()
+    assert export_profiles(db, manager, [profile_id], bundle) == 1
+    bundle.seek(0)
+    assert import_profiles(db, manager, bundle) == 1
+
+    ids = {p.profile_id for p in db.get_all_profiles()}
+    assert len(ids) == 2 and profile_id in ids
+    (new_id,) = ids - {profile_id}
+    assert (manager.profiles_dir / new_id / "Cookies").read_bytes() == b"cookies"
+
+
+def test_import_rejects_record_without_name_before_writing(env):
+    tmp_path, db, manager = env
+    records = [
+        {"name": "ok", "profile_id": str(uuid.uuid4())},
+        {"profile_id": str(uuid.uuid4())},
+    ]
+
+    with pytest.raises(ValueError, match="name"):
+        import_profiles(db, manager, crafted_bundle(records=records))
+
+    assert db.get_all_profiles() == []
+    assert list(manager.profiles_dir.iterdir()) == []
+
+
+def test_failed_insert_removes_moved_directories(env, monkeypatch):
+    tmp_path, db, manager = env
+
+    def fail(rows, chunk_size=1000):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(db, "bulk_create_profiles", fail)
+
+    with pytest.raises(RuntimeError):
+        import_profiles(db, manager, crafted_bundle(str(uuid.uuid4()), str(uuid.uuid4())))
+
+    assert list(manager.profiles_dir.iterdir()) == []
@@ -0,0 +1,45 @@
+import pytest
+
+from browser_logic import BrowserManager
+from database.db_handler import Database
+from modules.profile_import import import_profile_templates, read_profile_templates
+from tests.conftest import NullLimiter
+
+
+@pytest.fixture
+def env(tmp_path):
+    db = Database(str(tmp_path / "test.db"))
+    manager = BrowserManager(str(tmp_path / "profiles"), process_limiter=NullLimiter())
+    return tmp_path, db, manager
+
+
+def test_unknown_proxy_rejects_whole_file_with_row_numbers(env):
+    tmp_path, db, manager = env
+    templates = [{"name": f"ok_{i}"} for i in range(5)]
+    templates[3] = {"name": "bad", "proxy": "no-such-proxy"}
+    templates.append({"name": "new proxy", "proxy": "10.0.0.1:8080"})
+
+    with pytest.raises(ValueError, match="Row 4: Unknown proxy reference: no-such-proxy"):
+        # chunk_size=2 would have committed rows 1-2 before reaching row 4
+        import_profile_templates(db, manager, templates, chunk_size=2)
+
+    assert db.get_all_profiles() == []
+    assert db.get_all_proxies() == []
+    assert list(manager.profiles_dir.iterdir()) == []
+
+
+def test_valid_file_is_imported(env):
+    tmp_path, db, manager = env
+    templates = [{"name": "a"}, {"name": "b", "proxy": "10.0.0.1:8080"}, {"name": "c", "proxy": "10.0.0.1:8080"}]
+
+    assert import_profile_templates(db, manager, templates, chunk_size=2) == 3
+    assert len(db.get_all_proxies()) == 1
+    assert sorted(p.name for p in db.get_all_profiles()) == ["a", "b", "c"]
+
+
+def test_invalid_jsonl_line_is_reported_by_number(tmp_path):
+    path = tmp_path / "profiles.jsonl"
+    path.write_text('{"name": "a"}\n\n{"name": \n', encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Line 3"):
+        list(read_profile_templates(str(path)))
@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+
+from app_funcs.update_proxy_check_progress import update_proxy_check_progress
+
+
+class FakeControl:
+    def __init__(self):
+        self.visible = False
+        self.value = None
+        self.page = None
+
+
+def make_app(statuses, run):
+    return SimpleNamespace(
+        proxy_statuses=statuses,
+        proxy_check_run=set(run),
+        proxy_check_progress=FakeControl(),
+        proxy_check_summary=FakeControl(),
+    )
+
+
+def test_progress_counts_only_the_current_run():
+    # 1-3 finished in an earlier check; 4 and 5 are being checked now
+    statuses = {
+        1: {"status": "working"}, 2: {"status": "failed"}, 3: {"status": "working"},
+        4: {"status": "working"}, 5: {"status": "checking"},
+    }
+    app = make_app(statuses, [4, 5])
+
+    update_proxy_check_progress(app)
+
+    assert app.proxy_check_progress.visible
+    assert app.proxy_check_progress.value == 0.5
+    assert "Очікують: 1" in app.proxy_check_summary.value
+
+
+def test_progress_is_hidden_when_the_run_finishes():
+    app = make_app({1: {"status": "working"}, 2: {"status": "failed"}}, [1, 2])
+
+    update_proxy_check_progress(app)
+
+    assert not app.proxy_check_progress.visible
+    assert not app.proxy_check_summary.visible
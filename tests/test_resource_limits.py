@@ -0,0 +1,80 @@
+import errno
+import os
+
+import pytest
+
+from modules import resource_limits
+from modules.resource_limits import APP_LEAF, ProcessLimiter
+
+SIBLING_PIDS = ["4101", "4102"]
+
+
+class FakeCgroupFS:
+    """Directory tree that enforces the cgroup v2 rules ProcessLimiter relies on.
+
+    Writing a pid to ``cgroup.procs`` moves it out of every other cgroup, and
+    enabling controllers in ``cgroup.subtree_control`` fails with EBUSY while
+    the cgroup itself still has processes.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.own = root / "user.slice" / "app.scope"
+        self.own.mkdir(parents=True)
+        (self.own / "cgroup.controllers").write_text("cpu memory pids\n")
+        (self.own / "cgroup.subtree_control").write_text("")
+        # Playwright driver and a browser spawned before the limiter ran
+        (self.own / "cgroup.procs").write_text("\n".join([str(os.getpid()), *SIBLING_PIDS]) + "\n")
+
+    def procs(self, cgroup):
+        path = cgroup / "cgroup.procs"
+        return path.read_text().split() if path.exists() else []
+
+    def write(self, path, value):
+        if path.name == "cgroup.procs":
+            for other in self.root.rglob("cgroup.procs"):
+                if other != path:
+                    other.write_text("".join(f"{pid}\n" for pid in other.read_text().split() if pid != value))
+            path.write_text("".join(f"{pid}\n" for pid in [*self.procs(path.parent), value]))
+        elif path.name == "cgroup.subtree_control":
+            if self.procs(path.parent):
+                raise OSError(errno.EBUSY, "Device or resource busy")
+            path.write_text(" ".join(name.lstrip("+") for name in value.split()) + "\n")
+        else:
+            path.write_text(value)
+
+
+@pytest.fixture
+def cgroupfs(tmp_path, monkeypatch):
+    fs = FakeCgroupFS(tmp_path / "cgroup")
+    proc_self = tmp_path / "proc-self-cgroup"
+    proc_self.write_text("0::/user.slice/app.scope\n")
+    monkeypatch.setattr(resource_limits, "PROC_SELF_CGROUP", str(proc_self))
+    monkeypatch.setattr(resource_limits, "_write", fs.write)
+    return fs
+
+
+def test_prepare_moves_sibling_processes_into_leaf(cgroupfs):
+    limiter = ProcessLimiter(str(cgroupfs.root))
+
+    assert limiter.prepare()
+    assert cgroupfs.procs(cgroupfs.own) == []
+    assert sorted(cgroupfs.procs(cgroupfs.own / APP_LEAF)) == sorted([str(os.getpid()), *SIBLING_PIDS])
+    assert (cgroupfs.own / "cgroup.subtree_control").read_text().split() == ["memory", "cpu", "pids"]
+
+
+def test_prepare_without_delegated_cgroup(tmp_path, monkeypatch):
+    proc_self = tmp_path / "proc-self-cgroup"
+    proc_self.write_text("0::/missing\n")
+    monkeypatch.setattr(resource_limits, "PROC_SELF_CGROUP", str(proc_self))
+
+    assert not ProcessLimiter(str(tmp_path)).prepare()
+
+
+def test_has_resource_limits_gates_cgroup_setup(tmp_path):
+    from database.db_handler import Database
+
+    db = Database(str(tmp_path / "profiles.db"))
+    assert not db.has_resource_limits()
+    db.create_profile(name="limited", profile_id="a", resource_limits='{"memory_max_mb": 512}')
+    assert db.has_resource_limits()
@@ -0,0 +1,58 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from app_funcs.restore_session import restore_session
+from browser_logic import BrowserManager
+from modules.launch_scheduler import LaunchScheduler
+from tests.conftest import FakeContext, NullLimiter, run_async
+
+
+class FakeAsyncDatabase:
+    def __init__(self, settings, profile_ids):
+        self.settings = settings
+        self.profiles = [SimpleNamespace(profile_id=profile_id) for profile_id in profile_ids]
+
+    async def get_setting(self, key, default=None):
+        return self.settings.get(key, default)
+
+    async def get_all_profiles(self):
+        return self.profiles
+
+
+def test_restore_launches_profiles_concurrently(tmp_path):
+    manager = BrowserManager(str(tmp_path), process_limiter=NullLimiter())
+    active = []
+    peak = []
+
+    async def launch_leased(profile_id, proxy_data, headless, profile_settings):
+        active.append(profile_id)
+        peak.append(len(active))
+        await asyncio.sleep(0.02)
+        active.remove(profile_id)
+        context = FakeContext()
+        manager.running_browsers[profile_id] = context
+        return context
+
+    manager._launch_leased = launch_leased
+    scheduler = LaunchScheduler(manager)
+    session = [{"profile_id": pid, "tabs": []} for pid in ("a", "b", "c")]
+    launched = []
+
+    async def start_profile(profile_id, priority=0, tabs=None):
+        context = await scheduler.submit(profile_id, lambda: manager.launch_profile(profile_id), priority)
+        launched.append(profile_id)
+        return context
+
+    app = SimpleNamespace(
+        adb=FakeAsyncDatabase({"session": json.dumps(session)}, ["a", "b", "c"]),
+        browser_manager=manager,
+        launch_scheduler=scheduler,
+        start_profile=start_profile,
+        backend=SimpleNamespace(notify_profiles=lambda: None),
+    )
+
+    restored = run_async(restore_session(app, notify=False))
+    assert restored == 3
+    assert sorted(launched) == ["a", "b", "c"]
+    assert max(peak) == 3